@@ -4,11 +4,14 @@ USE auth_db;
 
 DROP TABLE IF EXISTS users;
 CREATE TABLE users (
-    -- UUIDs are typically 36 characters (including dashes)
-    id CHAR(36) PRIMARY KEY, 
+    -- Time-ordered UUIDv7 packed into 16 bytes (see UserMapper.id_to_db)
+    id BINARY(16) PRIMARY KEY,
     email VARCHAR(255) NOT NULL UNIQUE,
     password_hash VARCHAR(255) NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Keyset pagination over (created_at, id); InnoDB appends the primary
+    -- key to every secondary index, so this covers the id tie-breaker too
+    INDEX idx_users_created_at (created_at)
 );
 
 -- ----------------------------------------------------------------
@@ -18,7 +21,7 @@ DROP PROCEDURE IF EXISTS create_user;
 DELIMITER //
 
 CREATE PROCEDURE create_user(
-    IN ip_id CHAR(36),
+    IN ip_id BINARY(16),
     IN ip_email VARCHAR(255),
     IN ip_password_hash VARCHAR(255)
 )
@@ -29,19 +32,10 @@ sp_main: BEGIN
         SET MESSAGE_TEXT = 'id, email, or password_hash is null';
     END IF;
 
-    -- ID already exists 
-    IF EXISTS (SELECT 1 FROM users WHERE id = ip_id) THEN
-        SIGNAL SQLSTATE '45000'
-        SET MESSAGE_TEXT = 'id already exists';
-    END IF;
-
-    -- Email already exists check
-    IF EXISTS (SELECT 1 FROM users WHERE email = ip_email) THEN
-        SIGNAL SQLSTATE '45000'
-        SET MESSAGE_TEXT = 'email already registered';
-    END IF;
-
-    -- Insert user with the provided UUID
+    -- Insert user with the provided UUID.
+    -- No EXISTS pre-checks: the PRIMARY KEY and UNIQUE(email) constraints
+    -- reject duplicates atomically (error 1062, mapped by key name in
+    -- SQLExecutor._raise_write_error).
     INSERT INTO users (id, email, password_hash)
     VALUES (ip_id, LOWER(ip_email), ip_password_hash);
 
@@ -72,7 +66,7 @@ DROP PROCEDURE IF EXISTS get_user_by_id;
 DELIMITER //
 
 CREATE PROCEDURE get_user_by_id(
-    IN ip_user_id CHAR(36)
+    IN ip_user_id BINARY(16)
 )
 sp_main: BEGIN
     SELECT email, created_at
@@ -80,4 +74,75 @@ sp_main: BEGIN
     WHERE id = ip_user_id
     LIMIT 1;
 END //
-DELIMITER ;
\ No newline at end of file
+DELIMITER ;
+
+-- ----------------------------------------------------------------
+-- 3b. Update Password Hash (rehash on login)
+--     Compare-and-set: only replaces the hash the caller verified, so a
+--     concurrent password change wins. Returns the number of rows updated.
+-- ----------------------------------------------------------------
+DROP PROCEDURE IF EXISTS update_password_hash;
+DELIMITER //
+
+CREATE PROCEDURE update_password_hash(
+    IN ip_user_id BINARY(16),
+    IN ip_old_hash VARCHAR(255),
+    IN ip_new_hash VARCHAR(255)
+)
+sp_main: BEGIN
+    UPDATE users
+    SET password_hash = ip_new_hash
+    WHERE id = ip_user_id AND password_hash = ip_old_hash;
+
+    SELECT ROW_COUNT();
+END //
+DELIMITER ;
+
+-- ----------------------------------------------------------------
+-- 4. Sharding: email -> user id directory
+--    (each shard holds the entries for the emails that hash to it)
+-- ----------------------------------------------------------------
+DROP TABLE IF EXISTS user_directory;
+CREATE TABLE user_directory (
+    email VARCHAR(255) PRIMARY KEY,
+    user_id BINARY(16) NOT NULL
+);
+
+DROP PROCEDURE IF EXISTS register_email;
+DELIMITER //
+
+CREATE PROCEDURE register_email(
+    IN ip_email VARCHAR(255),
+    IN ip_user_id BINARY(16)
+)
+sp_main: BEGIN
+    INSERT INTO user_directory (email, user_id)
+    VALUES (LOWER(ip_email), ip_user_id);
+END //
+DELIMITER ;
+
+DROP PROCEDURE IF EXISTS lookup_email;
+DELIMITER //
+
+CREATE PROCEDURE lookup_email(
+    IN ip_email VARCHAR(255)
+)
+sp_main: BEGIN
+    SELECT user_id
+    FROM user_directory
+    WHERE email = LOWER(ip_email)
+    LIMIT 1;
+END //
+DELIMITER ;
+
+DROP PROCEDURE IF EXISTS delete_email;
+DELIMITER //
+
+CREATE PROCEDURE delete_email(
+    IN ip_email VARCHAR(255)
+)
+sp_main: BEGIN
+    DELETE FROM user_directory
+    WHERE email = LOWER(ip_email);
+END //
+DELIMITER ;
@@ -0,0 +1,55 @@
+-- ----------------------------------------------------------------
+-- Migrate users.id / user_directory.user_id from CHAR(36) to BINARY(16)
+--
+-- Existing uuid4 ids keep their value; only the storage changes.
+-- UUID_TO_BIN(id) without the swap flag keeps the canonical byte order,
+-- which is what UserMapper.id_to_db produces, so UUIDv7 ids generated
+-- after the migration sort by creation time.
+--
+-- Run once per database (every shard when DB_BACKEND=sharded):
+--   mysql auth_db < db/migrations/001_uuid_to_binary.sql
+-- then re-run the procedure section of db/init.sql so the procedures take
+-- BINARY(16) parameters.
+-- ----------------------------------------------------------------
+USE auth_db;
+
+-- 1. users: add the binary column, backfill, swap the primary key
+ALTER TABLE users ADD COLUMN id_bin BINARY(16) NULL AFTER id;
+
+UPDATE users SET id_bin = UUID_TO_BIN(id) WHERE id_bin IS NULL;
+
+ALTER TABLE users
+    MODIFY id_bin BINARY(16) NOT NULL,
+    DROP PRIMARY KEY,
+    DROP COLUMN id,
+    RENAME COLUMN id_bin TO id,
+    ADD PRIMARY KEY (id);
+
+-- 2. user_directory (sharded deployments only)
+SET @has_directory = (
+    SELECT COUNT(*) FROM information_schema.tables
+    WHERE table_schema = DATABASE() AND table_name = 'user_directory'
+);
+SET @sql = IF(
+    @has_directory > 0,
+    'ALTER TABLE user_directory MODIFY user_id VARBINARY(36) NOT NULL',
+    'DO 0'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @sql = IF(
+    @has_directory > 0,
+    'UPDATE user_directory SET user_id = UUID_TO_BIN(user_id) WHERE LENGTH(user_id) = 36',
+    'DO 0'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @sql = IF(
+    @has_directory > 0,
+    'ALTER TABLE user_directory MODIFY user_id BINARY(16) NOT NULL',
+    'DO 0'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 3. Rebuild so the clustered index is packed in the new key order
+OPTIMIZE TABLE users;
@@ -0,0 +1,11 @@
+-- ----------------------------------------------------------------
+-- Index for the admin listing / export, which page through users by
+-- (created_at, id). InnoDB stores the primary key in every secondary index,
+-- so (created_at) is effectively (created_at, id).
+--
+-- Run once per database (every shard when DB_BACKEND=sharded):
+--   mysql auth_db < db/migrations/002_users_created_at_index.sql
+-- ----------------------------------------------------------------
+USE auth_db;
+
+ALTER TABLE users ADD INDEX idx_users_created_at (created_at), ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,26 @@
+-- ----------------------------------------------------------------
+-- Procedure used to upgrade a password hash to the current hashing policy
+-- after a successful login (see PasswordRehasher). Compare-and-set on the
+-- old hash, so a password changed in the meantime is left alone.
+--
+-- Run once per database (every shard when DB_BACKEND=sharded):
+--   mysql auth_db < db/migrations/003_update_password_hash.sql
+-- ----------------------------------------------------------------
+USE auth_db;
+
+DROP PROCEDURE IF EXISTS update_password_hash;
+DELIMITER //
+
+CREATE PROCEDURE update_password_hash(
+    IN ip_user_id BINARY(16),
+    IN ip_old_hash VARCHAR(255),
+    IN ip_new_hash VARCHAR(255)
+)
+sp_main: BEGIN
+    UPDATE users
+    SET password_hash = ip_new_hash
+    WHERE id = ip_user_id AND password_hash = ip_old_hash;
+
+    SELECT ROW_COUNT();
+END //
+DELIMITER ;
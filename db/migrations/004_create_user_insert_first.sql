@@ -0,0 +1,32 @@
+-- ----------------------------------------------------------------
+-- create_user without the EXISTS pre-checks: the PRIMARY KEY and
+-- UNIQUE(email) constraints reject duplicates atomically (error 1062).
+-- Databases created before this change still run the old procedure,
+-- which SIGNALs 'email already registered' (error 1644) instead;
+-- SQLExecutor maps both until this has run everywhere.
+--
+-- Run once per database (every shard when DB_BACKEND=sharded):
+--   mysql auth_db < db/migrations/004_create_user_insert_first.sql
+-- ----------------------------------------------------------------
+USE auth_db;
+
+DROP PROCEDURE IF EXISTS create_user;
+DELIMITER //
+
+CREATE PROCEDURE create_user(
+    IN ip_id BINARY(16),
+    IN ip_email VARCHAR(255),
+    IN ip_password_hash VARCHAR(255)
+)
+sp_main: BEGIN
+    -- Null checks
+    IF ip_id IS NULL OR ip_email IS NULL OR ip_password_hash IS NULL THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'id, email, or password_hash is null';
+    END IF;
+
+    INSERT INTO users (id, email, password_hash)
+    VALUES (ip_id, LOWER(ip_email), ip_password_hash);
+
+END //
+DELIMITER ;
@@ -0,0 +1,120 @@
+"""
+Redis memory per million revocations: one SETEX key per JTI (RedisCache)
+vs expiry buckets with Bloom filters (BucketedRedisCache).
+
+Writes --revocations uuid4 JTIs with TTLs spread over the refresh lifetime
+through each layout under its own key prefix, and reports the growth of
+INFO used_memory, then deletes what it wrote. Lookup latency for absent and
+present JTIs is reported too, since the bucketed layout trades a wider
+lookup for memory.
+
+Runs against the Redis configured through AppConfig (see .env.test); use a
+Redis with nothing else writing to it, or the memory deltas are noise:
+
+    docker-compose --env-file .env.test up -d cache
+    python -m load_tests.bench_blacklist_memory --revocations 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+
+import redis
+
+from src.cache.outbound.bucketed_cache import DEFAULT_MAX_TTL, BucketedRedisCache
+from src.cache.outbound.redis_cache import RedisCache
+from src.config.app_config import AppConfig
+
+CHUNK = 10_000
+
+
+def used_memory(client):
+    return client.info("memory")["used_memory"]
+
+
+def delete_prefix(client, prefix):
+    for keys in _chunks(client.scan_iter(f"{prefix}*", count=CHUNK), CHUNK):
+        client.unlink(*keys)
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def lookup_latency(cache, jtis, samples=2000):
+    latencies = []
+    for jti in random.sample(jtis, min(samples, len(jtis))):
+        start = time.perf_counter()
+        cache.is_blacklisted(jti)
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000
+
+
+def bench(label, client, cache, prefix, jtis, ttls):
+    delete_prefix(client, prefix)
+    before = used_memory(client)
+
+    start = time.perf_counter()
+    for i in range(0, len(jtis), CHUNK):
+        cache.blacklist_many(dict(zip(jtis[i : i + CHUNK], ttls[i : i + CHUNK])))
+    elapsed = time.perf_counter() - start
+
+    grown = used_memory(client) - before
+    absent = [str(uuid.uuid4()) for _ in range(2000)]
+    print(
+        # bytes per revocation == MB per million revocations
+        f"{label:<28} {grown / len(jtis):7.1f} B/revocation (MB/million)"
+        f"  write {len(jtis) / elapsed:9.0f}/s"
+        f"  lookup p50 absent {lookup_latency(cache, absent):.3f}ms"
+        f" present {lookup_latency(cache, jtis):.3f}ms"
+    )
+    delete_prefix(client, prefix)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--revocations", type=int, default=1_000_000)
+    parser.add_argument("--bucket-seconds", type=int, default=6 * 3600)
+    parser.add_argument("--bloom-bits", type=int, default=1 << 22)
+    parser.add_argument("--bloom-hashes", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    client = redis.Redis(host=AppConfig.REDIS_HOST, port=AppConfig.REDIS_PORT)
+    jtis = [str(uuid.uuid4()) for _ in range(args.revocations)]
+    ttls = [random.randint(60, DEFAULT_MAX_TTL) for _ in jtis]
+
+    bench(
+        "setex key per JTI",
+        client,
+        RedisCache(client, "bench-keys:"),
+        "bench-keys:",
+        jtis,
+        ttls,
+    )
+    bench(
+        f"buckets {args.bucket_seconds}s + bloom",
+        client,
+        BucketedRedisCache(
+            client,
+            "bench-buckets:",
+            bucket_seconds=args.bucket_seconds,
+            bloom_bits=args.bloom_bits,
+            bloom_hashes=args.bloom_hashes,
+        ),
+        "bench-buckets:",
+        jtis,
+        ttls,
+    )
+
+
+if __name__ == "__main__":
+    main()
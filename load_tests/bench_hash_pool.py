@@ -0,0 +1,94 @@
+"""
+Password verifications per second vs the size of the hashing pool
+(PooledHasher), against verifying inline on the request threads.
+
+--callers threads (standing in for request threads) each verify the same
+bcrypt hash in a loop for --seconds; every pool size is run in thread and
+in process mode. Rejections (pool full) are counted, not retried. Needs no
+database or Redis:
+
+    python -m load_tests.bench_hash_pool --callers 32 --sizes 1,2,4,8
+"""
+
+import argparse
+import os
+import statistics
+import threading
+import time
+
+from src.app.domain.exceptions import HashingOverloadedError
+from src.app.services.hashing_service import (
+    PROCESS_POOL,
+    THREAD_POOL,
+    BcryptHasher,
+    PooledHasher,
+)
+
+PASSWORD = "Correct-Horse-9"
+
+
+def run(hasher, password_hash, callers, seconds):
+    """Returns (verifications, rejections, per-call latencies) over `seconds`."""
+    deadline = time.perf_counter() + seconds
+    latencies, rejected = [], [0]
+    lock = threading.Lock()
+
+    def caller():
+        mine, refused = [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                assert hasher.verify_password(PASSWORD, password_hash)
+                mine.append(time.perf_counter() - start)
+            except HashingOverloadedError:
+                refused += 1
+                time.sleep(0.001)
+        with lock:
+            latencies.extend(mine)
+            rejected[0] += refused
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), rejected[0], latencies
+
+
+def report(label, seconds, done, rejected, latencies):
+    latencies = sorted(latencies) or [0]
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(
+        f"{label:<20} {done / seconds:>8.1f} verify/s   rejected {rejected:>6}"
+        f"   p50 {p50:7.1f} ms   p99 {p99:7.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--callers", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--sizes", default="1,2,4,8")
+    parser.add_argument("--max-queue", type=int, default=32)
+    args = parser.parse_args()
+
+    inline = BcryptHasher()
+    password_hash = inline.hash_password(PASSWORD)
+    print(f"{os.cpu_count()} CPUs, {args.callers} callers, {args.seconds}s each")
+
+    report(
+        "inline", args.seconds, *run(inline, password_hash, args.callers, args.seconds)
+    )
+    for mode in (THREAD_POOL, PROCESS_POOL):
+        for size in (int(s) for s in args.sizes.split(",")):
+            pooled = PooledHasher(
+                inline, mode=mode, workers=size, max_queue=args.max_queue
+            )
+            # Start the workers before timing
+            pooled.verify_password(PASSWORD, password_hash)
+            report(
+                f"{mode} x{size}",
+                args.seconds,
+                *run(pooled, password_hash, args.callers, args.seconds),
+            )
@@ -0,0 +1,128 @@
+"""
+Password verification cost of bcrypt and argon2id parameter sets: verify
+latency, throughput per core and peak RSS under concurrent logins.
+
+Every parameter set runs in a fresh process (so its peak RSS is its own):
+--logins threads verify the same hash in a loop for --seconds. Throughput
+per core is verifications per CPU-second the process used, i.e. what one
+core of a pod sustains; the RSS growth over the idle process is roughly
+memory_cost x concurrent argon2 hashes. Needs no database or Redis:
+
+    python -m load_tests.bench_password_hashers --logins 8 \\
+        --bcrypt 10,12 --argon2 19456:2:1,65536:3:4
+"""
+
+import argparse
+import multiprocessing
+import resource
+import statistics
+import threading
+import time
+
+from src.app.services.hashing_service import Argon2Hasher, BcryptHasher
+
+PASSWORD = "Correct-Horse-9"
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def make_hasher(spec: tuple):
+    kind, *params = spec
+    if kind == "bcrypt":
+        return BcryptHasher(rounds=params[0])
+    time_cost, memory_cost, parallelism = params
+    return Argon2Hasher(time_cost, memory_cost, parallelism)
+
+
+def run(spec: tuple, logins: int, seconds: float) -> dict:
+    """One parameter set under load; runs in its own process."""
+    hasher = make_hasher(spec)
+    password_hash = hasher.hash_password(PASSWORD)
+    idle_rss = peak_rss_mib()
+
+    deadline = time.perf_counter() + seconds
+    latencies = []
+    lock = threading.Lock()
+
+    def login():
+        mine = []
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            assert hasher.verify_password(PASSWORD, password_hash)
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    cpu_start, wall_start = cpu_seconds(), time.perf_counter()
+    threads = [threading.Thread(target=login) for _ in range(logins)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall, cpu = time.perf_counter() - wall_start, cpu_seconds() - cpu_start
+
+    latencies.sort()
+    return {
+        "verifications": len(latencies),
+        "per_second": len(latencies) / wall,
+        "per_core_second": len(latencies) / cpu if cpu else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000,
+        "idle_rss_mib": idle_rss,
+        "peak_rss_mib": peak_rss_mib(),
+    }
+
+
+def label(spec: tuple) -> str:
+    kind, *params = spec
+    if kind == "bcrypt":
+        return f"bcrypt rounds={params[0]}"
+    time_cost, memory_cost, parallelism = params
+    return f"argon2id m={memory_cost // 1024}MiB t={time_cost} p={parallelism}"
+
+
+def report(spec: tuple, result: dict):
+    print(
+        f"{label(spec):<30} {result['per_second']:>7.1f} verify/s"
+        f"  {result['per_core_second']:>7.1f} /core-s"
+        f"   p50 {result['p50_ms']:7.1f} ms   p99 {result['p99_ms']:7.1f} ms"
+        f"   peak RSS {result['peak_rss_mib']:6.1f} MiB"
+        f" (+{result['peak_rss_mib'] - result['idle_rss_mib']:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--bcrypt", default="10,12", help="rounds,...")
+    parser.add_argument(
+        "--argon2",
+        default="19456:2:1,65536:3:4",
+        help="memory_kib:time_cost:parallelism,...",
+    )
+    args = parser.parse_args()
+
+    specs = [("bcrypt", int(r)) for r in args.bcrypt.split(",") if r]
+    for entry in filter(None, args.argon2.split(",")):
+        memory_cost, time_cost, parallelism = (int(p) for p in entry.split(":"))
+        specs.append(("argon2id", time_cost, memory_cost, parallelism))
+
+    print(
+        f"{multiprocessing.cpu_count()} CPUs, {args.logins} concurrent logins,"
+        f" {args.seconds}s per parameter set"
+    )
+    # "spawn": every run starts from a clean interpreter, so peak RSS
+    # reflects that parameter set only
+    context = multiprocessing.get_context("spawn")
+    for spec in specs:
+        with context.Pool(1) as pool:
+            report(spec, pool.apply(run, (spec, args.logins, args.seconds)))
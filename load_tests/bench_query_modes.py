@@ -0,0 +1,80 @@
+"""
+Compares the stored-procedure and prepared-statement query modes of
+UserSQLExecuter for the two hot DB operations:
+
+  * registration insert  (create_user)
+  * login lookup         (login_user)
+
+Runs directly against the MySQL configured through AppConfig.DB (see .env.test),
+so start the stack first:  docker-compose --env-file .env.test up -d db
+
+    python -m load_tests.bench_query_modes --rows 2000 --threads 8
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config.app_config import AppConfig
+from src.repository.outbound.sqlExecuter import (
+    UserSQLExecuter,
+    PROCEDURE_MODE,
+    PREPARED_MODE,
+)
+
+FAKE_HASH = "$2b$12$" + "x" * 53
+
+
+def timed(fn, items, threads):
+    """Runs fn over items on a thread pool, returns (wall seconds, per-call latencies)."""
+
+    def one(item):
+        start = time.perf_counter()
+        fn(item)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(one, items))
+    return time.perf_counter() - start, latencies
+
+
+def report(label, wall, latencies):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{label:<28} {len(latencies) / wall:>9.0f} ops/s"
+        f"   p50 {p50:6.2f} ms   p99 {p99:6.2f} ms"
+    )
+
+
+def bench_mode(mode, rows, threads):
+    executor = UserSQLExecuter({**AppConfig.DB, "query_mode": mode})
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"bench-{mode}-{run_id}-{i}@bench.test" for i in range(rows)]
+
+    # Warm up the pool (and the per-connection statement cache)
+    executor.login_user("warmup@bench.test")
+
+    wall, latencies = timed(
+        lambda email: executor.create_user(str(uuid.uuid4()), email, FAKE_HASH),
+        emails,
+        threads,
+    )
+    report(f"{mode} / create_user", wall, latencies)
+
+    wall, latencies = timed(executor.login_user, emails, threads)
+    report(f"{mode} / login_user", wall, latencies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    for mode in (PROCEDURE_MODE, PREPARED_MODE):
+        bench_mode(mode, args.rows, args.threads)
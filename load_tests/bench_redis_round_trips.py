@@ -0,0 +1,147 @@
+"""
+Redis round trips per refresh, and per batch of revocation checks.
+
+Compares the old client (a bare redis.Redis with its unbounded default pool)
+with the one RedisProvider builds now (bounded blocking pool, keepalive,
+health checks, pipelined batch operations). Every command batch written to a
+socket counts as one round trip, including the handshake commands a fresh
+connection sends, so connection churn under concurrency shows up too.
+
+Runs against the Redis configured through AppConfig (see .env.test):
+
+    docker-compose --env-file .env.test up -d cache
+    python -m load_tests.bench_redis_round_trips --refreshes 2000 --threads 16
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import redis
+
+from src.app.jwt.jwt_adapter import JwtAdapter
+from src.app.services.token_service import TokenService
+from src.cache.outbound.redis_cache import RedisCache
+from src.config.app_config import AppConfig
+from src.provider.redis_provider import RedisProvider
+
+
+class CountingConnection(redis.Connection):
+    """redis.Connection that counts sockets opened and command writes."""
+
+    lock = threading.Lock()
+    connects = 0
+    round_trips = 0
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.connects = cls.round_trips = 0
+
+    def connect(self):
+        if self._sock is None:
+            with CountingConnection.lock:
+                CountingConnection.connects += 1
+        return super().connect()
+
+    def send_packed_command(self, command, check_health=True):
+        with CountingConnection.lock:
+            CountingConnection.round_trips += 1
+        return super().send_packed_command(command, check_health)
+
+
+def old_cache(prefix):
+    # What RedisProvider built before: default pool, no limits or timeouts
+    pool = redis.ConnectionPool(
+        host=AppConfig.REDIS_HOST,
+        port=AppConfig.REDIS_PORT,
+        decode_responses=True,
+        connection_class=CountingConnection,
+    )
+    return RedisCache(redis.Redis(connection_pool=pool), prefix)
+
+
+def new_cache(prefix, threads):
+    provider = RedisProvider(
+        AppConfig.REDIS_HOST,
+        AppConfig.REDIS_PORT,
+        connect_timeout=AppConfig.REDIS_CONNECT_TIMEOUT,
+        timeout=AppConfig.REDIS_TIMEOUT,
+        max_connections=threads,
+        key_prefix=prefix,
+    )
+    provider.pool.connection_class = CountingConnection
+    return provider.cache
+
+
+def bench_refreshes(label, cache, refreshes, threads):
+    tokens = TokenService(cache, JwtAdapter("bench-secret", "HS256"))
+    per_worker = refreshes // threads
+    refreshes = per_worker * threads
+    latencies = []
+
+    def rotate_chain(worker):
+        # Each worker keeps rotating its own refresh token
+        _, refresh_token = tokens.create_jwt(f"bench-user-{worker}")
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            _, refresh_token = tokens.refresh_token(refresh_token)
+            latencies.append(time.perf_counter() - start)
+
+    CountingConnection.reset()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(rotate_chain, range(threads)))
+
+    latencies.sort()
+    print(
+        f"{label:<22} refresh  {CountingConnection.round_trips / refreshes:5.2f} "
+        f"round trips each  {CountingConnection.connects:4d} connections opened"
+        f"  p50 {statistics.median(latencies) * 1000:6.2f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.2f}ms"
+    )
+
+
+def bench_batch(label, cache, batch_size, batches, pipelined):
+    jtis = [f"bench-jti-{i}" for i in range(batch_size)]
+    CountingConnection.reset()
+    start = time.perf_counter()
+    for _ in range(batches):
+        if pipelined:
+            cache.blacklist_many({jti: 60 for jti in jtis})
+            cache.are_blacklisted(jtis)
+        else:
+            for jti in jtis:
+                cache.blacklist_token(jti, 60)
+            for jti in jtis:
+                cache.is_blacklisted(jti)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{label:<22} revoke+check {batch_size} tokens  "
+        f"{CountingConnection.round_trips / batches:6.1f} round trips"
+        f"  {elapsed / batches * 1000:7.2f}ms per batch"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--refreshes", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--prefix", default="bench:")
+    args = parser.parse_args(argv)
+
+    before = old_cache(args.prefix)
+    after = new_cache(args.prefix, args.threads)
+
+    bench_refreshes("before (default pool)", before, args.refreshes, args.threads)
+    bench_refreshes("after (RedisProvider)", after, args.refreshes, args.threads)
+    bench_batch("before (one by one)", before, args.batch_size, args.batches, False)
+    bench_batch("after (pipelined)", after, args.batch_size, args.batches, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Refresh-token rotation: two round trips (EXISTS, then SETEX) vs one atomic
+SET NX EX (ICache.consume_once).
+
+Measures the Redis latency of each rotation, then replays one refresh token
+from many threads at once and counts how many replays were accepted. The
+check-then-set flow can accept several; consume_once accepts exactly one.
+
+Runs against the Redis configured through AppConfig (see .env.test):
+
+    docker-compose --env-file .env.test up -d cache
+    python -m load_tests.bench_refresh_rotation --rotations 5000 --racers 32
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import redis
+
+from src.cache.outbound.redis_cache import RedisCache
+from src.config.app_config import AppConfig
+
+TTL = 3600
+
+
+def two_step(cache, jti):
+    # What TokenService.refresh_token did before consume_once
+    if cache.is_blacklisted(jti):
+        return False
+    cache.blacklist_token(jti, TTL)
+    return True
+
+
+def one_step(cache, jti):
+    return cache.consume_once(jti, TTL)
+
+
+def bench_latency(label, rotate, cache, rotations):
+    latencies = []
+    for _ in range(rotations):
+        jti = str(uuid.uuid4())
+        start = time.perf_counter()
+        rotate(cache, jti)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    print(
+        f"{label:<26} p50 {statistics.median(latencies) * 1000:6.3f}ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.3f}ms"
+    )
+
+
+def bench_race(label, rotate, cache, racers, rounds):
+    accepted = []
+    for _ in range(rounds):
+        jti = str(uuid.uuid4())
+        barrier = threading.Barrier(racers)
+
+        def replay(_):
+            barrier.wait()
+            return rotate(cache, jti)
+
+        with ThreadPoolExecutor(max_workers=racers) as pool:
+            accepted.append(sum(pool.map(replay, range(racers))))
+
+    double = sum(1 for count in accepted if count > 1)
+    print(
+        f"{label:<26} {racers} concurrent replays x {rounds}:"
+        f" accepted max {max(accepted)}, more than once in {double} rounds"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rotations", type=int, default=5000)
+    parser.add_argument("--racers", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    client = redis.Redis(
+        host=AppConfig.REDIS_HOST,
+        port=AppConfig.REDIS_PORT,
+        max_connections=args.racers,
+        decode_responses=True,
+    )
+    cache = RedisCache(client, "bench:")
+    client.ping()
+
+    for label, rotate in (
+        ("is_blacklisted+blacklist", two_step),
+        ("consume_once (SET NX EX)", one_step),
+    ):
+        bench_latency(label, rotate, cache, args.rotations)
+        bench_race(label, rotate, cache, args.racers, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Registration throughput under contention.
+
+Every email in the run is registered by --racers threads at the same time,
+so the UNIQUE(email) constraint is hit concurrently on every insert. Exactly
+one attempt per email must succeed; every other one must surface as
+EmailAlreadyExistsError (HTTP 409), never as a 500.
+
+Runs directly against the MySQL configured through AppConfig.DB (see .env.test),
+so start the stack first:  docker-compose --env-file .env.test up -d db
+
+    python -m load_tests.bench_registration_contention --emails 2000 --racers 4
+"""
+
+import argparse
+import random
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from src.app.domain.exceptions import EmailAlreadyExistsError
+from src.config.app_config import AppConfig
+from src.repository.outbound.sqlExecuter import (
+    UserSQLExecuter,
+    PROCEDURE_MODE,
+    PREPARED_MODE,
+)
+
+FAKE_HASH = "$2b$12$" + "x" * 53
+
+
+def bench_mode(mode, emails, racers, threads):
+    executor = UserSQLExecuter({**AppConfig.DB, "query_mode": mode})
+    run_id = uuid.uuid4().hex[:8]
+    attempts = [
+        f"race-{mode}-{run_id}-{i}@bench.test"
+        for i in range(emails)
+        for _ in range(racers)
+    ]
+    random.shuffle(attempts)
+
+    def register(email):
+        try:
+            executor.create_user(str(uuid.uuid4()), email, FAKE_HASH)
+            return email, "created"
+        except EmailAlreadyExistsError:
+            return email, "duplicate"
+        except Exception as e:
+            return email, type(e).__name__
+
+    executor.login_user("warmup@bench.test")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(register, attempts))
+    wall = time.perf_counter() - start
+
+    outcomes = Counter(outcome for _, outcome in results)
+    winners = Counter(email for email, outcome in results if outcome == "created")
+    wrong = emails - sum(1 for count in winners.values() if count == 1)
+
+    print(
+        f"{mode:<10} {len(attempts) / wall:>8.0f} attempts/s"
+        f"   {outcomes['created'] / wall:>7.0f} registrations/s"
+        f"   {dict(outcomes)}   emails without exactly one winner: {wrong}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--emails", type=int, default=2000)
+    parser.add_argument("--racers", type=int, default=4, help="attempts per email")
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    for mode in (PROCEDURE_MODE, PREPARED_MODE):
+        bench_mode(mode, args.emails, args.racers, args.threads)
@@ -0,0 +1,126 @@
+"""
+Compares the old and new primary key layouts of the users table under a
+registration burst:
+
+  * CHAR(36)   + random uuid4   (old schema)
+  * BINARY(16) + time-ordered uuid7 (current schema)
+
+For each layout it creates a scratch copy of the table, inserts --rows users
+from --threads threads, then reports the insert rate and the clustered /
+secondary index sizes from information_schema.
+
+Runs directly against the MySQL configured through AppConfig.DB (see .env.test),
+so start the stack first:  docker-compose --env-file .env.test up -d db
+
+    python -m load_tests.bench_uuid_keys --rows 50000 --threads 8
+"""
+
+import argparse
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import mysql.connector
+
+from src.app.domain.ids import uuid7
+from src.config.app_config import AppConfig
+from src.mapper.user_mapper import UserMapper
+
+FAKE_HASH = "$2b$12$" + "x" * 53
+
+LAYOUTS = {
+    "char36_uuid4": (
+        "CHAR(36)",
+        lambda: str(uuid.uuid4()),
+    ),
+    "binary16_uuid7": (
+        "BINARY(16)",
+        lambda: UserMapper.id_to_db(uuid7()),
+    ),
+}
+
+DDL = """
+CREATE TABLE {table} (
+    id {id_type} PRIMARY KEY,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    password_hash VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def connect():
+    keys = ("host", "port", "user", "password", "database")
+    return mysql.connector.connect(
+        **{k: AppConfig.DB[k] for k in keys}, autocommit=True
+    )
+
+
+def insert_batch(table, make_id, start, count):
+    conn = connect()
+    cursor = conn.cursor(prepared=True)
+    sql = f"INSERT INTO {table} (id, email, password_hash) VALUES (%s, %s, %s)"
+    for i in range(start, start + count):
+        cursor.execute(sql, (make_id(), f"bench-{i}@bench.test", FAKE_HASH))
+    cursor.close()
+    conn.close()
+
+
+def index_sizes(conn, table):
+    cursor = conn.cursor()
+    cursor.execute(f"ANALYZE TABLE {table}")
+    cursor.fetchall()
+    cursor.execute(
+        "SELECT data_length, index_length FROM information_schema.tables "
+        "WHERE table_schema = DATABASE() AND table_name = %s",
+        (table,),
+    )
+    data, index = cursor.fetchone()
+    cursor.close()
+    return data, index
+
+
+def bench_layout(name, rows, threads):
+    id_type, make_id = LAYOUTS[name]
+    table = f"bench_users_{name}"
+
+    conn = connect()
+    cursor = conn.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(DDL.format(table=table, id_type=id_type))
+
+    per_thread = rows // threads
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [
+            pool.submit(insert_batch, table, make_id, t * per_thread, per_thread)
+            for t in range(threads)
+        ]
+        for future in futures:
+            future.result()
+    wall = time.perf_counter() - start
+
+    data, index = index_sizes(conn, table)
+    print(
+        f"{name:<16} {per_thread * threads / wall:>9.0f} inserts/s"
+        f"   clustered {data / 2**20:7.1f} MiB   secondary {index / 2**20:7.1f} MiB"
+    )
+
+    cursor.execute(f"DROP TABLE {table}")
+    cursor.close()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{args.rows} inserts, {args.threads} threads\n")
+    for name in LAYOUTS:
+        bench_layout(name, args.rows, args.threads)
+
+
+if __name__ == "__main__":
+    main()
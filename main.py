@@ -1,5 +1,9 @@
-from flask import Flask, request, make_response, jsonify  # type: ignore
+import signal
+import sys
+
+from flask import Flask, Response, request, make_response, jsonify  # type: ignore
 from src.application import container  # <--- Import the wired container
+from src.controller.outbound.http import StreamingHttpResponse
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 
 from src.telemetry.metrics.metrics_decorator import track_metrics
@@ -24,6 +28,9 @@ from src.telemetry.metrics.logout_metrics import (
     auth_logout_success,
     auth_logout_failure,
     auth_logout_latency,
+    auth_logout_all_success,
+    auth_logout_all_failure,
+    auth_logout_all_latency,
 )
 
 from src.telemetry.metrics.silent_metrics import (
@@ -56,6 +63,8 @@ class FrameworkRequest:
     def __init__(self, flask_req):
         self.json = flask_req.get_json(silent=True) or {}
         self.cookies = flask_req.cookies
+        self.args = flask_req.args
+        self.headers = flask_req.headers
 
 
 def flask_adapter(controller, flask_req):
@@ -69,6 +78,14 @@ def flask_adapter(controller, flask_req):
     internal_res = controller.handle(internal_req)
 
     # 3. Convert OUT
+    if isinstance(internal_res, StreamingHttpResponse):
+        # Chunks are written to the socket as the generator yields them
+        return Response(
+            internal_res.body,
+            status=internal_res.status_code,
+            mimetype=internal_res.content_type,
+        )
+
     flask_res = make_response(jsonify(internal_res.body))
     flask_res.status_code = internal_res.status_code
 
@@ -126,16 +143,42 @@ def logout():
     return flask_adapter(container.controllers.logout, request)
 
 
+@app.route("/api/auth/logout-all", methods=["POST"])
+@track_metrics(
+    auth_logout_all_success, auth_logout_all_failure, auth_logout_all_latency
+)
+def logout_all():
+    return flask_adapter(container.controllers.logout_all, request)
+
+
 @app.route("/api/auth/me", methods=["GET"])
 @track_metrics(auth_me_success, auth_me_failure, auth_me_latency)
 def me():
     return flask_adapter(container.controllers.silent_auth, request)
 
 
+@app.route("/api/admin/users", methods=["GET"])
+def list_users():
+    return flask_adapter(container.controllers.list_users, request)
+
+
+@app.route("/api/admin/users/export", methods=["GET"])
+def export_users():
+    return flask_adapter(container.controllers.export_users, request)
+
+
+@app.route("/api/internal/users/lookup", methods=["POST"])
+def lookup_users():
+    return flask_adapter(container.controllers.lookup_users, request)
+
+
 # ==============================================================================
 # 3. ENTRY POINT
 # ==============================================================================
 
 if __name__ == "__main__":
+    # SIGTERM (docker stop, k8s) exits normally, so atexit hooks run: queued
+    # revocations are written and the memory blacklist is snapshotted
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     print("🚀 Auth Service is running on http://localhost:5000")
     app.run(host="0.0.0.0", debug=True, port=5000)
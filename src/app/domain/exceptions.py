@@ -20,3 +20,11 @@ class TokenError(Exception):
     """Raised when JWT validation fails (expired, blacklisted, invalid)."""
 
     pass
+
+
+class HashingOverloadedError(Exception):
+    """Raised when the password hashing pool is full; retry later (HTTP 503)."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
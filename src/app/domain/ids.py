@@ -0,0 +1,43 @@
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_seq = 0
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562, version 7).
+
+    Layout: 48-bit Unix time in ms | version | 12-bit sequence | variant |
+    62 random bits. The 12-bit field is a per-process counter within one
+    millisecond, so ids generated by one process are strictly increasing and
+    new rows always land at the right edge of the primary key index instead
+    of on random pages.
+    """
+    global _last_ms, _last_seq
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _last_seq = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Same (or earlier, if the clock stepped back) millisecond
+            _last_seq += 1
+            if _last_seq > 0xFFF:
+                _last_ms += 1
+                _last_seq = 0
+        timestamp, seq = _last_ms, _last_seq
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+
+    value = (timestamp & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76
+    value |= seq << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return UUID(int=value)
@@ -1,6 +1,7 @@
 import re
 from src.app.domain.exceptions import UserDomainValidationError
-from uuid import uuid4, UUID
+from uuid import UUID
+from src.app.domain.ids import uuid7
 from dataclasses import dataclass, field
 from datetime import datetime, date
 
@@ -15,7 +16,7 @@ class User:
 
     email: str
     password: str
-    user_id: UUID = field(default_factory=uuid4)
+    user_id: UUID = field(default_factory=uuid7)
     createdAt: datetime = field(default_factory=date.today)
 
     @classmethod
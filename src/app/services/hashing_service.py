@@ -1,14 +1,49 @@
-from .inbound.hashing_service import Hasher
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import argon2
 import bcrypt
 
+from src.app.domain.exceptions import HashingOverloadedError
+from src.telemetry.metrics.hashing_metrics import (
+    hashing_compute,
+    hashing_in_flight,
+    hashing_queue_wait,
+    hashing_rejections,
+)
+from .inbound.hashing_service import Hasher
+
+THREAD_POOL = "thread"
+PROCESS_POOL = "process"
+
+# Hash formats, as told apart by the prefix of a stored hash
+BCRYPT = "bcrypt"  # "$2b$12$..." (also $2a$/$2y$)
+ARGON2ID = "argon2id"  # "$argon2id$v=19$m=65536,t=3,p=4$..."
+
+# bcrypt's own default work factor; every +1 doubles the cost of a hash
+DEFAULT_BCRYPT_ROUNDS = 12
 
-import bcrypt
+
+def hash_format(password_hash: str) -> str | None:
+    """BCRYPT, ARGON2ID or None for a hash in any other format."""
+    if password_hash.startswith("$argon2id$"):
+        return ARGON2ID
+    if password_hash[:4] in ("$2a$", "$2b$", "$2y$"):
+        return BCRYPT
+    return None
 
 
 class BcryptHasher(Hasher):
+    def __init__(self, rounds: int = DEFAULT_BCRYPT_ROUNDS):
+        if not 4 <= rounds <= 31:
+            raise ValueError(f"bcrypt rounds must be between 4 and 31, got {rounds}")
+        self.rounds = rounds
+
     def hash_password(self, password: str) -> str:
         # returns bytes, but usually we store as string in DB
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.rounds)
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
         return hashed.decode("utf-8")
 
@@ -26,3 +61,187 @@ class BcryptHasher(Hasher):
         except Exception as e:
             print(f"Hashing verification error: {e}")
             return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        # "$2b$12$<salt+hash>": older variants (2a, 2y) are upgraded too
+        parts = password_hash.split("$")
+        if len(parts) != 4 or parts[1] != "2b" or not parts[2].isdigit():
+            return True
+        return int(parts[2]) != self.rounds
+
+
+class Argon2Hasher(Hasher):
+    """
+    Argon2id (RFC 9106). Unlike bcrypt, each hash needs `memory_cost` KiB
+    of RAM while it runs, so concurrent logins cost
+    memory_cost x concurrency: size it against the pod memory limit
+    (load_tests/bench_password_hashers.py). Defaults are argon2-cffi's
+    (64 MiB, 3 passes, 4 lanes).
+    """
+
+    def __init__(
+        self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4
+    ):
+        self.hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=argon2.Type.ID,
+        )
+
+    def hash_password(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        try:
+            return self.hasher.verify(password_hash, password)
+        except argon2.exceptions.VerifyMismatchError:
+            return False
+        except (
+            argon2.exceptions.VerificationError,
+            argon2.exceptions.InvalidHashError,
+        ) as e:
+            print(f"Hashing verification error: {e}")
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        try:
+            return self.hasher.check_needs_rehash(password_hash)
+        except argon2.exceptions.InvalidHashError:
+            return True
+
+
+class MixedFormatHasher(Hasher):
+    """
+    Hashes new passwords with the `current` format and verifies stored
+    hashes of any format in `hashers`, picked from the hash itself, so
+    bcrypt and argon2id users can log in side by side during a migration.
+
+    Hashes in another format than `current` report needs_rehash, so with
+    rehash on login (PasswordRehasher) users move to the current format as
+    they log in.
+    """
+
+    def __init__(self, current: str, hashers: dict[str, Hasher]):
+        if current not in hashers:
+            raise ValueError(f"Unknown password hash format: {current}")
+        self.current = current
+        self.hashers = hashers
+
+    def hash_password(self, password: str) -> str:
+        return self.hashers[self.current].hash_password(password)
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        hasher = self.hashers.get(hash_format(password_hash))
+        if hasher is None:
+            print("Hashing verification error: unknown hash format")
+            return False
+        return hasher.verify_password(password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        kind = hash_format(password_hash)
+        if kind != self.current:
+            return True
+        return self.hashers[kind].needs_rehash(password_hash)
+
+
+def _timed(fn, *args):
+    """Runs in the worker: (result, wall time it started, seconds it took)."""
+    started = time.time()
+    result = fn(*args)
+    return result, started, time.time() - started
+
+
+class PooledHasher(Hasher):
+    """
+    Runs another Hasher on a dedicated, separately sized pool, so a login
+    burst cannot occupy every request thread with bcrypt while cheap
+    requests (/me, refresh) wait behind it.
+
+    - mode "thread": bcrypt releases the GIL, so threads hash in parallel
+      on every core; "process" sidesteps the GIL for hashers that do not.
+    - At most `workers` jobs run and `max_queue` more wait. A job that
+      finds no room within `queue_timeout` seconds raises
+      HashingOverloadedError right away (HTTP 503 + Retry-After) instead of
+      piling up.
+
+    The calling request thread still waits for its own result; what the
+    pool bounds is how many threads can be stuck on hashing at once.
+    """
+
+    def __init__(
+        self,
+        hasher: Hasher,
+        mode: str = THREAD_POOL,
+        workers: int | None = None,
+        max_queue: int = 32,
+        queue_timeout: float = 0.0,
+        retry_after: int = 1,
+    ):
+        if mode not in (THREAD_POOL, PROCESS_POOL):
+            raise ValueError(f"Unknown hashing pool mode: {mode}")
+
+        self.hasher = hasher
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._executor: Executor | None = None
+        self._pid = None
+
+    def hash_password(self, password: str) -> str:
+        return self._run("hash", self.hasher.hash_password, password)
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        return self._run("verify", self.hasher.verify_password, password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        # Only parses the hash: not worth a trip through the pool
+        return self.hasher.needs_rehash(password_hash)
+
+    def is_saturated(self) -> bool:
+        """Every worker is busy: new jobs would queue behind the running ones."""
+        with self._lock:
+            return self._active >= self.workers
+
+    def _run(self, op: str, fn, *args):
+        timeout = self.queue_timeout if self.queue_timeout > 0 else None
+        if not self._slots.acquire(blocking=timeout is not None, timeout=timeout):
+            hashing_rejections.labels(op=op).inc()
+            raise HashingOverloadedError(
+                "Too many password checks in progress, retry shortly",
+                retry_after=self.retry_after,
+            )
+
+        hashing_in_flight.inc()
+        with self._lock:
+            self._active += 1
+        try:
+            submitted = time.time()
+            result, started, elapsed = self._pool().submit(_timed, fn, *args).result()
+            hashing_queue_wait.labels(op=op).observe(max(started - submitted, 0))
+            hashing_compute.labels(op=op).observe(elapsed)
+            return result
+        finally:
+            with self._lock:
+                self._active -= 1
+            hashing_in_flight.dec()
+            self._slots.release()
+
+    def _pool(self) -> Executor:
+        """The worker pool (a new one in a forked worker)."""
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                if self.mode == PROCESS_POOL:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="hashing"
+                    )
+            return self._executor
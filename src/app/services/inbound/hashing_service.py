@@ -7,3 +7,11 @@ class Hasher:
 
     def verify_password(self, password_hash: str) -> bool:
         raise NotImplementedError()
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """True when the hash was made with other parameters than the current ones."""
+        return False
+
+    def is_saturated(self) -> bool:
+        """True when hashing now would wait behind other work (see PooledHasher)."""
+        return False
@@ -4,7 +4,9 @@ from abc import ABC, abstractmethod
 
 class ITokenService(ABC):
     @abstractmethod
-    def create_jwt(self, user_id: int) -> Tuple[str, str]:
+    def create_jwt(
+        self, user_id: int, generation: int | None = None
+    ) -> Tuple[str, str]:
         raise NotImplementedError()
 
     @abstractmethod
@@ -14,3 +16,11 @@ class ITokenService(ABC):
     @abstractmethod
     def logout(self, token: str) -> None:
         raise NotImplementedError()
+
+    @abstractmethod
+    def logout_everywhere(self, token: str) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def revoke_sessions(self, user_id: int | str) -> int:
+        raise NotImplementedError()
@@ -11,3 +11,12 @@ class IUserService(ABC):
 
     def fetchUser(self, id: str) -> UserDTO:
         raise NotImplementedError()
+
+    def fetch_users(self, ids: list[str]) -> tuple[list[UserDTO], list[str]]:
+        raise NotImplementedError()
+
+    def list_users(self, limit: int, cursor: str | None) -> tuple[list[UserDTO], str]:
+        raise NotImplementedError()
+
+    def export_users(self):
+        raise NotImplementedError()
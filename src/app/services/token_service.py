@@ -17,10 +17,14 @@ class TokenService(ITokenService):
         self.ACCESS_EXP_MINUTES = 15
         self.REFRESH_EXP_DAYS = 7
 
-    def create_jwt(self, user_id: int) -> Tuple[str, str]:
+    def create_jwt(
+        self, user_id: int, generation: int | None = None
+    ) -> Tuple[str, str]:
         print("makign the jwt for the user")
-        access_token = self._generate_token(user_id, "access")
-        refresh_token = self._generate_token(user_id, "refresh")
+        if generation is None:
+            generation = self.redis_cache.get_generation(str(user_id))
+        access_token = self._generate_token(user_id, "access", generation)
+        refresh_token = self._generate_token(user_id, "refresh", generation)
         print("fniished encoding the otkens")
         return access_token, refresh_token
 
@@ -39,17 +43,22 @@ class TokenService(ITokenService):
             exp = payload.get("exp")
             user_id = payload.get("sub")
 
-            if self.redis_cache.is_blacklisted(jti):
-                raise TokenError("Token is blacklisted")
-
-            # Orchestrate blacklisting logic
+            # Check and blacklist in one atomic operation, so two concurrent
+            # refreshes with the same token cannot both pass; the user's
+            # token generation comes back in the same round trip
             now = datetime.now(timezone.utc).timestamp()
-            ttl = int(exp - now)
-            if ttl > 0:
-                self.redis_cache.blacklist_token(jti, ttl)
+            ttl = max(int(exp - now), 1)
+            consumed, generation = self.redis_cache.consume_once_with_generation(
+                jti, ttl, user_id
+            )
+            if not consumed:
+                raise TokenError("Token is blacklisted")
+            # Issued before the last "log out everywhere"
+            if payload.get("gen", 0) < generation:
+                raise TokenError("Token has been revoked")
 
             # Issue new pair (Rotation)
-            return self.create_jwt(user_id)
+            return self.create_jwt(user_id, generation)
 
         except Exception as e:
             # We catch general provider errors and wrap them in Domain Exceptions
@@ -69,13 +78,34 @@ class TokenService(ITokenService):
         except Exception:
             pass
 
+    def logout_everywhere(self, token: str) -> None:
+        """Revokes every session of the refresh token's user."""
+        try:
+            payload = self.token_provider.decode(token)
+        except Exception as e:
+            raise TokenError(f"Token validation failed: {str(e)}")
+        if payload.get("type") != "refresh":
+            raise TokenError("Invalid token type")
+        self.revoke_sessions(payload["sub"])
+
+    def revoke_sessions(self, user_id: int | str) -> int:
+        """
+        Every refresh token issued to the user so far is rejected from now
+        on: one counter increment, however many sessions there are. Access
+        tokens are not checked against the counter and run out within
+        ACCESS_EXP_MINUTES.
+        """
+        return self.redis_cache.bump_generation(str(user_id))
+
     def validate_and_get_user_id(self, token: str) -> int:
         payload = self.token_provider.decode(token)
         if payload.get("type") != "access":
             raise TokenError("Invalid token type")
         return payload["sub"]
 
-    def _generate_token(self, user_id: int | str, token_type: str) -> str:
+    def _generate_token(
+        self, user_id: int | str, token_type: str, generation: int = 0
+    ) -> str:
         """
         Orchestrates the payload creation, but delegates the
         actual signing/encoding to the provider.
@@ -97,6 +127,8 @@ class TokenService(ITokenService):
                 now + delta
             ).timestamp(),  # Numeric timestamp for cross-provider compatibility
             "iat": now.timestamp(),
+            # Tokens below the user's current generation are revoked
+            "gen": generation,
         }
 
         # The provider handles the technical encoding
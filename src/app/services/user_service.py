@@ -1,9 +1,31 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
 from src.app.domain.user import User
-from src.app.domain.exceptions import AuthenticationError
+from src.app.domain.exceptions import AuthenticationError, UserDomainValidationError
 from src.controller.outbound.user_dto import UserDTO
 from ...repository.inbound.userRepo import UserRepoBase
 from .inbound.user_service import IUserService
 
+MAX_PAGE_SIZE = 1000
+MAX_LOOKUP_IDS = 100
+
+
+def encode_cursor(created_at: datetime, user_id: str) -> str:
+    """Opaque keyset cursor for the (created_at, id) of the last listed user."""
+    raw = json.dumps([created_at.isoformat(), user_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, user_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), user_id
+    except (ValueError, TypeError):
+        raise UserDomainValidationError("Invalid cursor")
+
 
 # ----------------------------------------------------------------
 # User Service Implementation
@@ -63,3 +85,68 @@ class UserService(IUserService):
             raise AuthenticationError("Invalid user id")
 
         return UserDTO.create(email, user_id)
+
+    def fetch_users(self, ids: list[str]) -> tuple[list[UserDTO], list[str]]:
+        """
+        Batch version of fetchUser for downstream services: resolves up to
+        MAX_LOOKUP_IDS ids with one repository call.
+        Returns (users in input order, ids that do not exist); a repeated id
+        is only returned once.
+        """
+        if len(ids) > MAX_LOOKUP_IDS:
+            raise UserDomainValidationError(f"At most {MAX_LOOKUP_IDS} ids per lookup")
+
+        # Canonical form, so "ABC..." and "abc..." are the same user
+        canonical = {}
+        for user_id in ids:
+            try:
+                canonical.setdefault(user_id, str(UUID(user_id)))
+            except (ValueError, TypeError, AttributeError):
+                canonical.setdefault(user_id, None)
+
+        found = self.user_repo.get_users_by_ids(
+            list(dict.fromkeys(c for c in canonical.values() if c))
+        )
+
+        users, missing, seen = [], [], set()
+        for user_id, key in canonical.items():
+            if key in found:
+                if key not in seen:
+                    email, created_at = found[key]
+                    users.append(UserDTO.create(email, key, created_at))
+                    seen.add(key)
+            else:
+                missing.append(user_id)
+        return users, missing
+
+    def list_users(
+        self, limit: int = 100, cursor: str | None = None
+    ) -> tuple[list[UserDTO], str | None]:
+        """
+        One page of users in signup order, paginated by keyset: the cursor
+        encodes the last (created_at, id) seen, so every page is an index
+        range scan no matter how deep it is. Returns (users, next_cursor);
+        next_cursor is None on the last page.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise UserDomainValidationError(
+                f"limit must be between 1 and {MAX_PAGE_SIZE}"
+            )
+        after = decode_cursor(cursor) if cursor else None
+
+        rows = self.user_repo.list_users(after, limit)
+        users = [
+            UserDTO.create(email, user_id, created_at)
+            for user_id, email, created_at in rows
+        ]
+
+        next_cursor = None
+        if len(rows) == limit:
+            last = users[-1]
+            next_cursor = encode_cursor(last.created_at, last.user_id)
+        return users, next_cursor
+
+    def export_users(self):
+        """Every user as a UserDTO, streamed straight from the database."""
+        for user_id, email, created_at in self.user_repo.iter_users():
+            yield UserDTO.create(email, user_id, created_at)
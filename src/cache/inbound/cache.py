@@ -10,6 +10,23 @@ class ICache(Protocol):
     def blacklist_token(self, jti: str, expiry_seconds: int) -> None: ...
     def is_blacklisted(self, jti: str) -> bool: ...
 
+    # Check-and-blacklist in one atomic step: True only for the first caller
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool: ...
+
+    # Per-user token generation: tokens issued before the last bump are
+    # revoked ("log out everywhere" is one increment)
+    def get_generation(self, user_id: str) -> int: ...
+    def bump_generation(self, user_id: str) -> int: ...
+
+    # consume_once plus the user's current generation, in one round trip
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]: ...
+
+    # Batch variants: one round trip for any number of tokens
+    def blacklist_many(self, entries: dict[str, int]) -> None: ...
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]: ...
+
 
 class ICacheProvider(Protocol):
     """
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Callable, Protocol
+
+# (email, created_at); created_at is None when only login/register saw it
+Profile = tuple[str, datetime | None]
+
+
+class IProfileCache(Protocol):
+    """Read-through cache of the public profile of a user, by user id."""
+
+    def get(
+        self, user_id: str, load: Callable[[], Profile | None]
+    ) -> Profile | None: ...
+
+    def get_many(
+        self,
+        ids: list[str],
+        load_many: Callable[[list[str]], dict[str, Profile]],
+    ) -> dict[str, Profile]: ...
+
+    def put(
+        self,
+        user_id: str,
+        email: str,
+        created_at: datetime | None = None,
+        replace: bool = True,
+    ) -> None: ...
+
+    def invalidate(self, user_id: str) -> None: ...
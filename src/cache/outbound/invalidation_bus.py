@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+import time
+import weakref
+from functools import partial
+from typing import Callable
+
+import redis
+
+from src.telemetry.metrics.cache_metrics import blacklist_l1_invalidations
+
+
+def _restart_after_fork(ref: weakref.ref):
+    bus = ref()
+    if bus is not None:
+        bus._after_fork()
+
+
+class RedisInvalidationBus:
+    """
+    Broadcasts revocations between processes over Redis pub/sub, so each
+    process's LocalTTLCache can drop a stale "not revoked" entry as soon as
+    another pod blacklists the token.
+
+    Messages are JSON {jti: expiry_seconds}, or {user_id: generation} on the
+    channel carrying token generation bumps. Pub/sub is fire-and-forget:
+    whenever the listener (re)connects, subscribers get `on_reset` and must
+    forget everything they might have missed.
+    """
+
+    def __init__(self, client: redis.Redis, channel: str, reconnect_delay=1.0):
+        self.client = client
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+
+        self._subscribers: list[tuple[Callable, Callable]] = []
+        self._lock = threading.Lock()
+        self._listener = None
+        self._pid = None
+        # Threads do not survive a fork: a worker forked after subscribe()
+        # (e.g. gunicorn --preload) starts its own listener
+        os.register_at_fork(
+            after_in_child=partial(_restart_after_fork, weakref.ref(self))
+        )
+
+    def publish(self, entries: dict[str, int]) -> None:
+        try:
+            self.client.publish(self.channel, json.dumps(entries))
+        except redis.exceptions.RedisError as e:
+            # The revocation itself is stored; peers see it once their
+            # negative entries expire
+            print(f"Invalidation publish failed: {e}")
+
+    def subscribe(self, on_revoked: Callable, on_reset: Callable) -> None:
+        with self._lock:
+            self._subscribers.append((on_revoked, on_reset))
+            self._ensure_listener()
+
+    def _after_fork(self):
+        # The parent's lock may have been held by one of its threads
+        self._lock = threading.Lock()
+        with self._lock:
+            if self._subscribers:
+                self._ensure_listener()
+
+    def _ensure_listener(self):
+        """Starts the listener thread (again, in a forked worker). Holds _lock."""
+        if self._listener is not None and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._listener = threading.Thread(
+            target=self._run, name="blacklist-invalidations", daemon=True
+        )
+        self._listener.start()
+
+    def _run(self):
+        while True:
+            try:
+                self._listen()
+            except redis.exceptions.RedisError as e:
+                print(f"Invalidation listener lost Redis: {e}")
+            time.sleep(self.reconnect_delay)
+
+    def _listen(self):
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self.channel)
+            # Anything published while we were away is lost
+            for _, on_reset in self._subscribers:
+                on_reset()
+
+            while True:
+                message = pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                try:
+                    entries = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                blacklist_l1_invalidations.inc(len(entries))
+                for on_revoked, _ in self._subscribers:
+                    on_revoked(entries)
+        finally:
+            pubsub.close()
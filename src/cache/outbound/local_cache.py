@@ -0,0 +1,252 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from src.telemetry.metrics.cache_metrics import (
+    blacklist_l1_entries,
+    blacklist_l1_evictions,
+    blacklist_l1_lookups,
+)
+from ..inbound.cache import ICache
+
+# Longest a refresh token lives (TokenService.REFRESH_EXP_DAYS)
+DEFAULT_POSITIVE_TTL = 7 * 24 * 3600
+
+
+class LocalTTLCache(ICache):
+    """
+    In-process L1 in front of another ICache (RedisCache).
+
+    - Revoked JTIs are kept until the token itself expires: a revocation is
+      never undone, so a positive entry cannot go stale. When only a lookup
+      saw it (no TTL known), it is kept for `positive_ttl`.
+    - Valid ("not revoked") answers are kept for `negative_ttl` seconds only,
+      since another process may revoke the token at any moment.
+    - At most `max_entries` are held; the least recently used go first.
+    - With a `bus` (RedisInvalidationBus), every revocation made here is
+      published, and revocations published by other processes overwrite
+      their negative entries here within milliseconds.
+
+    consume_once is always decided by the wrapped cache (it must be atomic
+    across the fleet); a JTI already known to be revoked skips the round trip.
+
+    Per-user token generations are cached for `generation_ttl` seconds, so a
+    refresh whose user was seen recently needs only the consume_once round
+    trip. Bumps are published on `generation_bus` and replace the cached
+    counter in every process.
+    """
+
+    def __init__(
+        self,
+        cache: ICache,
+        max_entries: int = 100_000,
+        negative_ttl: float = 1.0,
+        positive_ttl: float = DEFAULT_POSITIVE_TTL,
+        bus=None,
+        generation_ttl: float = 5.0,
+        generation_bus=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cache = cache
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.positive_ttl = positive_ttl
+        self.bus = bus
+        self.generation_ttl = generation_ttl
+        self.generation_bus = generation_bus
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        # jti -> (revoked, expires_at), least recently used first
+        self._entries: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        # user_id -> (generation, expires_at), least recently used first
+        self._generations: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        # Bumped on every invalidation received, see _put_lookup
+        self._revision = 0
+
+        if bus is not None:
+            bus.subscribe(self._on_revoked, self._on_reset)
+        if generation_bus is not None:
+            generation_bus.subscribe(self._on_generations, self._on_generations_reset)
+
+    # ----------------------------------------------------------------
+    # ICache
+    # ----------------------------------------------------------------
+    def blacklist_token(self, jti: str, expiry_seconds: int) -> None:
+        self.cache.blacklist_token(jti, expiry_seconds)
+        self._revoked({jti: expiry_seconds})
+
+    def blacklist_many(self, entries: dict[str, int]) -> None:
+        self.cache.blacklist_many(entries)
+        self._revoked(entries)
+
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool:
+        if self._get(jti) is True:
+            return False
+
+        consumed = self.cache.consume_once(jti, expiry_seconds)
+        if consumed:
+            self._revoked({jti: expiry_seconds})
+        else:
+            self._put(jti, True, expiry_seconds)
+        return consumed
+
+    def get_generation(self, user_id: str) -> int:
+        cached = self._get_generation(user_id)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.get_generation(user_id)
+        self._put_generation(user_id, generation)
+        return generation
+
+    def bump_generation(self, user_id: str) -> int:
+        generation = self.cache.bump_generation(user_id)
+        self._put_generation(user_id, generation)
+        if self.generation_bus is not None:
+            self.generation_bus.publish({user_id: generation})
+        return generation
+
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]:
+        generation = self._get_generation(user_id)
+        if generation is not None:
+            return self.consume_once(jti, expiry_seconds), generation
+
+        if self._get(jti) is True:
+            return False, self.get_generation(user_id)
+
+        consumed, generation = self.cache.consume_once_with_generation(
+            jti, expiry_seconds, user_id
+        )
+        if consumed:
+            self._revoked({jti: expiry_seconds})
+        else:
+            self._put(jti, True, expiry_seconds)
+        self._put_generation(user_id, generation)
+        return consumed, generation
+
+    def is_blacklisted(self, jti: str) -> bool:
+        cached = self._get(jti)
+        if cached is not None:
+            return cached
+
+        revision = self._revision
+        revoked = self.cache.is_blacklisted(jti)
+        self._put_lookup(jti, revoked, revision)
+        return revoked
+
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]:
+        flags = [self._get(jti) for jti in jtis]
+        missing = [jti for jti, flag in zip(jtis, flags) if flag is None]
+        if missing:
+            revision = self._revision
+            fetched = iter(self.cache.are_blacklisted(missing))
+            for i, flag in enumerate(flags):
+                if flag is None:
+                    flags[i] = next(fetched)
+                    self._put_lookup(jtis[i], flags[i], revision)
+        return flags
+
+    # ----------------------------------------------------------------
+    # Internals
+    # ----------------------------------------------------------------
+    def _get(self, jti: str) -> bool | None:
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is not None:
+                revoked, expires_at = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(jti)
+                    blacklist_l1_lookups.labels(
+                        result="hit_revoked" if revoked else "hit_valid"
+                    ).inc()
+                    return revoked
+                del self._entries[jti]
+
+        blacklist_l1_lookups.labels(result="miss").inc()
+        return None
+
+    def _put(self, jti: str, revoked: bool, ttl: float | None = None):
+        if ttl is None:
+            ttl = self.positive_ttl if revoked else self.negative_ttl
+        evicted = 0
+        with self._lock:
+            self._entries[jti] = (revoked, self.clock() + ttl)
+            self._entries.move_to_end(jti)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            size = len(self._entries)
+
+        if evicted:
+            blacklist_l1_evictions.inc(evicted)
+        blacklist_l1_entries.set(size)
+
+    def _put_lookup(self, jti: str, revoked: bool, revision: int):
+        # A revocation may have arrived while Redis was answering "valid";
+        # caching that answer could hide it for negative_ttl, so skip it
+        if revoked or revision == self._revision:
+            self._put(jti, revoked)
+
+    def _revoked(self, entries: dict[str, int]):
+        for jti, expiry_seconds in entries.items():
+            self._put(jti, True, expiry_seconds)
+        if self.bus is not None:
+            self.bus.publish(entries)
+
+    def _on_revoked(self, entries: dict[str, int]):
+        """Revocations made by other processes (bus listener thread)."""
+        with self._lock:
+            self._revision += 1
+            # Only correct what is cached; unknown JTIs will ask Redis anyway
+            known = [jti for jti in entries if jti in self._entries]
+        for jti in known:
+            self._put(jti, True, entries[jti])
+
+    def _get_generation(self, user_id: str) -> int | None:
+        with self._lock:
+            entry = self._generations.get(user_id)
+            if entry is None:
+                return None
+            generation, expires_at = entry
+            if expires_at <= self.clock():
+                del self._generations[user_id]
+                return None
+            self._generations.move_to_end(user_id)
+            return generation
+
+    def _put_generation(self, user_id: str, generation: int):
+        with self._lock:
+            # Counters only grow: never replace a newer value with an older read
+            cached = self._generations.get(user_id)
+            if cached is not None:
+                generation = max(generation, cached[0])
+            self._generations[user_id] = (
+                generation,
+                self.clock() + self.generation_ttl,
+            )
+            self._generations.move_to_end(user_id)
+            while len(self._generations) > self.max_entries:
+                self._generations.popitem(last=False)
+
+    def _on_generations(self, generations: dict[str, int]):
+        """Bumps made by other processes (bus listener thread)."""
+        for user_id, generation in generations.items():
+            self._put_generation(user_id, int(generation))
+
+    def _on_generations_reset(self):
+        """Bumps may have been missed (bus reconnected): forget all counters."""
+        with self._lock:
+            self._generations.clear()
+
+    def _on_reset(self):
+        """Invalidations may have been missed (bus reconnected): drop negatives."""
+        with self._lock:
+            self._revision += 1
+            for jti in [j for j, (revoked, _) in self._entries.items() if not revoked]:
+                del self._entries[jti]
+            size = len(self._entries)
+        blacklist_l1_entries.set(size)
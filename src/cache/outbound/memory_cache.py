@@ -0,0 +1,183 @@
+import json
+import math
+import os
+import threading
+import time
+from typing import Callable
+
+from src.telemetry.metrics.cache_metrics import (
+    memory_cache_entries,
+    memory_cache_evictions,
+    memory_cache_expirations,
+)
+from src.utils.timing_wheel import TimingWheel
+from ..inbound.cache import ICache
+
+SNAPSHOT_VERSION = 1
+
+
+class MemoryCache(ICache):
+    """
+    ICache kept in this process, for single-process deployments, tests and
+    benchmarks that should not need Redis. Revocations are NOT shared between
+    processes: with several workers, use Redis.
+
+    - Lookups are a dict probe, O(1).
+    - Expiry is driven by a hierarchical TimingWheel with one-second ticks,
+      advanced on every call: dead JTIs are dropped without scanning the
+      whole blacklist and without a background thread.
+    - At most `max_entries` revoked JTIs are held. Past that, the JTI that
+      expires soonest is evicted, which keeps the window in which an evicted
+      token could be reused as short as possible.
+    - snapshot()/restore() save the live entries to a JSON file and load
+      them back (expiry times are wall clock), for warm restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1_000_000,
+        clock: Callable[[], float] = time.time,
+        wheel_slots: int = 64,
+        wheel_levels: int = 4,
+    ):
+        self.max_entries = max_entries
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        # jti -> expires_at (wall clock)
+        self._expires: dict[str, float] = {}
+        self._generations: dict[str, int] = {}
+        # 64 slots x 4 levels of one-second ticks span 194 days
+        self._wheel = TimingWheel(wheel_slots, wheel_levels, start=int(clock()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._expires)
+
+    # ----------------------------------------------------------------
+    # ICache
+    # ----------------------------------------------------------------
+    def blacklist_token(self, jti: str, expiry_seconds: int) -> None:
+        self.blacklist_many({jti: expiry_seconds})
+
+    def blacklist_many(self, entries: dict[str, int]) -> None:
+        with self._lock:
+            now = self._expire()
+            for jti, expiry_seconds in entries.items():
+                self._insert(jti, now + expiry_seconds)
+            self._evict()
+
+    def is_blacklisted(self, jti: str) -> bool:
+        with self._lock:
+            return self._revoked(jti, self._expire())
+
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]:
+        with self._lock:
+            now = self._expire()
+            return [self._revoked(jti, now) for jti in jtis]
+
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool:
+        with self._lock:
+            now = self._expire()
+            if self._revoked(jti, now):
+                return False
+            self._insert(jti, now + expiry_seconds)
+            self._evict()
+            return True
+
+    def get_generation(self, user_id: str) -> int:
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def bump_generation(self, user_id: str) -> int:
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            return self._generations[user_id]
+
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]:
+        return self.consume_once(jti, expiry_seconds), self.get_generation(user_id)
+
+    # ----------------------------------------------------------------
+    # Warm restarts
+    # ----------------------------------------------------------------
+    def snapshot(self, path: str) -> int:
+        """Writes every live entry to `path` (atomically). Returns the count."""
+        with self._lock:
+            self._expire()
+            state = {
+                "version": SNAPSHOT_VERSION,
+                "revoked": dict(self._expires),
+                "generations": dict(self._generations),
+            }
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+        return len(state["revoked"])
+
+    def restore(self, path: str) -> int:
+        """
+        Loads a snapshot written by snapshot(); entries that expired in the
+        meantime are skipped. Returns the number of JTIs restored (0 when
+        there is no snapshot yet).
+        """
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return 0
+        if state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unknown blacklist snapshot version in {path}")
+
+        with self._lock:
+            now = self._expire()
+            restored = 0
+            for jti, expires_at in state["revoked"].items():
+                if expires_at > now:
+                    self._insert(jti, max(expires_at, self._expires.get(jti, 0)))
+                    restored += 1
+            for user_id, generation in state["generations"].items():
+                # Never let a restore undo a bump made since
+                self._generations[user_id] = max(
+                    generation, self._generations.get(user_id, 0)
+                )
+            self._evict()
+        return restored
+
+    # ----------------------------------------------------------------
+    # Internals (hold _lock)
+    # ----------------------------------------------------------------
+    def _expire(self) -> float:
+        """Drops entries whose tick has passed; returns the current time."""
+        now = self.clock()
+        expired = self._wheel.advance(int(now))
+        for jti in expired:
+            del self._expires[jti]
+        if expired:
+            memory_cache_expirations.inc(len(expired))
+            memory_cache_entries.set(len(self._expires))
+        return now
+
+    def _revoked(self, jti: str, now: float) -> bool:
+        # The wheel has one-second ticks; the exact expiry decides
+        expires_at = self._expires.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def _insert(self, jti: str, expires_at: float):
+        self._expires[jti] = expires_at
+        self._wheel.schedule(jti, math.ceil(expires_at))
+
+    def _evict(self):
+        evicted = 0
+        while len(self._expires) > self.max_entries:
+            jti = self._wheel.soonest()
+            self._wheel.cancel(jti)
+            del self._expires[jti]
+            evicted += 1
+        if evicted:
+            memory_cache_evictions.inc(evicted)
+        memory_cache_entries.set(len(self._expires))
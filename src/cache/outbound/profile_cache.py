@@ -0,0 +1,283 @@
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable
+
+from src.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.telemetry.metrics.cache_metrics import (
+    profile_cache_invalidations,
+    profile_cache_lookups,
+)
+from ..inbound.profile_cache import IProfileCache, Profile
+from .resilient_cache import UNAVAILABLE
+
+
+class _Flight:
+    """One load in progress; concurrent misses for the same user wait on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.profile = None
+        self.failed = False
+
+
+class ProfileCache(IProfileCache):
+    """
+    Two-tier read-through cache of (email, created_at) by user id.
+
+    - L1: in-process LRU of at most `max_entries`, each kept `l1_ttl`
+      seconds.
+    - L2: Redis (`client`, optional), one JSON string per user under
+      "{key_prefix}profile:{user_id}", kept `l2_ttl` seconds (+10% jitter so
+      profiles cached together do not expire together). Redis errors go
+      through `breaker` and fall back to the loader; they never fail a read.
+    - Stampede protection: concurrent misses for one user in this process
+      share a single L2/DB load.
+    - invalidate() drops the user from L2 and L1 and, with a `bus`
+      (RedisInvalidationBus), from the L1 of every other process.
+
+    login/register put profiles without created_at. get() serves them, but
+    get_many() (which returns created_at) treats them as misses.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        key_prefix: str = "",
+        max_entries: int = 100_000,
+        l1_ttl: float = 60.0,
+        l2_ttl: int = 3600,
+        breaker: CircuitBreaker | None = None,
+        bus=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.max_entries = max_entries
+        self.l1_ttl = l1_ttl
+        self.l2_ttl = l2_ttl
+        self.breaker = breaker or CircuitBreaker(
+            "redis-profile", failure_types=UNAVAILABLE
+        )
+        self.bus = bus
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        # user_id -> (profile, expires_at), least recently used first
+        self._entries: OrderedDict[str, tuple[Profile, float]] = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        # Bumped on every invalidation, so a load that raced one is not cached
+        self._revision = 0
+
+        if bus is not None:
+            bus.subscribe(self._on_invalidated, self._on_reset)
+
+    # ----------------------------------------------------------------
+    # IProfileCache
+    # ----------------------------------------------------------------
+    def get(self, user_id: str, load: Callable[[], Profile | None]) -> Profile | None:
+        profile = self._l1_get(user_id)
+        if profile is not None:
+            profile_cache_lookups.labels(tier="l1").inc()
+            return profile
+
+        with self._lock:
+            flight = self._flights.get(user_id)
+            leader = flight is None
+            if leader:
+                flight = self._flights[user_id] = _Flight()
+                revision = self._revision
+
+        if not leader:
+            flight.done.wait()
+            if not flight.failed:
+                return flight.profile
+            # The leader's load raised: try on our own
+            return self._load(user_id, load, self._revision)
+
+        try:
+            flight.profile = self._load(user_id, load, revision)
+            return flight.profile
+        except Exception:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[user_id]
+            flight.done.set()
+
+    def get_many(
+        self,
+        ids: list[str],
+        load_many: Callable[[list[str]], dict[str, Profile]],
+    ) -> dict[str, Profile]:
+        found = {}
+        for user_id in ids:
+            profile = self._l1_get(user_id)
+            if profile is not None and profile[1] is not None:
+                found[user_id] = profile
+        profile_cache_lookups.labels(tier="l1").inc(len(found))
+
+        revision = self._revision
+        missing = [user_id for user_id in ids if user_id not in found]
+        from_l2 = {
+            user_id: profile
+            for user_id, profile in self._l2_get_many(missing).items()
+            if profile[1] is not None
+        }
+        for user_id, profile in from_l2.items():
+            found[user_id] = profile
+            self._l1_put(user_id, profile, revision)
+        profile_cache_lookups.labels(tier="l2").inc(len(from_l2))
+
+        missing = [user_id for user_id in missing if user_id not in found]
+        if missing:
+            loaded = load_many(missing)
+            profile_cache_lookups.labels(tier="db").inc(len(missing))
+            for user_id, profile in loaded.items():
+                found[user_id] = profile
+                self._store(user_id, profile, revision)
+        return found
+
+    def put(
+        self,
+        user_id: str,
+        email: str,
+        created_at: datetime | None = None,
+        replace: bool = True,
+    ) -> None:
+        """
+        Caches a profile learnt elsewhere (register, login). With
+        replace=False an existing entry is kept.
+        """
+        profile = (email, created_at)
+        revision = self._revision
+        if not replace and self._l1_get(user_id) is not None:
+            return
+        # L2 may hold the profile read from the database even when L1 is
+        # cold: if the NX set did not write, neither does L1
+        if self._l2_set(user_id, profile, replace) or replace:
+            self._l1_put(user_id, profile, revision)
+
+    def invalidate(self, user_id: str) -> None:
+        self._drop(user_id)
+        if self.client is not None:
+            self._l2_call(self.client.delete, self._key(user_id))
+        if self.bus is not None:
+            self.bus.publish({user_id: 0})
+
+    # ----------------------------------------------------------------
+    # Internals
+    # ----------------------------------------------------------------
+    def _load(self, user_id: str, load: Callable, revision: int) -> Profile | None:
+        profile = self._l2_get_many([user_id]).get(user_id)
+        if profile is not None:
+            profile_cache_lookups.labels(tier="l2").inc()
+            self._l1_put(user_id, profile, revision)
+            return profile
+
+        profile_cache_lookups.labels(tier="db").inc()
+        profile = load()
+        if profile is not None:
+            self._store(user_id, profile, revision)
+        return profile
+
+    def _store(self, user_id: str, profile: Profile, revision: int):
+        if revision != self._revision:
+            return
+        self._l2_set(user_id, profile, replace=True)
+        self._l1_put(user_id, profile, revision)
+
+    def _l1_get(self, user_id: str) -> Profile | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            profile, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return profile
+
+    def _l1_put(self, user_id: str, profile: Profile, revision: int):
+        with self._lock:
+            # An invalidation arrived while we were loading: the value may
+            # be the one it was meant to remove
+            if revision != self._revision:
+                return
+            self._entries[user_id] = (profile, self.clock() + self.l1_ttl)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _l2_get_many(self, ids: list[str]) -> dict[str, Profile]:
+        if not ids or self.client is None:
+            return {}
+        values = self._l2_call(self.client.mget, [self._key(i) for i in ids])
+        return {
+            user_id: self._decode(value)
+            for user_id, value in zip(ids, values or [])
+            if value is not None
+        }
+
+    def _l2_set(self, user_id: str, profile: Profile, replace: bool) -> bool:
+        """
+        Writes the profile to L2. True if it was written, or there is no
+        L2; False if an NX set found a value or Redis is unavailable.
+        """
+        if self.client is None:
+            return True
+        email, created_at = profile
+        value = json.dumps(
+            {
+                "email": email,
+                "created_at": created_at.isoformat() if created_at else None,
+            }
+        )
+        ttl = int(self.l2_ttl * random.uniform(1.0, 1.1))
+        return bool(
+            self._l2_call(
+                self.client.set, self._key(user_id), value, ex=ttl, nx=not replace
+            )
+        )
+
+    def _l2_call(self, fn: Callable, *args, **kwargs):
+        """Runs one Redis command; None when Redis is unavailable."""
+        try:
+            return self.breaker.call(fn, *args, **kwargs)
+        except (CircuitOpenError, *UNAVAILABLE) as e:
+            print(f"Profile cache L2 unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _decode(value: str) -> Profile:
+        data = json.loads(value)
+        created_at = data["created_at"]
+        return (
+            data["email"],
+            datetime.fromisoformat(created_at) if created_at else None,
+        )
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.key_prefix}profile:{user_id}"
+
+    def _drop(self, user_id: str):
+        with self._lock:
+            self._revision += 1
+            self._entries.pop(user_id, None)
+        profile_cache_invalidations.inc()
+
+    def _on_invalidated(self, entries: dict):
+        """Invalidations made by other processes (bus listener thread)."""
+        for user_id in entries:
+            self._drop(user_id)
+
+    def _on_reset(self):
+        """Invalidations may have been missed (bus reconnected): drop all."""
+        with self._lock:
+            self._revision += 1
+            self._entries.clear()
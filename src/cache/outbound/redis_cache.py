@@ -2,11 +2,14 @@ from ..inbound.cache import ICache
 
 
 class RedisCache(ICache):
-    def __init__(self, redis_client):
+    def __init__(self, redis_client, key_prefix: str = ""):
         """
         Dependency Injection: Pass in the configured redis.Redis() client.
+        `key_prefix` namespaces every key (e.g. "auth:") so the blacklist
+        can share a Redis with other services.
         """
         self.client = redis_client
+        self.key_prefix = key_prefix
 
     def blacklist_token(self, jti: str, expiry_seconds: int) -> None:
         """
@@ -14,7 +17,7 @@ class RedisCache(ICache):
         """
         # setex = SET with Expiry
         # We don't care about the value ("blacklisted"), only the key existence.
-        self.client.setex(jti, expiry_seconds, "blacklisted")
+        self.client.setex(self._key(jti), expiry_seconds, "blacklisted")
 
     def is_blacklisted(self, jti: str) -> bool:
         """
@@ -22,4 +25,71 @@ class RedisCache(ICache):
         Returns: True if blacklisted, False otherwise.
         """
         # Redis .exists() returns 1 if found, 0 if not.
-        return self.client.exists(jti) > 0
+        return self.client.exists(self._key(jti)) > 0
+
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool:
+        """
+        Blacklists the JTI unless it already is, atomically, in one round trip
+        (SET NX EX). Of any number of concurrent callers exactly one gets True.
+        Returns: True if this call blacklisted it, False if it already was.
+        """
+        # SET ... NX returns None when the key exists
+        created = self.client.set(
+            self._key(jti), "blacklisted", nx=True, ex=expiry_seconds
+        )
+        return bool(created)
+
+    def get_generation(self, user_id: str) -> int:
+        """Current token generation of the user (0 until the first bump)."""
+        return int(self.client.get(self._generation_key(user_id)) or 0)
+
+    def bump_generation(self, user_id: str) -> int:
+        """
+        Revokes every token issued to the user so far. The counter never
+        expires: restarting it at 0 could make a newer bump too small to
+        revoke tokens that carry an older, higher generation.
+        """
+        return self.client.incr(self._generation_key(user_id))
+
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]:
+        """
+        SET NX EX and GET of the user's generation, pipelined: the refresh
+        path still costs one round trip.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(self._key(jti), "blacklisted", nx=True, ex=expiry_seconds)
+        pipe.get(self._generation_key(user_id))
+        created, generation = pipe.execute()
+        return bool(created), int(generation or 0)
+
+    def blacklist_many(self, entries: dict[str, int]) -> None:
+        """
+        Blacklists every {jti: expiry_seconds} in one pipelined round trip.
+        """
+        if not entries:
+            return
+        # No MULTI/EXEC: the writes are independent, we only save round trips
+        pipe = self.client.pipeline(transaction=False)
+        for jti, expiry_seconds in entries.items():
+            pipe.setex(self._key(jti), expiry_seconds, "blacklisted")
+        pipe.execute()
+
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]:
+        """
+        Checks every JTI in one pipelined round trip.
+        Returns: One flag per JTI, in order.
+        """
+        if not jtis:
+            return []
+        pipe = self.client.pipeline(transaction=False)
+        for jti in jtis:
+            pipe.exists(self._key(jti))
+        return [found > 0 for found in pipe.execute()]
+
+    def _key(self, jti: str) -> str:
+        return f"{self.key_prefix}{jti}"
+
+    def _generation_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}generation:{user_id}"
@@ -0,0 +1,107 @@
+import redis
+
+from src.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.resilience.retry import retry_call
+from src.telemetry.metrics.resilience_metrics import blacklist_check_fallbacks
+from ..inbound.cache import ICache
+
+FAIL_OPEN = "open"
+FAIL_CLOSED = "closed"
+
+# Connection refused/reset or a socket deadline hit; any other RedisError is
+# a bad command, not an outage
+UNAVAILABLE = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+
+
+class ResilientCache(ICache):
+    """
+    Failure isolation in front of another ICache (RedisCache).
+
+    Every call goes through `breaker`, so a stalled Redis costs one socket
+    timeout per request only until the breaker opens. is_blacklisted is a
+    read and is retried `read_retries` times with jitter; blacklist_token is
+    not retried and still raises, so a failed revocation is never silent.
+
+    When Redis cannot answer is_blacklisted or consume_once, `fail_mode`
+    decides: "closed" reports every token as revoked (refreshes fail until
+    Redis is back), "open" reports none (revoked tokens work until Redis is
+    back).
+    """
+
+    def __init__(
+        self,
+        cache: ICache,
+        breaker: CircuitBreaker,
+        read_retries: int = 1,
+        fail_mode: str = FAIL_CLOSED,
+    ):
+        if fail_mode not in (FAIL_OPEN, FAIL_CLOSED):
+            raise ValueError(f"Unknown blacklist fail mode: {fail_mode}")
+
+        self.cache = cache
+        self.breaker = breaker
+        self.read_retries = read_retries
+        self.fail_mode = fail_mode
+
+    def blacklist_token(self, jti: str, expiry_seconds: int) -> None:
+        self.breaker.call(self.cache.blacklist_token, jti, expiry_seconds)
+
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool:
+        # Never retried: if the first SET NX landed but its reply was lost, a
+        # retry would see the key and reject the token's legitimate owner
+        try:
+            return self.breaker.call(self.cache.consume_once, jti, expiry_seconds)
+        except (CircuitOpenError, *UNAVAILABLE) as e:
+            print(f"consume_once failing {self.fail_mode}: {e}")
+            blacklist_check_fallbacks.labels(mode=self.fail_mode).inc()
+            # Closed: the token counts as already used; open: as consumed now
+            return not self._fallback()
+
+    def blacklist_many(self, entries: dict[str, int]) -> None:
+        self.breaker.call(self.cache.blacklist_many, entries)
+
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]:
+        # Not retried, for the same reason as consume_once
+        try:
+            return self.breaker.call(
+                self.cache.consume_once_with_generation, jti, expiry_seconds, user_id
+            )
+        except (CircuitOpenError, *UNAVAILABLE) as e:
+            print(f"consume_once failing {self.fail_mode}: {e}")
+            blacklist_check_fallbacks.labels(mode=self.fail_mode).inc()
+            return not self._fallback(), 0
+
+    def get_generation(self, user_id: str) -> int:
+        # Tokens issued while Redis is down carry generation 0; if the user
+        # has bumped before, they stop working once Redis is back
+        return self._check(self.cache.get_generation, user_id, fallback=0)
+
+    def bump_generation(self, user_id: str) -> int:
+        # Like blacklist_token: a failed mass revocation must not be silent
+        return self.breaker.call(self.cache.bump_generation, user_id)
+
+    def is_blacklisted(self, jti: str) -> bool:
+        return self._check(self.cache.is_blacklisted, jti, fallback=self._fallback())
+
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]:
+        return self._check(
+            self.cache.are_blacklisted, jtis, fallback=[self._fallback()] * len(jtis)
+        )
+
+    def _check(self, read, arg, fallback):
+        try:
+            return retry_call(
+                lambda: self.breaker.call(read, arg),
+                retries=self.read_retries,
+                retry_on=UNAVAILABLE,
+                name=self.breaker.name,
+            )
+        except (CircuitOpenError, *UNAVAILABLE) as e:
+            print(f"blacklist check failing {self.fail_mode}: {e}")
+            blacklist_check_fallbacks.labels(mode=self.fail_mode).inc()
+            return fallback
+
+    def _fallback(self) -> bool:
+        return self.fail_mode == FAIL_CLOSED
@@ -0,0 +1,120 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from src.utils.hash_ring import HashRing
+from ..inbound.cache import ICache
+
+
+class ShardedCache(ICache):
+    """
+    Spreads revocation state over several Redis nodes with a consistent
+    hash ring (client-side, like ShardedUserExecuter does for MySQL).
+
+    - A JTI lives on the node that owns hash(jti); a user's token generation
+      on the node that owns hash("generation:" + user_id).
+    - Batch operations are split per node and each node gets one pipelined
+      call; the calls to different nodes run concurrently, so a batch costs
+      one round trip of wall time however many nodes it touches.
+    - Nodes are identified by name: reordering the config moves nothing, and
+      adding a node only moves the keys on the arcs it takes over. Moved
+      revocations are not copied; they are short-lived, so keep the old
+      node in the ring until REFRESH_EXP_DAYS have passed, or accept that
+      tokens revoked before the change may be accepted again.
+
+    Every node is a full ICache (usually ResilientCache over RedisCache), so
+    a node that is down only affects the keys it owns.
+    """
+
+    def __init__(self, nodes: dict[str, ICache], vnodes: int = 128):
+        self.nodes = nodes
+        self.ring = HashRing(list(nodes), vnodes)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+
+    def node_for(self, jti: str) -> str:
+        return self.ring.node_for(jti)
+
+    def generation_node_for(self, user_id: str) -> str:
+        return self.ring.node_for(f"generation:{user_id}")
+
+    # ----------------------------------------------------------------
+    # ICache
+    # ----------------------------------------------------------------
+    def blacklist_token(self, jti: str, expiry_seconds: int) -> None:
+        self._node(jti).blacklist_token(jti, expiry_seconds)
+
+    def is_blacklisted(self, jti: str) -> bool:
+        return self._node(jti).is_blacklisted(jti)
+
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool:
+        return self._node(jti).consume_once(jti, expiry_seconds)
+
+    def get_generation(self, user_id: str) -> int:
+        return self.nodes[self.generation_node_for(user_id)].get_generation(user_id)
+
+    def bump_generation(self, user_id: str) -> int:
+        return self.nodes[self.generation_node_for(user_id)].bump_generation(user_id)
+
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]:
+        node = self.node_for(jti)
+        if node == self.generation_node_for(user_id):
+            return self.nodes[node].consume_once_with_generation(
+                jti, expiry_seconds, user_id
+            )
+
+        # Two nodes: ask both at once, still one round trip of latency
+        generation = self._fan_out().submit(self.get_generation, user_id)
+        consumed = self.consume_once(jti, expiry_seconds)
+        return consumed, generation.result()
+
+    def blacklist_many(self, entries: dict[str, int]) -> None:
+        by_node: dict[str, dict[str, int]] = {}
+        for jti, expiry_seconds in entries.items():
+            by_node.setdefault(self.node_for(jti), {})[jti] = expiry_seconds
+
+        self._each_node(
+            by_node, lambda node, batch: self.nodes[node].blacklist_many(batch)
+        )
+
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]:
+        owners = [self.node_for(jti) for jti in jtis]
+        by_node: dict[str, list[str]] = {}
+        for jti, node in zip(jtis, owners):
+            by_node.setdefault(node, []).append(jti)
+
+        answers = self._each_node(
+            by_node, lambda node, batch: self.nodes[node].are_blacklisted(batch)
+        )
+        # Each node answers in the order it was asked; put them back in order
+        flags = {node: iter(node_flags) for node, node_flags in zip(by_node, answers)}
+        return [next(flags[node]) for node in owners]
+
+    # ----------------------------------------------------------------
+    # Internals
+    # ----------------------------------------------------------------
+    def _node(self, jti: str) -> ICache:
+        return self.nodes[self.node_for(jti)]
+
+    def _fan_out(self) -> ThreadPoolExecutor:
+        """The executor for concurrent node calls (a new one in a forked worker)."""
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.nodes), thread_name_prefix="cache-fan-out"
+                )
+            return self._executor
+
+    def _each_node(self, by_node: dict, call: Callable) -> list:
+        """Runs call(node, batch) for every node, concurrently; results in order."""
+        if len(by_node) <= 1:
+            return [call(node, batch) for node, batch in by_node.items()]
+        futures = [
+            self._fan_out().submit(call, node, batch) for node, batch in by_node.items()
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,222 @@
+import math
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable
+
+from src.telemetry.metrics.logout_metrics import (
+    revocation_flush_batch_size,
+    revocation_flushes,
+    revocation_queue_depth,
+    revocation_queue_lag,
+)
+from ..inbound.cache import ICache
+
+
+class WriteBehindCache(ICache):
+    """
+    Opt-in write-behind for revocations, in front of another ICache.
+
+    blacklist_token/blacklist_many only record the JTI as pending and
+    return; a flusher thread writes pending JTIs in batches of up to
+    `max_batch` with one blacklist_many (one pipelined round trip), at most
+    `interval` seconds after the oldest one was queued. A failed flush is
+    retried with jittered backoff until it succeeds or the tokens expire.
+
+    Every read consults the pending JTIs before the wrapped cache, so a
+    token revoked here is rejected by this process at once, whether or not
+    it has reached Redis yet. Other processes see it after the flush.
+
+    At most `max_pending` JTIs wait; past that, revocations are written
+    inline as without the queue. drain() writes everything still pending
+    (called at exit).
+    """
+
+    def __init__(
+        self,
+        cache: ICache,
+        max_pending: int = 10_000,
+        max_batch: int = 500,
+        interval: float = 0.05,
+        max_backoff: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache = cache
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.clock = clock
+
+        self._cond = threading.Condition()
+        # jti -> (expires_at, queued_at), oldest first; entries stay here
+        # until they are written, so reads keep seeing them meanwhile
+        self._pending: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._flusher = None
+        self._pid = None
+
+    # ----------------------------------------------------------------
+    # Writes (queued)
+    # ----------------------------------------------------------------
+    def blacklist_token(self, jti: str, expiry_seconds: int) -> None:
+        self.blacklist_many({jti: expiry_seconds})
+
+    def blacklist_many(self, entries: dict[str, int]) -> None:
+        now = self.clock()
+        with self._cond:
+            self._ensure_flusher()
+            if len(self._pending) + len(entries) > self.max_pending:
+                overflow = True
+            else:
+                overflow = False
+                queued_at = time.monotonic()
+                for jti, expiry_seconds in entries.items():
+                    self._pending[jti] = (now + expiry_seconds, queued_at)
+                self._cond.notify()
+            self._update_gauges()
+
+        if overflow:
+            # Queue full (Redis slow or down): back to writing inline
+            revocation_flushes.labels(outcome="overflow").inc()
+            self.cache.blacklist_many(entries)
+
+    # ----------------------------------------------------------------
+    # Reads (pending first)
+    # ----------------------------------------------------------------
+    def is_blacklisted(self, jti: str) -> bool:
+        return self._is_pending(jti) or self.cache.is_blacklisted(jti)
+
+    def are_blacklisted(self, jtis: list[str]) -> list[bool]:
+        with self._cond:
+            pending = [jti in self._pending for jti in jtis]
+        unknown = [jti for jti, flag in zip(jtis, pending) if not flag]
+        fetched = iter(self.cache.are_blacklisted(unknown) if unknown else [])
+        return [flag or next(fetched) for flag in pending]
+
+    def consume_once(self, jti: str, expiry_seconds: int) -> bool:
+        if self._is_pending(jti):
+            return False
+        return self.cache.consume_once(jti, expiry_seconds)
+
+    def consume_once_with_generation(
+        self, jti: str, expiry_seconds: int, user_id: str
+    ) -> tuple[bool, int]:
+        if self._is_pending(jti):
+            return False, self.cache.get_generation(user_id)
+        return self.cache.consume_once_with_generation(jti, expiry_seconds, user_id)
+
+    def get_generation(self, user_id: str) -> int:
+        return self.cache.get_generation(user_id)
+
+    def bump_generation(self, user_id: str) -> int:
+        return self.cache.bump_generation(user_id)
+
+    # ----------------------------------------------------------------
+    # Flushing
+    # ----------------------------------------------------------------
+    def drain(self, timeout: float = 5.0) -> int:
+        """
+        Writes every pending revocation from the calling thread, giving up
+        after `timeout` seconds. Returns how many are still pending.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            batch = self._next_batch(wait=False)
+            if not batch:
+                break
+            try:
+                self._write(batch)
+            except Exception as e:
+                print(f"Revocation drain failed: {e}")
+                time.sleep(min(0.1, max(deadline - time.monotonic(), 0)))
+        with self._cond:
+            left = len(self._pending)
+        if left:
+            print(f"Revocation drain gave up with {left} pending")
+        return left
+
+    def _ensure_flusher(self):
+        """Starts the flusher thread (again, in a forked worker). Holds _cond."""
+        if self._flusher is not None and self._pid == os.getpid():
+            return
+        # Revocations queued by the parent are flushed by the parent
+        self._pending = OrderedDict()
+        self._pid = os.getpid()
+        self._flusher = threading.Thread(
+            target=self._run, name="revocation-write-behind", daemon=True
+        )
+        self._flusher.start()
+
+    def _run(self):
+        failures = 0
+        while True:
+            batch = self._next_batch(wait=True)
+            try:
+                self._write(batch)
+                failures = 0
+            except Exception as e:
+                # Still pending: reads keep rejecting them, the next round
+                # writes them again
+                failures += 1
+                revocation_flushes.labels(outcome="error").inc()
+                print(f"Revocation flush failed ({failures}): {e}")
+                time.sleep(random.uniform(0, min(self.max_backoff, 0.1 * 2**failures)))
+
+    def _next_batch(self, wait: bool) -> dict[str, float]:
+        """Up to max_batch pending {jti: expires_at}, oldest first."""
+        with self._cond:
+            if wait:
+                while not self._pending:
+                    self._cond.wait()
+
+                # Wait for more to batch, up to `interval` after the oldest
+                _, queued_at = next(iter(self._pending.values()))
+                deadline = queued_at + self.interval
+                while len(self._pending) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+            return {
+                jti: expires_at
+                for jti, (expires_at, _) in islice(
+                    self._pending.items(), self.max_batch
+                )
+            }
+
+    def _write(self, batch: dict[str, float]):
+        now = self.clock()
+        # TTLs count from now, not from when the revocation was queued
+        entries = {
+            jti: math.ceil(expires_at - now)
+            for jti, expires_at in batch.items()
+            if expires_at > now
+        }
+        if entries:
+            self.cache.blacklist_many(entries)
+            revocation_flush_batch_size.observe(len(entries))
+            revocation_flushes.labels(outcome="ok").inc()
+
+        with self._cond:
+            for jti, expires_at in batch.items():
+                # Unless it was revoked again (longer) while we were writing
+                if self._pending.get(jti, (None,))[0] == expires_at:
+                    del self._pending[jti]
+            self._update_gauges()
+
+    def _is_pending(self, jti: str) -> bool:
+        with self._cond:
+            return jti in self._pending
+
+    def _update_gauges(self):
+        """Holds _cond."""
+        revocation_queue_depth.set(len(self._pending))
+        if self._pending:
+            _, queued_at = next(iter(self._pending.values()))
+            revocation_queue_lag.set(time.monotonic() - queued_at)
+        else:
+            revocation_queue_lag.set(0)
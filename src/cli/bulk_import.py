@@ -0,0 +1,267 @@
+"""
+Bulk user import: streams users from a CSV or NDJSON file into the user store.
+
+Each record needs an `email` and either a plain `password` (hashed here, in a
+process pool) or a `password_hash` that is already bcrypt or argon2id, the
+formats login can verify (see hash_format). An `id` that is a UUID is kept
+(migrations from the old identity store); otherwise a new UUIDv7 is generated.
+Invalid records, including NDJSON lines that do not parse (written with their
+line number and raw text), are counted as rejected and go to --rejects.
+
+    python -m src.cli.bulk_import users.csv --batch-size 1000 --workers 8
+    python -m src.cli.bulk_import users.ndjson --rejects rejected.ndjson
+
+Progress is checkpointed to <file>.checkpoint after every committed batch and
+re-running the same command resumes from there. Emails that already exist are
+counted as skipped, so replaying part of a batch after a crash is harmless.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from uuid import UUID
+
+from src.app.domain.exceptions import (
+    EmailAlreadyExistsError,
+    UserDomainValidationError,
+)
+from src.app.domain.ids import uuid7
+from src.app.domain.user import User
+from src.app.services.hashing_service import BcryptHasher, hash_format
+from src.app.services.inbound.hashing_service import Hasher
+
+
+class MalformedLine:
+    """An NDJSON line that is not valid JSON; rejected like an invalid record."""
+
+    def __init__(self, line_number: int, raw: str, error: json.JSONDecodeError):
+        self.line_number = line_number
+        self.raw = raw
+        self.error = error
+
+
+def read_records(path: str, fmt: str | None = None):
+    """
+    Yields one record per user; the format defaults to the file extension.
+    An NDJSON line that does not parse is yielded as a MalformedLine, so
+    record counts (and checkpoints) stay aligned with the file.
+    """
+    fmt = fmt or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield MalformedLine(line_number, line.rstrip("\r\n"), e)
+
+
+def batched(records, size: int):
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def to_row(record: dict) -> tuple[str, str, str | None, str | None]:
+    """
+    record -> (user_id, email, password_hash, password); exactly one of
+    password_hash / password is set. Raises UserDomainValidationError.
+    """
+    if isinstance(record, MalformedLine):
+        raise UserDomainValidationError(
+            f"Line {record.line_number} is not valid JSON: {record.error}"
+        )
+    if not isinstance(record, dict):
+        raise UserDomainValidationError("Record is not an object")
+
+    email = (record.get("email") or "").strip()
+    User.validate_email(email)
+
+    raw_id = record.get("id")
+    try:
+        user_id = str(UUID(raw_id)) if raw_id else str(uuid7())
+    except ValueError:
+        raise UserDomainValidationError(f"Invalid id {raw_id!r}")
+
+    password_hash = record.get("password_hash")
+    if password_hash:
+        if hash_format(password_hash) is None:
+            raise UserDomainValidationError("password_hash is not bcrypt or argon2id")
+        return user_id, email, password_hash, None
+
+    password = record.get("password")
+    User.validate_password(password)
+    return user_id, email, None, password
+
+
+class Checkpoint:
+    """Number of input records already committed, kept next to the input."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+
+    def load(self) -> int:
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        with open(self.path) as f:
+            return int(f.read().strip() or 0)
+
+    def save(self, done: int):
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(str(done))
+        os.replace(tmp, self.path)  # atomic, never a half-written checkpoint
+
+
+def import_users(
+    records,
+    executor,
+    batch_size: int = 1000,
+    workers: int | None = None,
+    checkpoint: Checkpoint | None = None,
+    rejects=None,
+    log=print,
+    hasher: Hasher | None = None,
+) -> Counter:
+    """
+    Validates, hashes and inserts `records` in batches through
+    executor.create_users. `workers=0` hashes in this process.
+    `hasher` hashes the plain passwords (pickled into the worker
+    processes); main() passes the configured policy, the default is bcrypt
+    at its default cost.
+    Returns counts of imported / skipped (email exists) / rejected rows.
+    """
+    hasher = hasher or BcryptHasher()
+    checkpoint = checkpoint or Checkpoint(None)
+    done = checkpoint.load()
+    stats = Counter()
+    start = time.perf_counter()
+
+    workers = os.cpu_count() if workers is None else workers
+    pool = ProcessPoolExecutor(workers) if workers else None
+
+    try:
+        for batch in batched(itertools.islice(records, done, None), batch_size):
+            rows = []
+            for record in batch:
+                try:
+                    rows.append(to_row(record))
+                except UserDomainValidationError as e:
+                    stats["rejected"] += 1
+                    write_reject(rejects, record, e)
+
+            # Hash the plain passwords of the batch in parallel
+            plain = [i for i, row in enumerate(rows) if row[3] is not None]
+            hashes = hash_passwords(pool, workers, hasher, [rows[i][3] for i in plain])
+            for i, password_hash in zip(plain, hashes):
+                rows[i] = (rows[i][0], rows[i][1], password_hash, None)
+
+            results = executor.create_users([row[:3] for row in rows])
+            for row, error in zip(rows, results):
+                if error is None:
+                    stats["imported"] += 1
+                elif isinstance(error, EmailAlreadyExistsError):
+                    stats["skipped"] += 1
+                else:
+                    stats["rejected"] += 1
+                    write_reject(rejects, {"id": row[0], "email": row[1]}, error)
+
+            done += len(batch)
+            checkpoint.save(done)
+
+            elapsed = time.perf_counter() - start
+            processed = sum(stats.values())
+            log(
+                f"{done} records  imported {stats['imported']}"
+                f"  skipped {stats['skipped']}  rejected {stats['rejected']}"
+                f"  {processed / elapsed:.0f} rows/s"
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return stats
+
+
+def hash_passwords(
+    pool, workers: int, hasher: Hasher, passwords: list[str]
+) -> list[str]:
+    if pool is None:
+        return [hasher.hash_password(p) for p in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    # The bound method pickles the hasher with its parameters
+    return list(pool.map(hasher.hash_password, passwords, chunksize=chunksize))
+
+
+def write_reject(rejects, record: dict, error: Exception):
+    if rejects is None:
+        return
+    if isinstance(record, MalformedLine):
+        rejects.write(
+            json.dumps(
+                {"line": record.line_number, "raw": record.raw, "error": str(error)}
+            )
+            + "\n"
+        )
+        return
+    if not isinstance(record, dict):
+        # A JSON line that is not an object: nothing in it is known to be safe
+        record = {}
+    safe = {k: v for k, v in record.items() if k not in ("password", "password_hash")}
+    rejects.write(json.dumps({**safe, "error": str(error)}) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="CSV (header row) or NDJSON file")
+    parser.add_argument("--format", choices=("csv", "ndjson"))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="0 = hash inline"
+    )
+    parser.add_argument("--checkpoint", help="default: <path>.checkpoint")
+    parser.add_argument("--rejects", help="NDJSON file for rejected rows")
+    args = parser.parse_args(argv)
+
+    # Imported here so --help works without the database settings
+    from src.components.infrastructure_component import InfrastructureComponent
+
+    executor = InfrastructureComponent().db.executor
+    hasher = InfrastructureComponent.password_hasher()
+    checkpoint = Checkpoint(args.checkpoint or f"{args.path}.checkpoint")
+    rejects = open(args.rejects, "a", encoding="utf-8") if args.rejects else None
+
+    start = time.perf_counter()
+    try:
+        stats = import_users(
+            read_records(args.path, args.format),
+            executor,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            checkpoint=checkpoint,
+            rejects=rejects,
+            hasher=hasher,
+        )
+    finally:
+        if rejects is not None:
+            rejects.close()
+    elapsed = time.perf_counter() - start
+
+    total = sum(stats.values())
+    print(f"finished {total} rows in {elapsed:.1f}s ({total / elapsed:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
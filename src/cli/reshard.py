@@ -0,0 +1,67 @@
+"""
+Resharding / backfill tool for the sharded user store.
+
+Every shard named in --from/--to must be listed in DB_SHARD_HOSTS
+(e.g. DB_SHARD_HOSTS="s1=db1:3306,s2=db2:3306,s3=db3:3306").
+
+Adding shard s3 to a running s1,s2 fleet:
+
+    # 1. Copy rows that s3 now owns (safe to re-run)
+    python -m src.cli.reshard --from s1,s2 --to s1,s2,s3 --phase copy
+    # 2. Deploy the app with DB_SHARD_HOSTS listing s1,s2,s3
+    # 3. Delete the rows s1/s2 no longer own (moving any written since step 1)
+    python -m src.cli.reshard --from s1,s2 --to s1,s2,s3 --phase cleanup
+
+Use --dry-run to only count the rows that would move.
+"""
+
+import argparse
+import time
+
+from src.config.app_config import AppConfig
+from src.repository.outbound.shardedExecuter import ShardedUserExecuter
+from src.repository.outbound.resharder import Resharder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--from", dest="old", required=True, help="s1,s2,...")
+    parser.add_argument("--to", dest="new", required=True, help="s1,s2,s3,...")
+    parser.add_argument("--phase", choices=("copy", "cleanup"), default="copy")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    old_nodes = args.old.split(",")
+    new_nodes = args.new.split(",")
+
+    missing = set(old_nodes + new_nodes) - set(AppConfig.DB_SHARDS)
+    if missing:
+        parser.error(f"Not in DB_SHARD_HOSTS: {', '.join(sorted(missing))}")
+
+    fleet = ShardedUserExecuter.from_config(
+        {**AppConfig.DB, "shards": AppConfig.DB_SHARDS}
+    )
+    resharder = Resharder(
+        fleet.shards,
+        old_nodes,
+        new_nodes,
+        vnodes=AppConfig.DB_SHARD_VNODES,
+        batch_size=args.batch_size,
+    )
+
+    start = time.perf_counter()
+    if args.phase == "copy":
+        counts = resharder.copy(dry_run=args.dry_run)
+    else:
+        counts = resharder.cleanup(dry_run=args.dry_run)
+    elapsed = time.perf_counter() - start
+
+    verb = "would" if args.dry_run else "did"
+    for table, count in counts.items():
+        print(f"{args.phase}: {verb} touch {count} {table} rows")
+    print(f"finished in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Lists or exports users through the same service the admin API uses.
+
+    # One page (prints the cursor for the next one on stderr)
+    python -m src.cli.users list --limit 50
+    python -m src.cli.users list --limit 50 --after <cursor>
+
+    # Every user as NDJSON, streamed (constant memory)
+    python -m src.cli.users export > users.ndjson
+
+    # Log a user out of every session (their refresh tokens stop working)
+    python -m src.cli.users revoke-sessions <user_id>
+"""
+
+import argparse
+import sys
+
+from src.controller.outbound.response_models import ListedUserResponse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = commands.add_parser("list", help="one page of users")
+    list_cmd.add_argument("--limit", type=int, default=100)
+    list_cmd.add_argument("--after", help="cursor printed by the previous page")
+
+    commands.add_parser("export", help="every user as NDJSON on stdout")
+
+    revoke_cmd = commands.add_parser(
+        "revoke-sessions", help="log a user out of every session"
+    )
+    revoke_cmd.add_argument("user_id")
+    args = parser.parse_args(argv)
+
+    # Imported here so --help works without the database settings
+    from src.application import container
+
+    if args.command == "revoke-sessions":
+        generation = container.services.token_service.revoke_sessions(args.user_id)
+        print(f"revoked sessions of {args.user_id} (generation {generation})")
+        return
+
+    user_service = container.services.user_service
+
+    if args.command == "list":
+        users, next_cursor = user_service.list_users(args.limit, args.after)
+    else:
+        users, next_cursor = user_service.export_users(), None
+
+    for user in users:
+        sys.stdout.write(ListedUserResponse.from_dto(user).model_dump_json() + "\n")
+
+    if next_cursor:
+        print(f"next cursor: {next_cursor}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
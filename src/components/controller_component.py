@@ -2,7 +2,12 @@ from src.controller.inbound.register_controller import RegisterController
 from src.controller.inbound.login_controller import LoginController
 from src.controller.inbound.refresh_controller import RefreshTokenController
 from src.controller.inbound.logout_controller import LogoutController
+from src.controller.inbound.logout_all_controller import LogoutAllController
 from src.controller.inbound.silent_auth_controller import SilentAuthController
+from src.controller.inbound.list_users_controller import ListUsersController
+from src.controller.inbound.export_users_controller import ExportUsersController
+from src.controller.inbound.lookup_users_controller import LookupUsersController
+from src.config.app_config import AppConfig
 
 
 class ControllerComponent:
@@ -14,7 +19,20 @@ class ControllerComponent:
         )
         self.refresh = RefreshTokenController(services.token_service)
         self.logout = LogoutController(services.token_service)
+        self.logout_all = LogoutAllController(services.token_service)
         self.silent_auth = SilentAuthController(
             services.token_service,
             services.user_service,
         )
+        self.list_users = ListUsersController(
+            services.user_service,
+            AppConfig.ADMIN_API_TOKEN,
+        )
+        self.export_users = ExportUsersController(
+            services.user_service,
+            AppConfig.ADMIN_API_TOKEN,
+        )
+        self.lookup_users = LookupUsersController(
+            services.user_service,
+            AppConfig.INTERNAL_API_TOKEN,
+        )
@@ -2,13 +2,100 @@ from src.config.app_config import AppConfig
 from src.provider.db_provider import DatabaseProvider
 from src.provider.redis_provider import RedisProvider
 from src.repository.outbound.sqlExecuter import UserSQLExecuter
-from src.app.services.hashing_service import BcryptHasher
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.repository.outbound.shardedExecuter import ShardedUserExecuter
+from src.repository.outbound.coalescingExecuter import CoalescingUserExecuter
+from src.app.services.hashing_service import (
+    ARGON2ID,
+    BCRYPT,
+    Argon2Hasher,
+    BcryptHasher,
+    MixedFormatHasher,
+    PooledHasher,
+)
 
 
 class InfrastructureComponent:
     def __init__(self):
-        self.db = DatabaseProvider(AppConfig.DB, UserSQLExecuter, BcryptHasher)
+        hasher = self.password_hasher
+        if AppConfig.DB_BACKEND == "sqlite":
+            self.db = DatabaseProvider(AppConfig.SQLITE, SQLiteUserExecuter, hasher)
+        elif AppConfig.DB_BACKEND == "sharded":
+            self.db = DatabaseProvider(
+                {
+                    **AppConfig.DB,
+                    "shards": AppConfig.DB_SHARDS,
+                    "shard_vnodes": AppConfig.DB_SHARD_VNODES,
+                },
+                ShardedUserExecuter.from_config,
+                hasher,
+            )
+        else:
+            self.db = DatabaseProvider(AppConfig.DB, UserSQLExecuter, hasher)
+        if AppConfig.DB_COALESCE_WRITES:
+            self.db.executor = CoalescingUserExecuter(
+                self.db.executor,
+                window=AppConfig.DB_COALESCE_WINDOW_MS / 1000,
+                max_batch=AppConfig.DB_COALESCE_MAX_BATCH,
+                # Longest one batch may take: pool wait, connect, write
+                timeout=AppConfig.DB["pool_timeout"]
+                + AppConfig.DB["connection_timeout"]
+                + AppConfig.DB["write_timeout"],
+            )
+        if AppConfig.HASH_POOL_MODE != "inline":
+            self.db.hasher = PooledHasher(
+                self.db.hasher,
+                mode=AppConfig.HASH_POOL_MODE,
+                workers=AppConfig.HASH_POOL_WORKERS or None,
+                max_queue=AppConfig.HASH_POOL_MAX_QUEUE,
+                queue_timeout=AppConfig.HASH_POOL_QUEUE_TIMEOUT_MS / 1000,
+                retry_after=AppConfig.HASH_RETRY_AFTER_SECONDS,
+            )
         self.redis = RedisProvider(
             AppConfig.REDIS_HOST,
             AppConfig.REDIS_PORT,
+            connect_timeout=AppConfig.REDIS_CONNECT_TIMEOUT,
+            timeout=AppConfig.REDIS_TIMEOUT,
+            breaker_failures=AppConfig.REDIS_BREAKER_FAILURES,
+            breaker_reset_seconds=AppConfig.REDIS_BREAKER_RESET_SECONDS,
+            read_retries=AppConfig.REDIS_READ_RETRIES,
+            fail_mode=AppConfig.REDIS_BLACKLIST_FAIL_MODE,
+            max_connections=AppConfig.REDIS_MAX_CONNECTIONS,
+            pool_timeout=AppConfig.REDIS_POOL_TIMEOUT,
+            health_check_interval=AppConfig.REDIS_HEALTH_CHECK_INTERVAL,
+            keepalive=AppConfig.REDIS_KEEPALIVE,
+            key_prefix=AppConfig.REDIS_KEY_PREFIX,
+            l1_max_entries=AppConfig.REDIS_L1_MAX_ENTRIES,
+            l1_negative_ttl=AppConfig.REDIS_L1_NEGATIVE_TTL_MS / 1000,
+            l1_generation_ttl=AppConfig.REDIS_L1_GENERATION_TTL_MS / 1000,
+            layout=AppConfig.REDIS_BLACKLIST_LAYOUT,
+            bucket_seconds=AppConfig.REDIS_BUCKET_SECONDS,
+            bloom_bits=AppConfig.REDIS_BLOOM_BITS,
+            bloom_hashes=AppConfig.REDIS_BLOOM_HASHES,
+            nodes=AppConfig.REDIS_NODES,
+            node_vnodes=AppConfig.REDIS_NODE_VNODES,
+            backend=AppConfig.CACHE_BACKEND,
+            memory_max_entries=AppConfig.CACHE_MEMORY_MAX_ENTRIES,
+            snapshot_path=AppConfig.CACHE_SNAPSHOT_PATH,
+            write_behind=AppConfig.REDIS_WRITE_BEHIND,
+            write_behind_max_pending=AppConfig.REDIS_WRITE_BEHIND_MAX_PENDING,
+            write_behind_max_batch=AppConfig.REDIS_WRITE_BEHIND_MAX_BATCH,
+            write_behind_interval=AppConfig.REDIS_WRITE_BEHIND_INTERVAL_MS / 1000,
         )
+
+    @staticmethod
+    def password_hasher() -> MixedFormatHasher:
+        """
+        The configured password hashing policy (HASH_ALGORITHM, bcrypt and
+        argon2id costs), without the hashing pool. Also used by the bulk
+        import, so imported users get the same hashes as registered ones.
+        """
+        hashers = {
+            BCRYPT: BcryptHasher(rounds=AppConfig.HASH_BCRYPT_ROUNDS),
+            ARGON2ID: Argon2Hasher(
+                time_cost=AppConfig.HASH_ARGON2_TIME_COST,
+                memory_cost=AppConfig.HASH_ARGON2_MEMORY_KIB,
+                parallelism=AppConfig.HASH_ARGON2_PARALLELISM,
+            ),
+        }
+        return MixedFormatHasher(AppConfig.HASH_ALGORITHM, hashers)
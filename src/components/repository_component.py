@@ -1,8 +1,36 @@
 from src.repository.outbound.userRepo import UserRepo
+from src.repository.outbound.cachingUserRepo import CachingUserRepo
+from src.repository.outbound.passwordRehasher import PasswordRehasher
 from src.app.services.inbound.hashing_service import Hasher
 from src.app.services.hashing_service import BcryptHasher
+from src.cache.outbound.invalidation_bus import RedisInvalidationBus
+from src.cache.outbound.profile_cache import ProfileCache
+from src.config.app_config import AppConfig
 
 
 class RepositoryComponent:
     def __init__(self, infra):
-        self.user_repo = UserRepo(infra.db.executor, infra.db.hasher)
+        rehasher = None
+        if AppConfig.HASH_REHASH_ON_LOGIN:
+            rehasher = PasswordRehasher(infra.db.executor, infra.db.hasher)
+        self.user_repo = UserRepo(infra.db.executor, infra.db.hasher, rehasher)
+        if AppConfig.PROFILE_CACHE_ENABLED:
+            self.user_repo = CachingUserRepo(self.user_repo, self._profiles(infra))
+
+    @staticmethod
+    def _profiles(infra) -> ProfileCache:
+        # No Redis client (memory backend, several nodes): L1 only
+        client = infra.redis.client
+        bus = None
+        if client is not None:
+            bus = RedisInvalidationBus(
+                client, f"{AppConfig.REDIS_KEY_PREFIX}profile-invalidated"
+            )
+        return ProfileCache(
+            client,
+            key_prefix=AppConfig.REDIS_KEY_PREFIX,
+            max_entries=AppConfig.PROFILE_CACHE_L1_MAX_ENTRIES,
+            l1_ttl=AppConfig.PROFILE_CACHE_L1_TTL_SECONDS,
+            l2_ttl=AppConfig.PROFILE_CACHE_L2_TTL_SECONDS,
+            bus=bus,
+        )
@@ -4,6 +4,24 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _parse_hosts(value: str) -> list[dict]:
+    """'host1:3306,host2' -> [{"host": "host1", "port": 3306}, {"host": "host2"}]"""
+    hosts = []
+    for entry in filter(None, (item.strip() for item in value.split(","))):
+        host, _, port = entry.partition(":")
+        hosts.append({"host": host, "port": int(port)} if port else {"host": host})
+    return hosts
+
+
+def _parse_shards(value: str) -> dict[str, dict]:
+    """'s1=host1:3306,s2=host2' -> {"s1": {"host": "host1", "port": 3306}, ...}"""
+    shards = {}
+    for entry in filter(None, (item.strip() for item in value.split(","))):
+        name, _, hosts = entry.partition("=")
+        shards[name.strip()] = _parse_hosts(hosts)[0]
+    return shards
+
+
 class AppConfig:
     DB = {
         "user": os.getenv("DB_USER", "root"),
@@ -11,9 +29,135 @@ class AppConfig:
         "host": os.getenv("DB_HOST", "localhost"),
         "database": os.getenv("DB_NAME", "auth_db"),
         "port": int(os.getenv("DB_PORT", 3307)),
+        # Deadlines (seconds) so a stalled server cannot hold request threads
+        "connection_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", 3)),
+        "read_timeout": int(os.getenv("DB_READ_TIMEOUT", 5)),
+        "write_timeout": int(os.getenv("DB_WRITE_TIMEOUT", 5)),
+        # Connection pool (consumed by SQLExecutor, not passed to the driver)
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "pool_max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 5)),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+        # "procedure" (CALL) or "prepared" (server-side prepared statements)
+        "query_mode": os.getenv("DB_QUERY_MODE", "procedure"),
+        # Read replicas (same credentials as the primary)
+        "replicas": _parse_hosts(os.getenv("DB_REPLICA_HOSTS", "")),
+        "replica_strategy": os.getenv("DB_REPLICA_STRATEGY", "round_robin"),
+        "replica_eject_seconds": float(os.getenv("DB_REPLICA_EJECT_SECONDS", 30)),
+        "read_your_writes_seconds": float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", 5)),
+        # Circuit breaker per pool, retries for idempotent reads
+        "breaker_failures": int(os.getenv("DB_BREAKER_FAILURES", 5)),
+        "breaker_reset_seconds": float(os.getenv("DB_BREAKER_RESET_SECONDS", 30)),
+        "read_retries": int(os.getenv("DB_READ_RETRIES", 2)),
+        # Per-query latency/row/error metrics; slow query log threshold (0 = off)
+        "metrics": os.getenv("METRICS_ENABLED", "true").lower() == "true",
+        "slow_query_ms": float(os.getenv("DB_SLOW_QUERY_MS", 200)),
+    }
+
+    # "mysql" (default), "sharded" (DB_SHARD_HOSTS) or "sqlite" for
+    # single-node / benchmark deployments
+    DB_BACKEND = os.getenv("DB_BACKEND", "mysql")
+    DB_SHARDS = _parse_shards(os.getenv("DB_SHARD_HOSTS", ""))
+    DB_SHARD_VNODES = int(os.getenv("DB_SHARD_VNODES", 128))
+    # Group-commit concurrent registrations (CoalescingUserExecuter)
+    DB_COALESCE_WRITES = os.getenv("DB_COALESCE_WRITES", "false").lower() == "true"
+    DB_COALESCE_WINDOW_MS = float(os.getenv("DB_COALESCE_WINDOW_MS", 5))
+    DB_COALESCE_MAX_BATCH = int(os.getenv("DB_COALESCE_MAX_BATCH", 50))
+    SQLITE = {
+        "path": os.getenv("SQLITE_PATH", "auth.db"),
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000)),
     }
 
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+    REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", 1))
+    REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", 0.5))
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+    REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 1))
+    REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+    REDIS_KEEPALIVE = os.getenv("REDIS_KEEPALIVE", "true").lower() == "true"
+    # Namespace for every auth key, e.g. "auth:" on a shared Redis. Changing
+    # it orphans the revocations stored under the old prefix.
+    REDIS_KEY_PREFIX = os.getenv("REDIS_KEY_PREFIX", "")
+    # In-process L1 for blacklist lookups (0 entries = off); "not revoked"
+    # answers are trusted for this long unless pub/sub says otherwise
+    REDIS_L1_MAX_ENTRIES = int(os.getenv("REDIS_L1_MAX_ENTRIES", 0))
+    REDIS_L1_NEGATIVE_TTL_MS = float(os.getenv("REDIS_L1_NEGATIVE_TTL_MS", 1000))
+    # How long the L1 trusts a user's token generation (bumps are also pushed)
+    REDIS_L1_GENERATION_TTL_MS = float(os.getenv("REDIS_L1_GENERATION_TTL_MS", 5000))
+    # Circuit breaker around Redis; retries for idempotent reads
+    REDIS_BREAKER_FAILURES = int(os.getenv("REDIS_BREAKER_FAILURES", 5))
+    REDIS_BREAKER_RESET_SECONDS = float(os.getenv("REDIS_BREAKER_RESET_SECONDS", 10))
+    REDIS_READ_RETRIES = int(os.getenv("REDIS_READ_RETRIES", 1))
+    # What is_blacklisted answers while Redis is down: "closed" treats every
+    # token as revoked (safe), "open" lets them through (available)
+    REDIS_BLACKLIST_FAIL_MODE = os.getenv("REDIS_BLACKLIST_FAIL_MODE", "closed")
+    # "keys" (one key per revoked JTI) or "buckets" (BucketedRedisCache: sets
+    # grouped by expiry time, with Bloom filters). Switching orphans the
+    # revocations stored in the other layout.
+    REDIS_BLACKLIST_LAYOUT = os.getenv("REDIS_BLACKLIST_LAYOUT", "keys")
+    REDIS_BUCKET_SECONDS = int(os.getenv("REDIS_BUCKET_SECONDS", 6 * 3600))
+    REDIS_BLOOM_BITS = int(os.getenv("REDIS_BLOOM_BITS", 1 << 22))
+    REDIS_BLOOM_HASHES = int(os.getenv("REDIS_BLOOM_HASHES", 7))
+    # "redis" (default) or "memory": the blacklist lives in this process
+    # (MemoryCache) and is NOT shared between workers; optionally saved to
+    # CACHE_SNAPSHOT_PATH on exit and loaded back on start
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis")
+    CACHE_MEMORY_MAX_ENTRIES = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", 1_000_000))
+    CACHE_SNAPSHOT_PATH = os.getenv("CACHE_SNAPSHOT_PATH", "")
+    # Spread the blacklist over several Redis nodes with a consistent hash
+    # ring ("a=host1:6379,b=host2:6379"); empty = REDIS_HOST only
+    REDIS_NODES = _parse_shards(os.getenv("REDIS_NODES", ""))
+    REDIS_NODE_VNODES = int(os.getenv("REDIS_NODE_VNODES", 128))
+    # Logout returns before the revocation reaches Redis; a background
+    # flusher writes revocations in pipelined batches (WriteBehindCache)
+    REDIS_WRITE_BEHIND = os.getenv("REDIS_WRITE_BEHIND", "false").lower() == "true"
+    REDIS_WRITE_BEHIND_MAX_PENDING = int(
+        os.getenv("REDIS_WRITE_BEHIND_MAX_PENDING", 10_000)
+    )
+    REDIS_WRITE_BEHIND_MAX_BATCH = int(os.getenv("REDIS_WRITE_BEHIND_MAX_BATCH", 500))
+    REDIS_WRITE_BEHIND_INTERVAL_MS = float(
+        os.getenv("REDIS_WRITE_BEHIND_INTERVAL_MS", 50)
+    )
+    # Two-tier cache of user profiles for /me (in-process L1, Redis L2; the
+    # L2 is skipped with CACHE_BACKEND=memory or REDIS_NODES)
+    PROFILE_CACHE_ENABLED = (
+        os.getenv("PROFILE_CACHE_ENABLED", "false").lower() == "true"
+    )
+    PROFILE_CACHE_L1_MAX_ENTRIES = int(
+        os.getenv("PROFILE_CACHE_L1_MAX_ENTRIES", 100_000)
+    )
+    PROFILE_CACHE_L1_TTL_SECONDS = float(os.getenv("PROFILE_CACHE_L1_TTL_SECONDS", 60))
+    PROFILE_CACHE_L2_TTL_SECONDS = int(os.getenv("PROFILE_CACHE_L2_TTL_SECONDS", 3600))
+
+    # Format of new password hashes: "bcrypt" or "argon2id". Both verify
+    # either way; with rehash on login, users move to this one as they log in
+    HASH_ALGORITHM = os.getenv("HASH_ALGORITHM", "bcrypt")
+    # Argon2id cost: memory per hash in KiB (x concurrent logins must fit
+    # the pod), passes over that memory, lanes
+    HASH_ARGON2_MEMORY_KIB = int(os.getenv("HASH_ARGON2_MEMORY_KIB", 65536))
+    HASH_ARGON2_TIME_COST = int(os.getenv("HASH_ARGON2_TIME_COST", 3))
+    HASH_ARGON2_PARALLELISM = int(os.getenv("HASH_ARGON2_PARALLELISM", 4))
+    # bcrypt work factor for new hashes
+    HASH_BCRYPT_ROUNDS = int(os.getenv("HASH_BCRYPT_ROUNDS", 12))
+    # Hashes made with another format or cost are upgraded in the background
+    # on the user's next login (PasswordRehasher)
+    HASH_REHASH_ON_LOGIN = os.getenv("HASH_REHASH_ON_LOGIN", "true").lower() == "true"
+
+    # Password hashing off the request threads: "inline" (default), "thread"
+    # or "process" pool of HASH_POOL_WORKERS (0 = one per CPU). Past
+    # HASH_POOL_MAX_QUEUE waiting jobs, login/register answer 503 +
+    # Retry-After instead of queueing
+    HASH_POOL_MODE = os.getenv("HASH_POOL_MODE", "inline")
+    HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", 0))
+    HASH_POOL_MAX_QUEUE = int(os.getenv("HASH_POOL_MAX_QUEUE", 32))
+    HASH_POOL_QUEUE_TIMEOUT_MS = float(os.getenv("HASH_POOL_QUEUE_TIMEOUT_MS", 0))
+    HASH_RETRY_AFTER_SECONDS = int(os.getenv("HASH_RETRY_AFTER_SECONDS", 1))
 
     JWT_SECRET = os.getenv("JWT_SECRET", "super-secret-dev-key")
+
+    # Shared secret for /api/admin/* (X-Admin-Token); unset disables them
+    ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")
+    # Shared secret for /api/internal/* (X-Internal-Token); unset disables them
+    INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
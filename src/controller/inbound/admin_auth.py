@@ -0,0 +1,27 @@
+import hmac
+from ..outbound.http import HttpResponse
+
+
+def admin_denied(request, admin_token: str) -> HttpResponse | None:
+    """
+    Returns the error response for a request without the admin token in its
+    X-Admin-Token header, or None when the caller is allowed through.
+    With no token configured the admin routes do not exist (404).
+    """
+    return _token_denied(request, "X-Admin-Token", admin_token)
+
+
+def internal_denied(request, internal_token: str) -> HttpResponse | None:
+    """Same check for service-to-service routes (X-Internal-Token)."""
+    return _token_denied(request, "X-Internal-Token", internal_token)
+
+
+def _token_denied(request, header: str, token: str) -> HttpResponse | None:
+    if not token:
+        return HttpResponse({"error": "Not Found"}, status_code=404)
+
+    supplied = request.headers.get(header) or ""
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return HttpResponse({"error": "Forbidden"}, status_code=403)
+
+    return None
@@ -0,0 +1,30 @@
+from src.controller.outbound.response_models import ListedUserResponse
+from ..outbound.http import HttpResponse, StreamingHttpResponse
+from ...app.services.inbound.user_service import IUserService
+from .admin_auth import admin_denied
+
+
+# ----------------------------------------------------------------
+# Controller
+# ----------------------------------------------------------------
+class ExportUsersController:
+    """
+    GET /api/admin/users/export
+    Every user as one JSON object per line, streamed row by row from the
+    database, so memory use does not grow with the number of users.
+    """
+
+    def __init__(self, user_service: IUserService, admin_token: str):
+        self.user_service = user_service
+        self.admin_token = admin_token
+
+    def handle(self, request) -> HttpResponse:
+        denied = admin_denied(request, self.admin_token)
+        if denied:
+            return denied
+
+        lines = (
+            ListedUserResponse.from_dto(user).model_dump_json() + "\n"
+            for user in self.user_service.export_users()
+        )
+        return StreamingHttpResponse(lines, content_type="application/x-ndjson")
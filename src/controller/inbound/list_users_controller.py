@@ -0,0 +1,47 @@
+from src.app.domain.exceptions import UserDomainValidationError
+from src.controller.outbound.response_models import ListedUserResponse
+from ..outbound.http import HttpResponse
+from ...app.services.inbound.user_service import IUserService
+from .admin_auth import admin_denied
+
+
+# ----------------------------------------------------------------
+# Controller
+# ----------------------------------------------------------------
+class ListUsersController:
+    """
+    GET /api/admin/users?limit=100&after=<cursor>
+    Pass the returned nextCursor as `after` to fetch the following page.
+    """
+
+    def __init__(self, user_service: IUserService, admin_token: str):
+        self.user_service = user_service
+        self.admin_token = admin_token
+
+    def handle(self, request) -> HttpResponse:
+        denied = admin_denied(request, self.admin_token)
+        if denied:
+            return denied
+
+        try:
+            limit = int(request.args.get("limit", 100))
+            users, next_cursor = self.user_service.list_users(
+                limit, request.args.get("after")
+            )
+
+            body = {
+                "users": [
+                    ListedUserResponse.from_dto(user).model_dump(mode="json")
+                    for user in users
+                ],
+                "nextCursor": next_cursor,
+            }
+            return HttpResponse(body, status_code=200)
+
+        except (ValueError, UserDomainValidationError) as e:
+            # Bad limit or cursor
+            return HttpResponse({"error": str(e)}, status_code=400)
+
+        except Exception as e:
+            print("error occured ", str(e))
+            return HttpResponse({"error": "Internal Server Error"}, status_code=500)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ValidationError, EmailStr  # type: ignore
-from src.app.domain.exceptions import AuthenticationError
+from src.app.domain.exceptions import AuthenticationError, HashingOverloadedError
 from ..outbound.http import HttpResponse
 from ...app.services.inbound.user_service import IUserService
 from ...app.services.inbound.token_service import ITokenService
@@ -61,6 +61,11 @@ class LoginController:
         except AuthenticationError as e:
             return HttpResponse({"error": str(e)}, status_code=401)
 
+        except HashingOverloadedError as e:
+            response = HttpResponse({"error": str(e)}, status_code=503)
+            response.headers.append(("Retry-After", str(e.retry_after)))
+            return response
+
         except Exception as e:
             # Global fallback
             print(f"Unexpected Error: {e}")
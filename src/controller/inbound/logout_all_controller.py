@@ -0,0 +1,41 @@
+from src.app.domain.exceptions import TokenError
+
+from ..outbound.http import HttpResponse
+
+
+# ----------------------------------------------------------------
+# Logout Everywhere Controller
+# ----------------------------------------------------------------
+class LogoutAllController:
+    def __init__(self, token_service):
+        self.token_service = token_service
+
+    def handle(self, request) -> HttpResponse:
+        try:
+            # 1. Extract Token from Cookies
+            # The refresh token proves which user's sessions to revoke
+            token = request.cookies.get("refresh_token")
+
+            if not token:
+                return HttpResponse({"error": "Missing refresh token"}, status_code=401)
+
+            # 2. Revoke every session of the user (one counter increment)
+            self.token_service.logout_everywhere(token)
+
+            # 3. Build Response and clear this browser's cookies
+            response = HttpResponse(
+                {"message": "Logged out of every session"}, status_code=200
+            )
+            response.delete_cookie("access_token")
+            response.delete_cookie("refresh_token")
+
+            return response
+
+        except TokenError as e:
+            return HttpResponse({"error": str(e)}, status_code=401)
+
+        except Exception as e:
+            # Unlike a single logout this must not look successful: the other
+            # sessions would stay alive
+            print(f"Logout All Error: {e}")
+            return HttpResponse({"error": "Logout failed"}, status_code=500)
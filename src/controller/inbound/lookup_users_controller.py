@@ -0,0 +1,54 @@
+from pydantic import BaseModel, Field, ValidationError  # type: ignore
+from src.app.domain.exceptions import UserDomainValidationError
+from src.app.services.user_service import MAX_LOOKUP_IDS
+from src.controller.outbound.response_models import ListedUserResponse
+from ..outbound.http import HttpResponse
+from ...app.services.inbound.user_service import IUserService
+from .admin_auth import internal_denied
+
+
+# ----------------------------------------------------------------
+# Request Schema
+# ----------------------------------------------------------------
+class LookupUsersSchema(BaseModel):
+    ids: list[str] = Field(max_length=MAX_LOOKUP_IDS)
+
+
+# ----------------------------------------------------------------
+# Controller
+# ----------------------------------------------------------------
+class LookupUsersController:
+    """
+    POST /api/internal/users/lookup  {"ids": ["<uuid>", ...]}
+    For downstream services rendering lists of users: one call (and one
+    query) instead of one profile lookup per user.
+    """
+
+    def __init__(self, user_service: IUserService, internal_token: str):
+        self.user_service = user_service
+        self.internal_token = internal_token
+
+    def handle(self, request) -> HttpResponse:
+        denied = internal_denied(request, self.internal_token)
+        if denied:
+            return denied
+
+        try:
+            data = LookupUsersSchema(**request.json)
+            users, missing = self.user_service.fetch_users(data.ids)
+
+            body = {
+                "users": [
+                    ListedUserResponse.from_dto(user).model_dump(mode="json")
+                    for user in users
+                ],
+                "missing": missing,
+            }
+            return HttpResponse(body, status_code=200)
+
+        except (ValidationError, TypeError, UserDomainValidationError) as e:
+            return HttpResponse({"error": str(e)}, status_code=400)
+
+        except Exception as e:
+            print("error occured ", str(e))
+            return HttpResponse({"error": "Internal Server Error"}, status_code=500)
@@ -1,5 +1,9 @@
 from pydantic import BaseModel, EmailStr, model_validator  # type: ignore
-from src.app.domain.exceptions import UserDomainValidationError, EmailAlreadyExistsError
+from src.app.domain.exceptions import (
+    EmailAlreadyExistsError,
+    HashingOverloadedError,
+    UserDomainValidationError,
+)
 from src.controller.outbound.response_models import UserResponse
 from ..outbound.http import HttpResponse
 from ...app.services.inbound.user_service import IUserService
@@ -63,6 +67,11 @@ class RegisterController:
             # Catches duplicate users
             return HttpResponse({"error": str(e)}, status_code=409)
 
+        except HashingOverloadedError as e:
+            response = HttpResponse({"error": str(e)}, status_code=503)
+            response.headers.append(("Retry-After", str(e.retry_after)))
+            return response
+
         except Exception as e:
             print("error occured ", str(e))
             return HttpResponse({"error": "Internal Server Error"}, status_code=500)
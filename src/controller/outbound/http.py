@@ -47,3 +47,14 @@ class HttpResponse:
 
         # FIXED: Logic changed from dict-style lookup to simple list append
         self.headers.append(("Set-Cookie", cookie_str))
+
+
+class StreamingHttpResponse(HttpResponse):
+    """
+    Response whose body is an iterable of str chunks, sent to the client as
+    they are produced instead of being serialized to JSON up front.
+    """
+
+    def __init__(self, chunks, content_type, status_code=200):
+        super().__init__(chunks, status_code)
+        self.content_type = content_type
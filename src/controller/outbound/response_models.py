@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, EmailStr, ConfigDict  # type: ignore
 
 # ----------------------------------------------------------------
@@ -22,6 +23,20 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ListedUserResponse(BaseModel):
+    """One user in the admin listing / NDJSON export."""
+
+    id: str
+    # Stored, not user input: re-validating would reject existing rows on
+    # special-use domains (.test, .local) and fail a whole page or stream
+    email: str
+    createdAt: datetime
+
+    @classmethod
+    def from_dto(cls, user) -> "ListedUserResponse":
+        return cls(id=user.user_id, email=user.email, createdAt=user.created_at)
+
+
 # ----------------------------------------------------------------
 # Error Responses
 # ----------------------------------------------------------------
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from ...app.domain.user import User
 
 
@@ -6,6 +7,7 @@ from ...app.domain.user import User
 class UserDTO:
     email: str
     user_id: str
+    created_at: datetime | None = None
 
     @classmethod
     def from_domain(cls, user: User) -> "UserDTO":
@@ -14,5 +16,5 @@ class UserDTO:
         return cls(user_id=user.get_user_id, email=user.email)
 
     @classmethod
-    def create(cls, email: str, user_id: str):
-        return UserDTO(email, user_id)
+    def create(cls, email: str, user_id: str, created_at: datetime | None = None):
+        return UserDTO(email, user_id, created_at)
@@ -1,9 +1,43 @@
+from uuid import UUID
 from ..app.domain.user import User
 from ..repository.dbEntity.user import UserDB
 from ..app.services.hashing_service import Hasher
 
 
 class UserMapper:
+    @classmethod
+    def id_to_db(cls, user_id: str) -> bytes:
+        """
+        Canonical UUID string -> the 16 raw bytes stored in BINARY(16).
+        Raises ValueError if user_id is not a UUID.
+        """
+        return UUID(str(user_id)).bytes
+
+    @classmethod
+    def id_from_db(cls, raw: bytes | str) -> str:
+        """
+        BINARY(16) column value -> canonical UUID string.
+        Strings (rows not yet migrated from CHAR(36)) pass through unchanged.
+        """
+        if isinstance(raw, (bytes, bytearray)):
+            return str(UUID(bytes=bytes(raw)))
+        return raw
+
+    @classmethod
+    def ids_to_db(cls, ids: list[str]) -> dict[bytes, str]:
+        """
+        {BINARY(16) key: canonical string} for the valid, distinct ids;
+        anything that is not a UUID cannot exist and is dropped.
+        """
+        keys = {}
+        for user_id in ids:
+            try:
+                key = cls.id_to_db(user_id)
+            except ValueError:
+                continue
+            keys[key] = cls.id_from_db(key)
+        return keys
+
     @classmethod
     def domain_to_db(cls, user: User, hasher: Hasher) -> UserDB:
         """
@@ -29,7 +63,10 @@ class UserMapper:
         # Use your factory method (User.retrieve) to bypass validation
         print("mapping the user", user_id, email, password_hash)
         return UserDB(
-            id=user_id, email=email, password_hash=password_hash, created_at=createdAt
+            id=cls.id_from_db(user_id),
+            email=email,
+            password_hash=password_hash,
+            created_at=createdAt,
         )
 
     @classmethod
@@ -1,10 +1,15 @@
+from collections.abc import Callable
+
 from src.repository.inbound.dbExecuter import UserDBExecuter
 from src.app.services.inbound.hashing_service import Hasher
 
 
 class DatabaseProvider:
     def __init__(
-        self, db_config: dict, db_executer: UserDBExecuter, hasher_class: type[Hasher]
+        self,
+        db_config: dict,
+        db_executer: UserDBExecuter,
+        hasher_class: Callable[[], Hasher],
     ):
         self.executor = db_executer(db_config)
         self.hasher = hasher_class()
@@ -1,12 +1,156 @@
+import atexit
+
 import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+from src.cache.outbound.bucketed_cache import BucketedRedisCache
+from src.cache.outbound.invalidation_bus import RedisInvalidationBus
+from src.cache.outbound.local_cache import LocalTTLCache
+from src.cache.outbound.memory_cache import MemoryCache
 from src.cache.outbound.redis_cache import RedisCache
+from src.cache.outbound.sharded_cache import ShardedCache
+from src.cache.outbound.write_behind_cache import WriteBehindCache
+from src.cache.outbound.resilient_cache import (
+    FAIL_CLOSED,
+    UNAVAILABLE,
+    ResilientCache,
+)
+from src.resilience.circuit_breaker import CircuitBreaker
 
 
 class RedisProvider:
-    def __init__(self, host: str, port: int):
-        client = redis.Redis(
-            host=host,
-            port=port,
-            decode_responses=True,
-        )
-        self.cache = RedisCache(client)
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        connect_timeout: float | None = None,
+        timeout: float | None = None,
+        breaker_failures: int = 5,
+        breaker_reset_seconds: float = 10.0,
+        read_retries: int = 1,
+        fail_mode: str = FAIL_CLOSED,
+        max_connections: int = 50,
+        pool_timeout: float = 1.0,
+        health_check_interval: int = 30,
+        keepalive: bool = True,
+        key_prefix: str = "",
+        l1_max_entries: int = 0,
+        l1_negative_ttl: float = 1.0,
+        l1_generation_ttl: float = 5.0,
+        layout: str = "keys",
+        bucket_seconds: int = 6 * 3600,
+        bloom_bits: int = 1 << 22,
+        bloom_hashes: int = 7,
+        nodes: dict[str, dict] | None = None,
+        node_vnodes: int = 128,
+        backend: str = "redis",
+        memory_max_entries: int = 1_000_000,
+        snapshot_path: str = "",
+        write_behind: bool = False,
+        write_behind_max_pending: int = 10_000,
+        write_behind_max_batch: int = 500,
+        write_behind_interval: float = 0.05,
+    ):
+        # Connection pool per node name ("redis" when there is a single node)
+        self.pools: dict[str, redis.BlockingConnectionPool] = {}
+        # Plain client for other Redis users (profile cache); single node only
+        self.client = None
+
+        if backend == "memory":
+            # No Redis at all: single-process deployments and tests
+            self.pool = None
+            self.cache = MemoryCache(max_entries=memory_max_entries)
+            if snapshot_path:
+                restored = self.cache.restore(snapshot_path)
+                print(f"Restored {restored} revocations from {snapshot_path}")
+                atexit.register(self.cache.snapshot, snapshot_path)
+            return
+        if backend != "redis":
+            raise ValueError(f"Unknown cache backend: {backend}")
+
+        def node_cache(name: str, host: str, port: int) -> ResilientCache:
+            # Blocking pool: at most `max_connections` sockets per process; a
+            # request waits up to `pool_timeout` for a free one instead of opening
+            # connection after connection during a burst
+            pool = redis.BlockingConnectionPool(
+                host=host,
+                port=port,
+                max_connections=max_connections,
+                timeout=pool_timeout,
+                decode_responses=True,
+                socket_connect_timeout=connect_timeout,
+                socket_timeout=timeout,
+                socket_keepalive=keepalive,
+                # PING a connection idle for longer than this before reusing it
+                health_check_interval=health_check_interval,
+                # Retries are decided by ResilientCache (reads only, with jitter)
+                retry=Retry(NoBackoff(), 0),
+            )
+            self.pools[name] = pool
+            client = redis.Redis(connection_pool=pool)
+            if layout == "buckets":
+                cache = BucketedRedisCache(
+                    client,
+                    key_prefix,
+                    bucket_seconds=bucket_seconds,
+                    bloom_bits=bloom_bits,
+                    bloom_hashes=bloom_hashes,
+                )
+            elif layout == "keys":
+                cache = RedisCache(client, key_prefix)
+            else:
+                raise ValueError(f"Unknown blacklist layout: {layout}")
+
+            # Optional in-process L1; inside ResilientCache so fail-mode answers
+            # given while Redis is down are never cached
+            if l1_max_entries:
+                cache = LocalTTLCache(
+                    cache,
+                    max_entries=l1_max_entries,
+                    negative_ttl=l1_negative_ttl,
+                    bus=RedisInvalidationBus(client, f"{key_prefix}blacklist-revoked"),
+                    generation_ttl=l1_generation_ttl,
+                    generation_bus=RedisInvalidationBus(
+                        client, f"{key_prefix}generation-bumped"
+                    ),
+                )
+
+            return ResilientCache(
+                cache,
+                CircuitBreaker(
+                    name,
+                    failure_threshold=breaker_failures,
+                    reset_timeout=breaker_reset_seconds,
+                    failure_types=UNAVAILABLE,
+                ),
+                read_retries=read_retries,
+                fail_mode=fail_mode,
+            )
+
+        if not nodes:
+            self.cache = node_cache("redis", host, port)
+            self.pool = self.pools["redis"]
+            self.client = redis.Redis(connection_pool=self.pool)
+        else:
+            # Several nodes: each one gets its own pool, breaker and L1, so a
+            # node that is down only affects the JTIs it owns
+            self.cache = ShardedCache(
+                {
+                    name: node_cache(
+                        f"redis-{name}", node["host"], node.get("port", port)
+                    )
+                    for name, node in nodes.items()
+                },
+                node_vnodes,
+            )
+
+        # Outermost, so logout returns before Redis is written; pending
+        # revocations are written at exit
+        if write_behind:
+            self.cache = WriteBehindCache(
+                self.cache,
+                max_pending=write_behind_max_pending,
+                max_batch=write_behind_max_batch,
+                interval=write_behind_interval,
+            )
+            atexit.register(self.cache.drain)
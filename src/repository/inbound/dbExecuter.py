@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 
 class UserDBExecuter(ABC):
@@ -13,3 +14,98 @@ class UserDBExecuter(ABC):
     @abstractmethod
     def get_user_by_id(self, id: str):
         pass
+
+    def create_users(self, rows: list[tuple]) -> list[Exception | None]:
+        """
+        Inserts several (user_id, email, password_hash) rows.
+        Returns one entry per row: None if it was stored, otherwise the error
+        create_user would have raised for it (e.g. EmailAlreadyExistsError).
+
+        This default inserts row by row; executers override it to commit the
+        whole batch in one transaction.
+        """
+        results = []
+        for row in rows:
+            try:
+                self.create_user(*row)
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        """
+        {user_id: (email, created_at)} for the ids that exist; unknown or
+        malformed ids are simply absent. Keys are canonical UUID strings.
+
+        This default looks ids up one by one; executers override it with a
+        single IN (...) query.
+        """
+        found = {}
+        for user_id in ids:
+            row = self.get_user_by_id(user_id)
+            if row:
+                found[user_id] = (row["id"], row["createdAt"])
+        return found
+
+    def update_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        """
+        Replaces the user's password hash with `new_hash`, but only while it
+        is still `old_hash` (compare-and-set): a password change made in the
+        meantime is never overwritten. Returns whether the row was updated.
+        """
+        raise NotImplementedError()
+
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        """
+        One page of (id, email, created_at) rows ordered by (created_at, id),
+        starting after the (created_at, id) keyset cursor `after`.
+        """
+        raise NotImplementedError()
+
+    def iter_users(self) -> Iterator[tuple]:
+        """Every (id, email, created_at) row in (created_at, id) order, streamed."""
+        raise NotImplementedError()
+
+
+class UserShardExecuter(UserDBExecuter):
+    """
+    A UserDBExecuter that can act as one shard of a ShardedUserExecuter:
+    it also stores the email -> user id directory and supports the batched
+    row copies used when shards are added or removed.
+    """
+
+    @abstractmethod
+    def register_email(self, email: str, user_id: str):
+        pass
+
+    @abstractmethod
+    def lookup_email(self, email: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def delete_email(self, email: str):
+        pass
+
+    @abstractmethod
+    def scan_users(self, after_id: str, limit: int) -> list[tuple]:
+        """(id, email, password_hash, created_at) rows with id > after_id."""
+        pass
+
+    @abstractmethod
+    def scan_directory(self, after_email: str, limit: int) -> list[tuple]:
+        """(email, user_id) rows with email > after_email."""
+        pass
+
+    @abstractmethod
+    def copy_user(self, row: tuple):
+        """Inserts a scanned user row; a row that already exists is skipped."""
+        pass
+
+    @abstractmethod
+    def copy_directory_entry(self, row: tuple):
+        pass
+
+    @abstractmethod
+    def delete_user(self, id: str):
+        pass
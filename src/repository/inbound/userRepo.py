@@ -14,3 +14,15 @@ class UserRepoBase(ABC):
     @abstractmethod
     def get_user_by_id(self, id: str):
         pass
+
+    @abstractmethod
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        pass
+
+    @abstractmethod
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        pass
+
+    @abstractmethod
+    def iter_users(self):
+        pass
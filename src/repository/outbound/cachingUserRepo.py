@@ -0,0 +1,50 @@
+from src.app.domain.user import User
+from src.cache.inbound.profile_cache import IProfileCache
+from ..inbound.userRepo import UserRepoBase
+
+
+class CachingUserRepo(UserRepoBase):
+    """
+    Puts a profile cache (ProfileCache) in front of the id lookups of
+    another UserRepoBase, so `/api/auth/me` does not reach MySQL for every
+    call.
+
+    register (save) and login (validate_credentials) already know the id and
+    email, so they fill the cache: the first `/me` after either is a hit.
+    The email is cached lowercased, as the executers store it, so `/me`
+    answers the same whether it hits the cache or not.
+    Anything that changes a user's email must call invalidate(user_id).
+    """
+
+    def __init__(self, repo: UserRepoBase, profiles: IProfileCache):
+        self.repo = repo
+        self.profiles = profiles
+
+    def save(self, user: User):
+        saved = self.repo.save(user)
+        self.profiles.put(user.get_user_id, user.email.lower())
+        return saved
+
+    def validate_credentials(self, email: str, password: str) -> tuple[str, str]:
+        user_id, email = self.repo.validate_credentials(email, password)
+        # A login is no fresher than a profile read from the database: never
+        # let it replace one
+        self.profiles.put(user_id, email.lower(), replace=False)
+        return user_id, email
+
+    def get_user_by_id(self, id: str):
+        profile = self.profiles.get(id, lambda: self.repo.get_user_by_id(id))
+        return profile if profile is not None else (None, None)
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        return self.profiles.get_many(ids, self.repo.get_users_by_ids)
+
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        return self.repo.list_users(after, limit)
+
+    def iter_users(self):
+        return self.repo.iter_users()
+
+    def invalidate(self, user_id: str) -> None:
+        """Drops the user's cached profile everywhere (L1 of every process, L2)."""
+        self.profiles.invalidate(user_id)
@@ -0,0 +1,175 @@
+import os
+import threading
+import time
+from collections.abc import Iterator
+
+from src.telemetry.metrics.db_metrics import (
+    db_coalesced_batch_size,
+    db_coalesced_queue_wait,
+)
+from ..inbound.dbExecuter import UserDBExecuter
+
+
+class CoalescedWriteTimeoutError(Exception):
+    """Raised when a queued registration is not committed in time."""
+
+    pass
+
+
+class _PendingInsert:
+    __slots__ = ("row", "enqueued_at", "done", "error")
+
+    def __init__(self, row: tuple):
+        self.row = row
+        self.enqueued_at = time.monotonic()
+        self.done = threading.Event()
+        self.error = None
+
+
+class CoalescingUserExecuter(UserDBExecuter):
+    """
+    Opt-in group commit in front of another UserDBExecuter.
+
+    Concurrent create_user calls are queued; a flusher thread waits up to
+    `window` seconds after the first queued row (or until `max_batch` rows are
+    queued) and hands the whole batch to the wrapped executer's create_users,
+    i.e. one connection checkout and one commit for many registrations.
+    Each caller blocks until its batch is committed and gets its own outcome:
+    a duplicate row raises EmailAlreadyExistsError only in its own request.
+
+    A caller waits at most `window + timeout` seconds (a stuck or dead
+    flusher must not hold request threads forever), then gets
+    CoalescedWriteTimeoutError. A row still queued at that point is
+    dropped; one already in a batch may yet be committed.
+
+    Everything else is delegated to the wrapped executer unchanged.
+    """
+
+    def __init__(
+        self,
+        executer: UserDBExecuter,
+        window: float = 0.005,
+        max_batch: int = 50,
+        timeout: float = 10.0,
+    ):
+        self.executer = executer
+        self.window = window
+        self.max_batch = max_batch
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._queue: list[_PendingInsert] = []
+        self._flusher = None
+        self._pid = None
+
+    def __getattr__(self, name):
+        # Only called for attributes not defined here or on UserDBExecuter
+        # (sharding, scans, ...)
+        return getattr(self.executer, name)
+
+    def create_user(self, user_id: str, email: str, password_hash: str) -> None:
+        pending = _PendingInsert((user_id, email, password_hash))
+
+        with self._cond:
+            self._ensure_flusher()
+            self._queue.append(pending)
+            self._cond.notify()
+
+        if not pending.done.wait(self.window + self.timeout):
+            with self._cond:
+                if pending in self._queue:
+                    self._queue.remove(pending)
+            raise CoalescedWriteTimeoutError(
+                f"Registration not committed within {self.window + self.timeout}s"
+            )
+        if pending.error is not None:
+            raise pending.error
+
+    def create_users(self, rows: list[tuple]) -> list[Exception | None]:
+        # Already a batch (bulk import): no point queueing it row by row
+        return self.executer.create_users(rows)
+
+    def login_user(self, email: str) -> dict | None:
+        return self.executer.login_user(email)
+
+    def get_user_by_id(self, id: str) -> dict | None:
+        return self.executer.get_user_by_id(id)
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        return self.executer.get_users_by_ids(ids)
+
+    def update_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        return self.executer.update_password_hash(user_id, old_hash, new_hash)
+
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        return self.executer.list_users(after, limit)
+
+    def iter_users(self) -> Iterator[tuple]:
+        return self.executer.iter_users()
+
+    def _ensure_flusher(self):
+        """
+        Starts the flusher thread (again, in a forked worker or after it
+        died). Holds _cond.
+        """
+        forked = self._pid != os.getpid()
+        if self._flusher is not None and not forked:
+            return
+        if forked:
+            # Rows queued by the parent belong to its callers, not ours
+            self._queue = []
+        self._pid = os.getpid()
+        self._flusher = threading.Thread(
+            target=self._run, name="db-write-coalescer", daemon=True
+        )
+        self._flusher.start()
+
+    def _run(self):
+        try:
+            while True:
+                self._flush(self._next_batch())
+        finally:
+            # Dying (a flush raised past its own handler): rows queued since
+            # go to a new flusher instead of waiting out their timeout
+            with self._cond:
+                self._flusher = None
+                if self._queue:
+                    self._ensure_flusher()
+
+    def _next_batch(self) -> list[_PendingInsert]:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            # The window starts when the oldest queued row arrived
+            deadline = self._queue[0].enqueued_at + self.window
+            while len(self._queue) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = self._queue[: self.max_batch]
+            del self._queue[: self.max_batch]
+            return batch
+
+    def _flush(self, batch: list[_PendingInsert]):
+        errors = []
+        try:
+            flushed_at = time.monotonic()
+            for pending in batch:
+                db_coalesced_queue_wait.observe(flushed_at - pending.enqueued_at)
+            db_coalesced_batch_size.observe(len(batch))
+
+            errors = self.executer.create_users([pending.row for pending in batch])
+        except Exception as e:
+            # The whole batch failed (e.g. the database is unreachable)
+            errors = [e] * len(batch)
+        finally:
+            # Release every caller, even if the flusher itself is going down
+            for i, pending in enumerate(batch):
+                if i < len(errors):
+                    pending.error = errors[i]
+                else:
+                    pending.error = RuntimeError("Batch was not written")
+                pending.done.set()
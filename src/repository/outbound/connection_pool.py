@@ -0,0 +1,234 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Callable
+
+from src.resilience.circuit_breaker import CircuitBreaker
+
+from src.telemetry.metrics.db_metrics import (
+    db_connect_errors,
+    db_pool_checkout_latency,
+    db_pool_in_use,
+    db_pool_idle,
+    db_pool_timeouts,
+)
+from src.telemetry.metrics.query_instrumentation import error_code
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection frees up before the checkout timeout."""
+
+    pass
+
+
+class PooledConnection:
+    """
+    A raw DB connection plus the bookkeeping the pool needs to decide
+    whether it is still safe to hand out.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        # Server-side prepared statements live as long as the connection does
+        self.statements: dict = {}
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB connections.
+
+    - `size` connections are kept open between requests.
+    - Up to `max_overflow` extra connections are opened under bursts and
+      closed again as soon as they are returned.
+    - Callers wait at most `timeout` seconds for a connection before
+      PoolTimeoutError is raised (fail fast instead of piling up threads).
+    - Connections older than `recycle` seconds are replaced on checkout, and
+      `pre_ping` checks liveness before a connection is handed out.
+    - The pool notices when it is used from a forked worker and starts over,
+      so Gunicorn workers never share sockets with the master process.
+    - With a `breaker`, every checkout counts as one call through it: while
+      the breaker is open, checkouts fail fast with CircuitOpenError.
+    - `metrics=False` skips every Prometheus update on the checkout path.
+    """
+
+    def __init__(
+        self,
+        creator: Callable,
+        size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 5.0,
+        recycle: float = 1800,
+        pre_ping: bool = False,
+        name: str = "primary",
+        breaker: CircuitBreaker | None = None,
+        metrics: bool = True,
+    ):
+        self.creator = creator
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.name = name
+        self.breaker = breaker
+        self.metrics = metrics
+
+        self._init_state()
+
+    def _init_state(self):
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._idle: deque[PooledConnection] = deque()
+        self._checked_out = 0
+
+    # ----------------------------------------------------------------
+    # Public API
+    # ----------------------------------------------------------------
+    @property
+    def checked_out(self) -> int:
+        return self._checked_out
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks a connection out for the duration of the `with` block.
+        If the block raises, the open transaction is rolled back; a connection
+        that cannot even roll back is considered broken and discarded.
+        """
+        with self.checkout() as pooled:
+            yield pooled.raw
+
+    @contextmanager
+    def checkout(self):
+        """Same as connection(), but yields the PooledConnection wrapper."""
+        with self.guarded():
+            pooled = self.acquire()
+            try:
+                yield pooled
+            except BaseException:
+                self.release(pooled, discard=not self._rollback(pooled))
+                raise
+            else:
+                self.release(pooled)
+
+    def guarded(self):
+        """The breaker's guard() for one call, or a no-op without a breaker."""
+        return self.breaker.guard() if self.breaker else nullcontext()
+
+    def acquire(self) -> PooledConnection:
+        self._check_fork()
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+
+                if self._checked_out < self.size + self.max_overflow:
+                    pooled = None
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    if self.metrics:
+                        db_pool_timeouts.labels(pool=self.name).inc()
+                    raise PoolTimeoutError(
+                        f"Timed out after {self.timeout}s waiting for a "
+                        f"'{self.name}' DB connection"
+                    )
+                self._cond.wait(remaining)
+
+            # Reserve the slot before doing any I/O outside the lock
+            self._checked_out += 1
+
+        try:
+            if pooled is None or not self._is_usable(pooled):
+                if pooled is not None:
+                    self._close(pooled)
+                pooled = PooledConnection(self.creator())
+        except BaseException as e:
+            with self._cond:
+                self._checked_out -= 1
+                self._cond.notify()
+            if self.metrics:
+                db_connect_errors.labels(pool=self.name, errno=error_code(e)).inc()
+            self._report()
+            raise
+
+        if self.metrics:
+            db_pool_checkout_latency.labels(pool=self.name).observe(
+                time.monotonic() - start
+            )
+        self._report()
+        return pooled
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        if os.getpid() != self._pid:
+            # Checked out before a fork; it belongs to the parent process.
+            return
+
+        with self._cond:
+            self._checked_out -= 1
+            keep = not discard and len(self._idle) < self.size
+            if keep:
+                self._idle.append(pooled)
+            self._cond.notify()
+
+        if not keep:
+            self._close(pooled)
+        self._report()
+
+    def dispose(self) -> None:
+        """Closes every idle connection (e.g. on shutdown)."""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+        for pooled in idle:
+            self._close(pooled)
+        self._report()
+
+    # ----------------------------------------------------------------
+    # Internals
+    # ----------------------------------------------------------------
+    def _check_fork(self):
+        if os.getpid() != self._pid:
+            # Sockets inherited from the parent must not be closed here
+            # (that would send COM_QUIT on the parent's session); drop them.
+            self._init_state()
+
+    def _is_usable(self, pooled: PooledConnection) -> bool:
+        if self.recycle and time.monotonic() - pooled.created_at > self.recycle:
+            return False
+        if self.pre_ping:
+            try:
+                pooled.raw.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def _rollback(self, pooled: PooledConnection) -> bool:
+        try:
+            pooled.raw.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _close(self, pooled: PooledConnection):
+        try:
+            pooled.raw.close()
+        except Exception:
+            pass
+
+    def _report(self):
+        if not self.metrics:
+            return
+        db_pool_in_use.labels(pool=self.name).set(self._checked_out)
+        db_pool_idle.labels(pool=self.name).set(len(self._idle))
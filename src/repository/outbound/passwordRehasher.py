@@ -0,0 +1,80 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.app.domain.exceptions import HashingOverloadedError
+from src.telemetry.metrics.hashing_metrics import password_rehashes
+from ..inbound.dbExecuter import UserDBExecuter
+from ...app.services.inbound.hashing_service import Hasher
+
+
+class PasswordRehasher:
+    """
+    Upgrades stored password hashes to the current hashing policy (e.g. a
+    new bcrypt cost) after a successful login, when the plaintext password
+    is known, without making that login wait.
+
+    schedule() hands the rehash and the DB update to a background thread
+    and returns. The update is a compare-and-set on the hash that was just
+    verified, so a password changed in the meantime is kept.
+
+    A rehash is skipped ("deferred", the next login tries again) when the
+    hasher is saturated, when the user already has one pending, or when
+    `max_pending` are already waiting: upgrading old hashes must never
+    compete with logins for hashing capacity.
+    """
+
+    def __init__(
+        self, executer: UserDBExecuter, hasher: Hasher, max_pending: int = 100
+    ):
+        self.executer = executer
+        self.hasher = hasher
+        self.max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._pool = None
+        self._pid = None
+
+    def schedule(self, user_id: str, password: str, password_hash: str) -> bool:
+        """Queues a rehash of the user's password; False if it was deferred."""
+        if self.hasher.is_saturated():
+            password_rehashes.labels(outcome="deferred").inc()
+            return False
+
+        with self._lock:
+            pool = self._ensure_pool()
+            if user_id in self._pending or len(self._pending) >= self.max_pending:
+                password_rehashes.labels(outcome="deferred").inc()
+                return False
+            self._pending.add(user_id)
+            pool.submit(self._rehash, user_id, password, password_hash)
+        return True
+
+    def _rehash(self, user_id: str, password: str, password_hash: str):
+        try:
+            new_hash = self.hasher.hash_password(password)
+            if self.executer.update_password_hash(user_id, password_hash, new_hash):
+                password_rehashes.labels(outcome="ok").inc()
+            else:
+                # The password was changed since the login that verified it
+                password_rehashes.labels(outcome="stale").inc()
+        except HashingOverloadedError:
+            password_rehashes.labels(outcome="deferred").inc()
+        except Exception as e:
+            password_rehashes.labels(outcome="error").inc()
+            print(f"Password rehash failed for {user_id}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(user_id)
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        """The background thread (a new one in a forked worker). Holds _lock."""
+        if self._pool is None or self._pid != os.getpid():
+            # Rehashes queued by the parent are the parent's to run
+            self._pending = set()
+            self._pid = os.getpid()
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="password-rehash"
+            )
+        return self._pool
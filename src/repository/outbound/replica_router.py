@@ -0,0 +1,106 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+
+from src.telemetry.metrics.db_metrics import db_replica_ejections
+from .connection_pool import ConnectionPool
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+
+class ReplicaRouter:
+    """
+    Picks the replica pool that should serve the next read.
+
+    A replica that fails at the connection level is ejected for
+    `eject_seconds`; once that expires it is simply tried again, and ejected
+    again if it is still down. When no replica is healthy, choose() returns
+    None and the caller falls back to the primary.
+    """
+
+    def __init__(
+        self,
+        pools: list[ConnectionPool],
+        strategy: str = ROUND_ROBIN,
+        eject_seconds: float = 30.0,
+    ):
+        if strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+
+        self.pools = pools
+        self.strategy = strategy
+        self.eject_seconds = eject_seconds
+
+        self._lock = threading.Lock()
+        self._ejected_until: dict[str, float] = {}
+        self._counter = itertools.count()
+
+    def choose(self) -> ConnectionPool | None:
+        healthy = self.healthy()
+        if not healthy:
+            return None
+
+        # Rotating the start index keeps least_loaded fair when loads are tied
+        start = next(self._counter) % len(healthy)
+        rotated = healthy[start:] + healthy[:start]
+
+        if self.strategy == LEAST_LOADED:
+            return min(rotated, key=lambda pool: pool.checked_out)
+        return rotated[0]
+
+    def healthy(self) -> list[ConnectionPool]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                pool
+                for pool in self.pools
+                if self._ejected_until.get(pool.name, 0) <= now
+            ]
+
+    def eject(self, pool: ConnectionPool) -> None:
+        with self._lock:
+            self._ejected_until[pool.name] = time.monotonic() + self.eject_seconds
+        db_replica_ejections.labels(pool=pool.name).inc()
+        # Whatever is idle in the pool is most likely dead as well
+        pool.dispose()
+
+
+class ReadYourWrites:
+    """
+    Remembers recently written keys (user id, email) for `window` seconds so
+    reads for them go to the primary instead of a possibly lagging replica.
+
+    The memory is per process: it covers the common "register, then log in
+    straight away" flow handled by the same worker.
+    """
+
+    def __init__(self, window: float = 5.0):
+        self.window = window
+        self._lock = threading.Lock()
+        self._pinned: OrderedDict[str, float] = OrderedDict()
+
+    def pin(self, *keys: str) -> None:
+        if self.window <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            # Pins are kept in expiry order (constant window), so expired
+            # ones are always at the front and pruning stays O(1) amortized
+            while self._pinned:
+                oldest = next(iter(self._pinned))
+                if self._pinned[oldest] > now:
+                    break
+                del self._pinned[oldest]
+            for key in keys:
+                self._pinned[key] = now + self.window
+                self._pinned.move_to_end(key)
+
+    def is_pinned(self, key: str | None) -> bool:
+        if key is None:
+            return False
+        with self._lock:
+            expires_at = self._pinned.get(key)
+        return expires_at is not None and expires_at > time.monotonic()
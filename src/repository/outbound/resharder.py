@@ -0,0 +1,96 @@
+from src.utils.hash_ring import HashRing
+from src.telemetry.metrics.db_metrics import db_shard_moved_rows
+from ..inbound.dbExecuter import UserShardExecuter
+
+
+class Resharder:
+    """
+    Moves rows after the shard list changes, in two restartable phases:
+
+    1. copy    - every row whose owner differs between the old and the new
+                 ring is copied to its new owner (INSERT IGNORE, so re-runs
+                 are harmless). Deploy the new shard list afterwards.
+    2. cleanup - every shard deletes the rows it no longer owns under the
+                 new ring, copying each one to its new owner first: a row
+                 written to its old owner after the copy phase (before the
+                 new shard list was live) is moved, not lost.
+
+    Both phases walk each table by primary key in batches (keyset scans),
+    so they never hold more than `batch_size` rows in memory.
+    """
+
+    def __init__(
+        self,
+        shards: dict[str, UserShardExecuter],
+        old_nodes: list[str],
+        new_nodes: list[str],
+        vnodes: int = 128,
+        batch_size: int = 500,
+    ):
+        self.shards = shards
+        self.old_ring = HashRing(old_nodes, vnodes)
+        self.new_ring = HashRing(new_nodes, vnodes)
+        self.batch_size = batch_size
+
+    def copy(self, dry_run: bool = False) -> dict[str, int]:
+        """Returns the number of moved rows per table."""
+        moved = {"users": 0, "user_directory": 0}
+
+        for name in self.old_ring.nodes:
+            shard = self.shards[name]
+
+            for row in self._scan(shard.scan_users):
+                owner = self.new_ring.node_for(str(row[0]))
+                if owner != name:
+                    moved["users"] += 1
+                    if not dry_run:
+                        self.shards[owner].copy_user(row)
+                        db_shard_moved_rows.labels(shard=owner, table="users").inc()
+
+            for row in self._scan(shard.scan_directory):
+                owner = self.new_ring.node_for(str(row[0]).lower())
+                if owner != name:
+                    moved["user_directory"] += 1
+                    if not dry_run:
+                        self.shards[owner].copy_directory_entry(row)
+                        db_shard_moved_rows.labels(
+                            shard=owner, table="user_directory"
+                        ).inc()
+
+        return moved
+
+    def cleanup(self, dry_run: bool = False) -> dict[str, int]:
+        """Returns the number of deleted rows per table."""
+        deleted = {"users": 0, "user_directory": 0}
+
+        for name in set(self.old_ring.nodes) | set(self.new_ring.nodes):
+            shard = self.shards[name]
+
+            for row in self._scan(shard.scan_users):
+                owner = self.new_ring.node_for(str(row[0]))
+                if owner != name:
+                    deleted["users"] += 1
+                    if not dry_run:
+                        # INSERT IGNORE: a no-op unless copy() missed the row
+                        self.shards[owner].copy_user(row)
+                        shard.delete_user(row[0])
+
+            for row in self._scan(shard.scan_directory):
+                owner = self.new_ring.node_for(str(row[0]).lower())
+                if owner != name:
+                    deleted["user_directory"] += 1
+                    if not dry_run:
+                        self.shards[owner].copy_directory_entry(row)
+                        shard.delete_email(row[0])
+
+        return deleted
+
+    def _scan(self, scan):
+        """Keyset-paginates `scan(after_key, limit)` over a whole table."""
+        after = ""
+        while True:
+            rows = scan(after, self.batch_size)
+            yield from rows
+            if len(rows) < self.batch_size:
+                return
+            after = rows[-1][0]
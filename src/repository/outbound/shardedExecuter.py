@@ -0,0 +1,117 @@
+import heapq
+from collections.abc import Iterator
+
+from ..inbound.dbExecuter import UserDBExecuter, UserShardExecuter
+from src.utils.hash_ring import HashRing
+from src.telemetry.metrics.db_metrics import db_shard_operations
+from src.mapper.user_mapper import UserMapper
+from .sqlExecuter import UserSQLExecuter
+
+# AppConfig.DB keys that describe the fleet rather than a single shard
+FLEET_OPTIONS = ("shards", "shard_vnodes", "replicas")
+
+
+def listing_order(row: tuple) -> tuple:
+    """(id, email, created_at) rows sort by (created_at, id) on every shard."""
+    return row[2], row[0]
+
+
+class ShardedUserExecuter(UserDBExecuter):
+    """
+    Spreads users over several databases with a consistent hash ring.
+
+    - A user row lives on the shard that owns hash(user id), so
+      get_user_by_id is a single lookup on a single shard.
+    - The email -> user id directory entry lives on the shard that owns
+      hash(email). Its primary key is what keeps emails unique across the
+      whole fleet, and login_user resolves the id through it first.
+
+    Shards are identified by name, so reordering the config never moves
+    data, and adding a shard only moves the keys it takes over (see
+    Resharder).
+    """
+
+    def __init__(self, shards: dict[str, UserShardExecuter], vnodes: int = 128):
+        self.shards = shards
+        self.ring = HashRing(list(shards), vnodes)
+
+    @classmethod
+    def from_config(cls, db_config: dict) -> "ShardedUserExecuter":
+        """
+        Builds one UserSQLExecuter per entry of db_config["shards"]; every
+        shard inherits credentials, pool and query mode from the base config.
+        """
+        base = {k: v for k, v in db_config.items() if k not in FLEET_OPTIONS}
+        shards = {
+            name: UserSQLExecuter({**base, "pool_name": f"shard-{name}", **shard})
+            for name, shard in db_config["shards"].items()
+        }
+        return cls(shards, db_config.get("shard_vnodes", 128))
+
+    def shard_for_id(self, user_id: str) -> str:
+        return self.ring.node_for(str(user_id))
+
+    def shard_for_email(self, email: str) -> str:
+        return self.ring.node_for(email.lower())
+
+    def create_user(self, user_id: str, email: str, password_hash: str) -> None:
+        # 1. Claim the email first: raises EmailAlreadyExistsError fleet-wide
+        directory = self._shard(self.shard_for_email(email), "register_email")
+        directory.register_email(email, user_id)
+
+        # 2. Store the user row; release the email again if that fails
+        try:
+            self._shard(self.shard_for_id(user_id), "create_user").create_user(
+                user_id, email, password_hash
+            )
+        except Exception:
+            directory.delete_email(email)
+            raise
+
+    def login_user(self, email: str) -> dict | None:
+        user_id = self._shard(self.shard_for_email(email), "lookup_email").lookup_email(
+            email
+        )
+
+        if user_id is None:
+            return None
+
+        return self._shard(self.shard_for_id(user_id), "login_user").login_user(email)
+
+    def get_user_by_id(self, id: str) -> dict | None:
+        return self._shard(self.shard_for_id(id), "get_user_by_id").get_user_by_id(id)
+
+    def update_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        return self._shard(
+            self.shard_for_id(user_id), "update_password_hash"
+        ).update_password_hash(user_id, old_hash, new_hash)
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        # One IN (...) query per shard that owns at least one of the ids
+        by_shard: dict[str, list[str]] = {}
+        for user_id in UserMapper.ids_to_db(ids).values():
+            by_shard.setdefault(self.shard_for_id(user_id), []).append(user_id)
+
+        found = {}
+        for name, shard_ids in by_shard.items():
+            found.update(
+                self._shard(name, "get_users_by_ids").get_users_by_ids(shard_ids)
+            )
+        return found
+
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        # Each shard returns its own first `limit` rows past the cursor; the
+        # global page is the first `limit` of their merge
+        pages = [
+            self._shard(name, "list_users").list_users(after, limit)
+            for name in self.shards
+        ]
+        return list(heapq.merge(*pages, key=listing_order))[:limit]
+
+    def iter_users(self) -> Iterator[tuple]:
+        streams = [self._shard(name, "iter_users").iter_users() for name in self.shards]
+        yield from heapq.merge(*streams, key=listing_order)
+
+    def _shard(self, name: str, operation: str) -> UserShardExecuter:
+        db_shard_operations.labels(shard=name, operation=operation).inc()
+        return self.shards[name]
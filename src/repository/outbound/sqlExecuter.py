@@ -1,85 +1,510 @@
-from ..inbound.dbExecuter import UserDBExecuter
+from ..inbound.dbExecuter import UserShardExecuter
 
 # Ensure this matches the exception name used in your Controller!
 
 
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import partial
+
 import mysql.connector
+from mysql.connector import errorcode
 
 # Ensure this matches the exception name used in your Controller!
 from src.app.domain.exceptions import EmailAlreadyExistsError
+from src.mapper.user_mapper import UserMapper
+from src.telemetry.metrics.db_metrics import db_reads_routed
+from src.telemetry.metrics.query_instrumentation import QueryInstrumentation
+from src.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.resilience.retry import retry_call
+from .connection_pool import ConnectionPool, PoolTimeoutError
+from .replica_router import ReplicaRouter, ReadYourWrites, ROUND_ROBIN
+
+
+# AppConfig.DB keys that configure the pool rather than mysql.connector.connect
+POOL_OPTIONS = {
+    "pool_size": "size",
+    "pool_max_overflow": "max_overflow",
+    "pool_timeout": "timeout",
+    "pool_recycle": "recycle",
+    "pool_pre_ping": "pre_ping",
+}
+
+
+# Failures that say "this server is unreachable", not "this query is wrong";
+# only these count against a pool's circuit breaker
+SERVER_FAILURES = (
+    mysql.connector.errors.InterfaceError,
+    mysql.connector.errors.OperationalError,
+)
+# A PoolTimeoutError is this process running out of connections (local
+# load, not a sick server): the call fails, but the breaker ignores it
+UNAVAILABLE = SERVER_FAILURES + (PoolTimeoutError,)
+REPLICA_FAILURES = UNAVAILABLE + (CircuitOpenError,)
+
+# Worth retrying for an idempotent read: a dropped or timed-out connection.
+# Not PoolTimeoutError (the pool already waited) or an open circuit.
+RETRYABLE_READ_ERRORS = (
+    mysql.connector.errors.InterfaceError,
+    mysql.connector.errors.OperationalError,
+)
+
+# Query modes (AppConfig.DB["query_mode"])
+PROCEDURE_MODE = "procedure"  # CALL the stored procedures in db/init.sql
+PREPARED_MODE = "prepared"  # Server-side prepared statements, cached per connection
+QUERY_MODES = (PROCEDURE_MODE, PREPARED_MODE)
+
+# Unique keys that guard email uniqueness. MySQL 8 names them
+# "<table>.<key>"; the bare "email" is the pre-8.0.19 spelling.
+# A duplicate on users.PRIMARY is an id clash, not a taken email.
+EMAIL_UNIQUE_KEYS = {"users.email", "email", "user_directory.PRIMARY"}
+
+# "Duplicate entry 'a@b.c' for key 'users.email'"
+DUPLICATE_KEY = re.compile(r"for key '([^']+)'")
+
+# SIGNAL text of the old create_user procedure (before db/migrations/004)
+LEGACY_EMAIL_TAKEN = "email already registered"
 
 
 class SQLExecutor:
     def __init__(self, db_config):
-        self.db_config = db_config
+        connect_args = dict(db_config)
+        pool_args = {
+            option: connect_args.pop(key)
+            for key, option in POOL_OPTIONS.items()
+            if key in connect_args
+        }
+
+        pool_name = connect_args.pop("pool_name", "primary")
+        self.query_mode = connect_args.pop("query_mode", PROCEDURE_MODE)
+        if self.query_mode not in QUERY_MODES:
+            raise ValueError(f"Unknown query mode: {self.query_mode}")
+
+        replica_configs = connect_args.pop("replicas", [])
+        replica_strategy = connect_args.pop("replica_strategy", ROUND_ROBIN)
+        replica_eject_seconds = connect_args.pop("replica_eject_seconds", 30.0)
+        read_your_writes_seconds = connect_args.pop("read_your_writes_seconds", 5.0)
+
+        breaker_failures = connect_args.pop("breaker_failures", 5)
+        breaker_reset_seconds = connect_args.pop("breaker_reset_seconds", 30.0)
+        self.read_retries = connect_args.pop("read_retries", 0)
+
+        metrics = connect_args.pop("metrics", True)
+        slow_query_ms = connect_args.pop("slow_query_ms", None)
+        self.instrumentation = QueryInstrumentation(
+            metrics, slow_query_ms / 1000 if slow_query_ms else None
+        )
+        pool_args["metrics"] = metrics
+
+        def breaker(name):
+            return CircuitBreaker(
+                f"mysql-{name}",
+                failure_threshold=breaker_failures,
+                reset_timeout=breaker_reset_seconds,
+                failure_types=SERVER_FAILURES,
+                ignore_types=(PoolTimeoutError,),
+            )
+
+        # Pooled connections outlive a single call, so reads must not leave a
+        # REPEATABLE READ snapshot open for the next borrower to see.
+        self.db_config = {"autocommit": True, **connect_args}
+        self.pool = ConnectionPool(
+            self._get_connection,
+            name=pool_name,
+            breaker=breaker(pool_name),
+            **pool_args,
+        )
+
+        # Replicas inherit credentials/options from the primary config
+        self.replicas = ReplicaRouter(
+            [
+                ConnectionPool(
+                    partial(self._connect, {**self.db_config, **replica}),
+                    name=f"{pool_name}-replica-{index}",
+                    breaker=breaker(f"{pool_name}-replica-{index}"),
+                    **pool_args,
+                )
+                for index, replica in enumerate(replica_configs)
+            ],
+            strategy=replica_strategy,
+            eject_seconds=replica_eject_seconds,
+        )
+        self.read_your_writes = ReadYourWrites(read_your_writes_seconds)
 
     def _get_connection(self):
-        return mysql.connector.connect(**self.db_config)
+        return self._connect(self.db_config)
+
+    def _connect(self, config: dict):
+        return mysql.connector.connect(**config)
+
+    def _read(self, read, sticky_key: str | None = None):
+        """
+        Runs `read(pool)` on a replica when one is healthy, otherwise on the
+        primary. Keys written moments ago (see ReadYourWrites) always read
+        from the primary. A replica that fails to connect is ejected and the
+        read is retried once on the primary.
+
+        Reads are idempotent, so a dropped connection on the primary is
+        retried up to `read_retries` times with jittered backoff.
+        """
+        return retry_call(
+            lambda: self._read_once(read, sticky_key),
+            retries=self.read_retries,
+            retry_on=RETRYABLE_READ_ERRORS,
+            name=f"mysql-{self.pool.name}",
+        )
+
+    def _read_once(self, read, sticky_key: str | None):
+        pool = None
+        if not self.read_your_writes.is_pinned(sticky_key):
+            pool = self.replicas.choose()
+
+        if pool is not None:
+            try:
+                row = read(pool)
+                db_reads_routed.labels(pool=pool.name).inc()
+                return row
+            except REPLICA_FAILURES:
+                self.replicas.eject(pool)
+
+        row = read(self.pool)
+        db_reads_routed.labels(pool=self.pool.name).inc()
+        return row
 
     def execute_write(self, procedure_name: str, args: tuple) -> int | None:
         """
         Executes an INSERT/UPDATE procedure.
         Returns: The generated ID (if any), or None.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        generated_id = None
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            generated_id = None
 
-        try:
-            # 1. Execute
-            cursor.callproc(procedure_name, args)
+            try:
+                with self.instrumentation.observe(procedure_name):
+                    # 1. Execute
+                    cursor.callproc(procedure_name, args)
 
-            # 2. Fetch Generated ID
-            for result in cursor.stored_results():
-                row = result.fetchone()
-                if row:
-                    generated_id = row[0]
+                    # 2. Fetch Generated ID
+                    for result in cursor.stored_results():
+                        row = result.fetchone()
+                        if row:
+                            generated_id = row[0]
 
-            # 3. Commit
-            conn.commit()
-            return generated_id
+                    # 3. Commit
+                    conn.commit()
+                return generated_id
 
-        # CRITICAL FIX: Catch the base 'Error' class, not just IntegrityError.
-        # Custom signals (SQLSTATE 45000) often raise generic Errors.
-        except mysql.connector.Error as e:
+            # CRITICAL FIX: Catch the base 'Error' class, not just IntegrityError.
+            # Custom signals (SQLSTATE 45000) often raise generic Errors.
+            except mysql.connector.Error as e:
+                self._raise_write_error(e)
 
-            error_msg = str(e).lower()
+            finally:
+                cursor.close()
 
-            # Check for your custom signal OR the standard MySQL duplicate code (1062)
-            if "email already registered" in error_msg or e.errno == 1062:
-                raise EmailAlreadyExistsError("User with this email already exists")
+    def execute_read_one(
+        self, procedure_name: str, args: tuple, sticky_key: str | None = None
+    ) -> tuple | None:
+        """
+        Executes a SELECT procedure (on a replica when configured).
+        Returns: A single raw row (tuple) or None.
+        """
+        return self._read(
+            lambda pool: self._call_read_one(pool, procedure_name, args), sticky_key
+        )
 
-            # If it's a different error, let it crash (results in 500)
-            raise e
+    def _call_read_one(self, pool, procedure_name: str, args: tuple) -> tuple | None:
+        with pool.connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                with self.instrumentation.observe(procedure_name) as query:
+                    cursor.callproc(procedure_name, args)
+
+                    found = None
+                    for result in cursor.stored_results():
+                        row = result.fetchone()
+                        if row:
+                            found = row
+                            break
+
+                    query.rows = 1 if found else 0
+                return found
+
+            finally:
+                cursor.close()
+
+    def execute_statement_write(
+        self, sql: str, args: tuple, query: str = "statement"
+    ) -> int:
+        """
+        Executes an INSERT/UPDATE as a server-side prepared statement.
+        `query` names it in metrics and the slow query log.
+        Returns: The number of affected rows.
+        """
+        with self.pool.checkout() as pooled:
+            cursor = self._prepared_cursor(pooled, sql)
+
+            try:
+                with self.instrumentation.observe(query) as observed:
+                    cursor.execute(sql, args)
+                    pooled.raw.commit()
+                    observed.rows = cursor.rowcount
+                return cursor.rowcount
 
-        finally:
-            cursor.close()
-            conn.close()
+            except mysql.connector.Error as e:
+                self._forget_statement(pooled, sql)
+                self._raise_write_error(e)
 
-    def execute_read_one(self, procedure_name: str, args: tuple) -> tuple | None:
+    @contextmanager
+    def transaction(self):
+        """
+        Runs several statements on one pooled connection as a single
+        transaction: committed when the block exits, rolled back (by the pool)
+        if it raises.
+        """
+        with self.pool.connection() as conn:
+            conn.start_transaction()
+            yield conn
+            conn.commit()
+
+    def execute_batch_write(
+        self, sql: str, rows: list[tuple], query: str = "batch_write"
+    ) -> int:
+        """
+        Expands a single-row "INSERT ... VALUES (...)" into one multi-row
+        INSERT over `rows`. All rows are stored or none is; driver errors are
+        raised unmapped so the caller can fall back to execute_each_write.
+        Returns: The number of affected rows.
+        """
+        head, values = sql.split(" VALUES ")
+        batch_sql = f"{head} VALUES " + ", ".join([values] * len(rows))
+
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            try:
+                with self.instrumentation.observe(query) as observed:
+                    cursor.execute(batch_sql, tuple(arg for row in rows for arg in row))
+                    observed.rows = cursor.rowcount
+                return cursor.rowcount
+            finally:
+                cursor.close()
+
+    def execute_each_write(
+        self, sql: str, rows: list[tuple], query: str = "each_write"
+    ) -> list[Exception | None]:
+        """
+        Runs `sql` once per row inside one transaction, each row behind its own
+        SAVEPOINT, so a failing row is undone on its own and the rest still
+        commit together.
+        Returns: None per stored row, the mapped error per failed row.
+        """
+        results = []
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            try:
+                for args in rows:
+                    cursor.execute("SAVEPOINT batch_row")
+                    try:
+                        with self.instrumentation.observe(query):
+                            cursor.execute(sql, args)
+                        results.append(None)
+                    except mysql.connector.Error as e:
+                        cursor.execute("ROLLBACK TO SAVEPOINT batch_row")
+                        results.append(self._map_write_error(e))
+            finally:
+                cursor.close()
+        return results
+
+    def execute_statement_read_one(
+        self,
+        sql: str,
+        args: tuple,
+        sticky_key: str | None = None,
+        query: str = "statement",
+    ) -> tuple | None:
         """
-        Executes a SELECT procedure.
+        Executes a single-row SELECT as a server-side prepared statement
+        (on a replica when configured).
         Returns: A single raw row (tuple) or None.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._read(
+            lambda pool: self._prepared_read_one(pool, sql, args, query), sticky_key
+        )
 
-        try:
-            cursor.callproc(procedure_name, args)
+    def execute_statement_read_all(
+        self, sql: str, args: tuple, query: str = "statement"
+    ) -> list[tuple]:
+        """
+        Executes a bounded (LIMITed) SELECT on the primary as a prepared statement.
+        Returns: Every row as a list of tuples.
+        """
+        return self._prepared_fetch_all(self.pool, sql, args, query)
 
-            for result in cursor.stored_results():
-                row = result.fetchone()
-                if row:
-                    return row
+    def execute_read_many(
+        self, sql: str, args: tuple = (), fetch_size: int = 1000
+    ) -> Iterator[tuple]:
+        """
+        Streams the rows of an unbounded SELECT (on a replica when one is
+        healthy) through an unbuffered cursor: rows are pulled from the
+        server `fetch_size` at a time, so memory stays flat whatever the
+        result size. The connection is held until the generator finishes.
+        """
+        pool = self.replicas.choose() or self.pool
+        with pool.guarded():
+            pooled = pool.acquire()
+            exhausted = False
+            try:
+                cursor = pooled.raw.cursor(buffered=False)
+                cursor.execute(sql, args)
+                while rows := cursor.fetchmany(fetch_size):
+                    yield from rows
+                cursor.close()
+                exhausted = True
+            finally:
+                # Stopped mid-result, the connection still has rows in flight
+                pool.release(pooled, discard=not exhausted)
 
-            return None
+    def _prepared_read_one(
+        self, pool, sql: str, args: tuple, query: str = "statement"
+    ) -> tuple | None:
+        rows = self._prepared_fetch_all(pool, sql, args, query)
+        return rows[0] if rows else None
+
+    def _prepared_fetch_all(
+        self, pool, sql: str, args: tuple, query: str = "statement"
+    ) -> list[tuple]:
+        with pool.checkout() as pooled:
+            cursor = self._prepared_cursor(pooled, sql)
+
+            try:
+                with self.instrumentation.observe(query) as observed:
+                    cursor.execute(sql, args)
+                    # fetchall drains the result so the cached cursor can run again
+                    rows = cursor.fetchall()
+                    observed.rows = len(rows)
+            except mysql.connector.Error:
+                self._forget_statement(pooled, sql)
+                raise
+
+            return [tuple(row) for row in rows]
+
+    def _prepared_cursor(self, pooled, sql: str):
+        """
+        One prepared cursor per statement per connection: the statement is
+        PREPAREd on first use and only EXECUTEd afterwards.
+        """
+        cursor = pooled.statements.get(sql)
+        if cursor is None:
+            cursor = pooled.raw.cursor(prepared=True)
+            pooled.statements[sql] = cursor
+        return cursor
+
+    def _forget_statement(self, pooled, sql: str):
+        """Drops a cached cursor whose state is unknown after an error."""
+        cursor = pooled.statements.pop(sql, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
 
-        finally:
-            cursor.close()
-            conn.close()
+    @staticmethod
+    def _map_write_error(e: "mysql.connector.Error") -> Exception:
+        # The UNIQUE constraints are the only uniqueness check (no EXISTS
+        # probes before the INSERT), so map 1062 by the key that was hit
+        if e.errno == errorcode.ER_DUP_ENTRY:
+            match = DUPLICATE_KEY.search(str(e))
+            if match and match.group(1) in EMAIL_UNIQUE_KEYS:
+                return EmailAlreadyExistsError("User with this email already exists")
 
+        # The pre-004 create_user procedure SIGNALs before its INSERT; keep
+        # mapping it until db/migrations/004 has run on every database
+        if e.errno == errorcode.ER_SIGNAL_EXCEPTION and LEGACY_EMAIL_TAKEN in str(e):
+            return EmailAlreadyExistsError("User with this email already exists")
 
-class UserSQLExecuter(SQLExecutor, UserDBExecuter):
+        # If it's a different error, let it crash (results in 500)
+        return e
+
+    @classmethod
+    def _raise_write_error(cls, e: "mysql.connector.Error"):
+        error = cls._map_write_error(e)
+        if error is e:
+            raise e
+        raise error
+
+
+# Same operations as the procedures in db/init.sql, row-for-row identical
+STATEMENTS = {
+    "create_user": (
+        "INSERT INTO users (id, email, password_hash) VALUES (%s, LOWER(%s), %s)"
+    ),
+    "login_user": (
+        "SELECT id, password_hash FROM users WHERE email = LOWER(%s) LIMIT 1"
+    ),
+    "get_user_by_id": "SELECT email, created_at FROM users WHERE id = %s LIMIT 1",
+    "update_password_hash": (
+        "UPDATE users SET password_hash = %s WHERE id = %s AND password_hash = %s"
+    ),
+    "register_email": (
+        "INSERT INTO user_directory (email, user_id) VALUES (LOWER(%s), %s)"
+    ),
+    "lookup_email": (
+        "SELECT user_id FROM user_directory WHERE email = LOWER(%s) LIMIT 1"
+    ),
+    "delete_email": "DELETE FROM user_directory WHERE email = LOWER(%s)",
+}
+
+
+# Batch lookups pad the IN list to the next power of two (repeating the last
+# id), so at most log2(max) distinct statements are ever prepared per connection
+def batch_lookup_sql(count: int) -> tuple[str, int]:
+    padded = 1 << max(count - 1, 0).bit_length()
+    placeholders = ", ".join(["%s"] * padded)
+    return (
+        f"SELECT id, email, created_at FROM users WHERE id IN ({placeholders})",
+        padded,
+    )
+
+
+# Admin listing/export, keyset-ordered by (created_at, id): served by the
+# idx_users_created_at index, which carries the primary key as its suffix
+LIST_STATEMENTS = {
+    "list_users_first": (
+        "SELECT id, email, created_at FROM users" " ORDER BY created_at, id LIMIT %s"
+    ),
+    "list_users_after": (
+        "SELECT id, email, created_at FROM users"
+        " WHERE created_at > %s OR (created_at = %s AND id > %s)"
+        " ORDER BY created_at, id LIMIT %s"
+    ),
+    "export_users": ("SELECT id, email, created_at FROM users ORDER BY created_at, id"),
+}
+
+# Shard maintenance (resharding/backfill); always run as plain statements
+SHARD_STATEMENTS = {
+    "scan_users": (
+        "SELECT id, email, password_hash, created_at FROM users"
+        " WHERE id > %s ORDER BY id LIMIT %s"
+    ),
+    "scan_directory": (
+        "SELECT email, user_id FROM user_directory"
+        " WHERE email > %s ORDER BY email LIMIT %s"
+    ),
+    "copy_user": (
+        "INSERT IGNORE INTO users (id, email, password_hash, created_at)"
+        " VALUES (%s, %s, %s, %s)"
+    ),
+    "copy_directory_entry": (
+        "INSERT IGNORE INTO user_directory (email, user_id) VALUES (%s, %s)"
+    ),
+    "delete_user": "DELETE FROM users WHERE id = %s",
+}
+
+
+class UserSQLExecuter(SQLExecutor, UserShardExecuter):
 
     def create_user(
         self,
@@ -87,27 +512,187 @@ class UserSQLExecuter(SQLExecutor, UserDBExecuter):
         email: str,
         password_hash: str,
     ) -> dict | None:
-        # 1. Use execute_write because we are calling an INSERT procedure
-        # 2. Map the procedure name and args
-        self.execute_write("create_user", (user_id, email, password_hash))
+        # 1. Use a write because we are calling an INSERT
+        # 2. Map the operation name and args (ids are stored as BINARY(16))
+        self._write("create_user", (UserMapper.id_to_db(user_id), email, password_hash))
+
+        # A fresh registration must be able to log in before replicas catch up
+        self.read_your_writes.pin(str(user_id), email.lower())
+
+    def create_users(self, rows: list[tuple]) -> list[Exception | None]:
+        """
+        Group commit: every row goes in with one multi-row INSERT. If one of
+        them is a duplicate, the batch is retried row by row in a single
+        transaction so only the duplicate gets EmailAlreadyExistsError.
+        """
+        results = [None] * len(rows)
+        batch = []  # (position in rows, insert args)
+        for i, (user_id, email, password_hash) in enumerate(rows):
+            try:
+                batch.append((i, (UserMapper.id_to_db(user_id), email, password_hash)))
+            except ValueError as e:
+                results[i] = e
+
+        if batch:
+            sql = STATEMENTS["create_user"]
+            args = [row_args for _, row_args in batch]
+            try:
+                self.execute_batch_write(sql, args, "create_users")
+            except mysql.connector.Error as e:
+                if e.errno != errorcode.ER_DUP_ENTRY:
+                    raise
+                for (i, _), error in zip(
+                    batch, self.execute_each_write(sql, args, "create_users")
+                ):
+                    results[i] = error
+
+        for (user_id, email, _), error in zip(rows, results):
+            if error is None:
+                self.read_your_writes.pin(str(user_id), email.lower())
+
+        return results
 
     def login_user(self, email: str) -> dict | None:
-        # Use execute_read_one as it expects a single user row back
+        # Use a single-row read as it expects a single user row back
         print("stargin the login user procuedure")
-        row = self.execute_read_one("login_user", (email,))
+        row = self._read_one("login_user", (email,), sticky_key=email.lower())
 
         if not row:
             return None
 
         # IMPORTANT: MySQL raw tuples need mapping to dict keys for your Service layer
-        # Assuming your procedure returns (id, email, password_hash)
-        return {"id": row[0], "password_hash": row[1]}
+        # Assuming your procedure returns (id, password_hash)
+        return {"id": UserMapper.id_from_db(row[0]), "password_hash": row[1]}
 
-    def get_user_by_id(self, id: int) -> dict | None:
-        row = self.execute_read_one("get_user_by_id", (id,))
+    def get_user_by_id(self, id: str) -> dict | None:
+        try:
+            key = UserMapper.id_to_db(id)
+        except ValueError:
+            return None  # Not a UUID, so no such user
+
+        row = self._read_one("get_user_by_id", (key,), sticky_key=str(id))
 
         if not row:
             return None
 
         # Standard mapping
         return {"id": row[0], "createdAt": row[1]}
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        keys = UserMapper.ids_to_db(ids)
+        if not keys:
+            return {}
+
+        sql, padded = batch_lookup_sql(len(keys))
+        args = list(keys)
+        args += [args[-1]] * (padded - len(args))
+
+        # Any id registered moments ago sends the whole batch to the primary
+        pinned = next(
+            (i for i in keys.values() if self.read_your_writes.is_pinned(i)), None
+        )
+        rows = self._read(
+            lambda pool: self._prepared_fetch_all(
+                pool, sql, tuple(args), "get_users_by_ids"
+            ),
+            pinned,
+        )
+        return {UserMapper.id_from_db(row[0]): (row[1], row[2]) for row in rows}
+
+    def update_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        key = UserMapper.id_to_db(user_id)
+        if self.query_mode == PREPARED_MODE:
+            updated = self.execute_statement_write(
+                STATEMENTS["update_password_hash"],
+                (new_hash, key, old_hash),
+                "update_password_hash",
+            )
+        else:
+            # The procedure SELECTs ROW_COUNT()
+            updated = self.execute_write(
+                "update_password_hash", (key, old_hash, new_hash)
+            )
+        return bool(updated)
+
+    # ----------------------------------------------------------------
+    # Admin listing / export
+    # ----------------------------------------------------------------
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        if after is None:
+            name, args = "list_users_first", (limit,)
+        else:
+            created_at, user_id = after
+            key = UserMapper.id_to_db(user_id)
+            name, args = "list_users_after", (created_at, created_at, key, limit)
+
+        sql = LIST_STATEMENTS[name]
+        rows = self._read(lambda pool: self._prepared_fetch_all(pool, sql, args, name))
+        return [(UserMapper.id_from_db(row[0]), *row[1:]) for row in rows]
+
+    def iter_users(self) -> Iterator[tuple]:
+        for row in self.execute_read_many(LIST_STATEMENTS["export_users"]):
+            yield (UserMapper.id_from_db(row[0]), *row[1:])
+
+    # ----------------------------------------------------------------
+    # Shard directory + maintenance (see ShardedUserExecuter)
+    # ----------------------------------------------------------------
+    def register_email(self, email: str, user_id: str) -> None:
+        self._write("register_email", (email, UserMapper.id_to_db(user_id)))
+        self.read_your_writes.pin(email.lower())
+
+    def lookup_email(self, email: str) -> str | None:
+        row = self._read_one("lookup_email", (email,), sticky_key=email.lower())
+        return UserMapper.id_from_db(row[0]) if row else None
+
+    def delete_email(self, email: str) -> None:
+        self._write("delete_email", (email,))
+
+    # Scanned rows carry canonical string ids (the hash ring key); the byte
+    # order of BINARY(16) ids matches the order of their lowercase hex form.
+    def scan_users(self, after_id: str, limit: int) -> list[tuple]:
+        after = UserMapper.id_to_db(after_id) if after_id else b""
+        rows = self.execute_statement_read_all(
+            SHARD_STATEMENTS["scan_users"], (after, limit), "scan_users"
+        )
+        return [(UserMapper.id_from_db(row[0]), *row[1:]) for row in rows]
+
+    def scan_directory(self, after_email: str, limit: int) -> list[tuple]:
+        rows = self.execute_statement_read_all(
+            SHARD_STATEMENTS["scan_directory"], (after_email, limit), "scan_directory"
+        )
+        return [(email, UserMapper.id_from_db(user_id)) for email, user_id in rows]
+
+    def copy_user(self, row: tuple) -> None:
+        user_id, *rest = row
+        self.execute_statement_write(
+            SHARD_STATEMENTS["copy_user"],
+            (UserMapper.id_to_db(user_id), *rest),
+            "copy_user",
+        )
+
+    def copy_directory_entry(self, row: tuple) -> None:
+        email, user_id = row
+        self.execute_statement_write(
+            SHARD_STATEMENTS["copy_directory_entry"],
+            (email, UserMapper.id_to_db(user_id)),
+            "copy_directory_entry",
+        )
+
+    def delete_user(self, id: str) -> None:
+        self.execute_statement_write(
+            SHARD_STATEMENTS["delete_user"], (UserMapper.id_to_db(id),), "delete_user"
+        )
+
+    def _write(self, operation: str, args: tuple):
+        if self.query_mode == PREPARED_MODE:
+            return self.execute_statement_write(STATEMENTS[operation], args, operation)
+        return self.execute_write(operation, args)
+
+    def _read_one(
+        self, operation: str, args: tuple, sticky_key: str | None = None
+    ) -> tuple | None:
+        if self.query_mode == PREPARED_MODE:
+            return self.execute_statement_read_one(
+                STATEMENTS[operation], args, sticky_key, operation
+            )
+        return self.execute_read_one(operation, args, sticky_key)
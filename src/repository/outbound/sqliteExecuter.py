@@ -0,0 +1,293 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+
+from ..inbound.dbExecuter import UserShardExecuter
+from src.app.domain.exceptions import EmailAlreadyExistsError
+from src.mapper.user_mapper import UserMapper
+
+# Mirrors db/init.sql. MySQL's default collation makes the email UNIQUE index
+# case-insensitive, hence COLLATE NOCASE; emails are still stored lowercased.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id BLOB NOT NULL PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    password_hash TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_users_created_at ON users (created_at, id);
+
+CREATE TABLE IF NOT EXISTS user_directory (
+    email TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
+    user_id BLOB NOT NULL
+);
+"""
+
+# Same operations as the procedures in db/init.sql
+STATEMENTS = {
+    "create_user": (
+        "INSERT INTO users (id, email, password_hash) VALUES (?, LOWER(?), ?)"
+    ),
+    "login_user": "SELECT id, password_hash FROM users WHERE email = LOWER(?) LIMIT 1",
+    "get_user_by_id": "SELECT email, created_at FROM users WHERE id = ? LIMIT 1",
+    "update_password_hash": (
+        "UPDATE users SET password_hash = ? WHERE id = ? AND password_hash = ?"
+    ),
+    "register_email": "INSERT INTO user_directory (email, user_id) VALUES (LOWER(?), ?)",
+    "lookup_email": "SELECT user_id FROM user_directory WHERE email = LOWER(?) LIMIT 1",
+    "delete_email": "DELETE FROM user_directory WHERE email = LOWER(?)",
+    "scan_users": (
+        "SELECT id, email, password_hash, created_at FROM users"
+        " WHERE id > ? ORDER BY id LIMIT ?"
+    ),
+    "scan_directory": (
+        "SELECT email, user_id FROM user_directory"
+        " WHERE email > ? ORDER BY email LIMIT ?"
+    ),
+    "copy_user": (
+        "INSERT OR IGNORE INTO users (id, email, password_hash, created_at)"
+        " VALUES (?, ?, ?, ?)"
+    ),
+    "copy_directory_entry": (
+        "INSERT OR IGNORE INTO user_directory (email, user_id) VALUES (?, ?)"
+    ),
+    "delete_user": "DELETE FROM users WHERE id = ?",
+    "list_users_first": (
+        "SELECT id, email, created_at FROM users ORDER BY created_at, id LIMIT ?"
+    ),
+    "list_users_after": (
+        "SELECT id, email, created_at FROM users"
+        " WHERE created_at > ? OR (created_at = ? AND id > ?)"
+        " ORDER BY created_at, id LIMIT ?"
+    ),
+    "export_users": "SELECT id, email, created_at FROM users ORDER BY created_at, id",
+}
+
+
+class SQLiteUserExecuter(UserShardExecuter):
+    """
+    Embedded UserDBExecuter for single-node deployments and benchmarks
+    (and a stand-in shard for ShardedUserExecuter tests).
+
+    - One connection per thread (sqlite3 connections are not thread-safe),
+      re-opened after a fork.
+    - WAL journal so readers never block on the single writer.
+    - Statements are parameterized and served from sqlite3's per-connection
+      prepared statement cache.
+
+    Config keys: `path` (database file), `busy_timeout` (ms to wait for the
+    write lock) and `cached_statements` (statement cache size).
+    """
+
+    def __init__(self, db_config: dict):
+        self.path = db_config.get("path", "auth.db")
+        self.busy_timeout = int(db_config.get("busy_timeout", 5000))
+        self.cached_statements = int(db_config.get("cached_statements", 128))
+
+        self._local = threading.local()
+
+        # Create the schema once up front
+        self._get_connection().executescript(SCHEMA)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout / 1000,
+            isolation_level=None,  # autocommit; every operation is one statement
+            cached_statements=self.cached_statements,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={self.busy_timeout}")
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def create_user(self, user_id: str, email: str, password_hash: str) -> None:
+        self._insert_user(self._get_connection(), user_id, email, password_hash)
+
+    def create_users(self, rows: list[tuple]) -> list[Exception | None]:
+        """
+        All rows in one write transaction (one WAL commit). A failing INSERT
+        only undoes itself, so the other rows still commit.
+        """
+        conn = self._get_connection()
+        results = []
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for user_id, email, password_hash in rows:
+                try:
+                    self._insert_user(conn, user_id, email, password_hash)
+                    results.append(None)
+                except (
+                    EmailAlreadyExistsError,
+                    sqlite3.IntegrityError,
+                    ValueError,
+                ) as e:
+                    results.append(e)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+        return results
+
+    def _insert_user(self, conn, user_id: str, email: str, password_hash: str):
+        try:
+            conn.execute(
+                STATEMENTS["create_user"],
+                (UserMapper.id_to_db(user_id), email, password_hash),
+            )
+        except sqlite3.IntegrityError as e:
+            if "users.email" in str(e):
+                raise EmailAlreadyExistsError("User with this email already exists")
+            raise
+
+    def login_user(self, email: str) -> dict | None:
+        row = (
+            self._get_connection()
+            .execute(STATEMENTS["login_user"], (email,))
+            .fetchone()
+        )
+
+        if not row:
+            return None
+
+        return {"id": UserMapper.id_from_db(row[0]), "password_hash": row[1]}
+
+    def get_user_by_id(self, id: str) -> dict | None:
+        try:
+            key = UserMapper.id_to_db(id)
+        except ValueError:
+            return None  # Not a UUID, so no such user
+
+        row = (
+            self._get_connection()
+            .execute(STATEMENTS["get_user_by_id"], (key,))
+            .fetchone()
+        )
+
+        if not row:
+            return None
+
+        # Same (odd) keys as UserSQLExecuter so UserRepo works unchanged
+        return {"id": row[0], "createdAt": datetime.fromisoformat(row[1])}
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        keys = UserMapper.ids_to_db(ids)
+        if not keys:
+            return {}
+
+        placeholders = ", ".join("?" * len(keys))
+        rows = (
+            self._get_connection()
+            .execute(
+                "SELECT id, email, created_at FROM users"
+                f" WHERE id IN ({placeholders})",
+                tuple(keys),
+            )
+            .fetchall()
+        )
+        return {
+            UserMapper.id_from_db(user_id): (email, datetime.fromisoformat(created_at))
+            for user_id, email, created_at in rows
+        }
+
+    def update_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        cursor = self._get_connection().execute(
+            STATEMENTS["update_password_hash"],
+            (new_hash, UserMapper.id_to_db(user_id), old_hash),
+        )
+        return cursor.rowcount > 0
+
+    # ----------------------------------------------------------------
+    # Admin listing / export
+    # ----------------------------------------------------------------
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        conn = self._get_connection()
+        if after is None:
+            cursor = conn.execute(STATEMENTS["list_users_first"], (limit,))
+        else:
+            created_at, user_id = after
+            # created_at is stored as CURRENT_TIMESTAMP text
+            stamp = str(created_at)
+            cursor = conn.execute(
+                STATEMENTS["list_users_after"],
+                (stamp, stamp, UserMapper.id_to_db(user_id), limit),
+            )
+        return [self._listed(row) for row in cursor.fetchall()]
+
+    def iter_users(self) -> Iterator[tuple]:
+        # sqlite3 cursors step through the result lazily
+        for row in self._get_connection().execute(STATEMENTS["export_users"]):
+            yield self._listed(row)
+
+    @staticmethod
+    def _listed(row: tuple) -> tuple:
+        user_id, email, created_at = row
+        return UserMapper.id_from_db(user_id), email, datetime.fromisoformat(created_at)
+
+    # ----------------------------------------------------------------
+    # Shard directory + maintenance (see ShardedUserExecuter)
+    # ----------------------------------------------------------------
+    def register_email(self, email: str, user_id: str) -> None:
+        try:
+            self._get_connection().execute(
+                STATEMENTS["register_email"], (email, UserMapper.id_to_db(user_id))
+            )
+        except sqlite3.IntegrityError:
+            raise EmailAlreadyExistsError("User with this email already exists")
+
+    def lookup_email(self, email: str) -> str | None:
+        row = (
+            self._get_connection()
+            .execute(STATEMENTS["lookup_email"], (email,))
+            .fetchone()
+        )
+        return UserMapper.id_from_db(row[0]) if row else None
+
+    def delete_email(self, email: str) -> None:
+        self._get_connection().execute(STATEMENTS["delete_email"], (email,))
+
+    def scan_users(self, after_id: str, limit: int) -> list[tuple]:
+        after = UserMapper.id_to_db(after_id) if after_id else b""
+        rows = (
+            self._get_connection()
+            .execute(STATEMENTS["scan_users"], (after, limit))
+            .fetchall()
+        )
+        return [(UserMapper.id_from_db(row[0]), *row[1:]) for row in rows]
+
+    def scan_directory(self, after_email: str, limit: int) -> list[tuple]:
+        rows = (
+            self._get_connection()
+            .execute(STATEMENTS["scan_directory"], (after_email, limit))
+            .fetchall()
+        )
+        return [(email, UserMapper.id_from_db(user_id)) for email, user_id in rows]
+
+    def copy_user(self, row: tuple) -> None:
+        user_id, *rest = row
+        self._get_connection().execute(
+            STATEMENTS["copy_user"], (UserMapper.id_to_db(user_id), *rest)
+        )
+
+    def copy_directory_entry(self, row: tuple) -> None:
+        email, user_id = row
+        self._get_connection().execute(
+            STATEMENTS["copy_directory_entry"], (email, UserMapper.id_to_db(user_id))
+        )
+
+    def delete_user(self, id: str) -> None:
+        self._get_connection().execute(
+            STATEMENTS["delete_user"], (UserMapper.id_to_db(id),)
+        )
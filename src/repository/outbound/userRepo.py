@@ -6,6 +6,7 @@ from ..dbEntity.user import UserDB
 from ..inbound.dbExecuter import UserDBExecuter
 from ...app.services.inbound.hashing_service import Hasher
 from ..inbound.userRepo import UserRepoBase
+from .passwordRehasher import PasswordRehasher
 
 
 class UserRepo(UserRepoBase):
@@ -14,9 +15,16 @@ class UserRepo(UserRepoBase):
     The repository is then incharge of converting all fields in the user object to safe way
     """
 
-    def __init__(self, sql_executor: UserDBExecuter, hasher: Hasher):
+    def __init__(
+        self,
+        sql_executor: UserDBExecuter,
+        hasher: Hasher,
+        rehasher: PasswordRehasher | None = None,
+    ):
         self.sql_executor = sql_executor
         self.hasher = hasher
+        # Upgrades outdated hashes after login; None leaves them as they are
+        self.rehasher = rehasher
 
     def save(self, user: User) -> UserDB:
         try:
@@ -47,6 +55,11 @@ class UserRepo(UserRepoBase):
         if not is_valid:
             raise AuthenticationError("Invalid Credentials")
 
+        # Made with an older policy (e.g. bcrypt cost): upgrade it in the
+        # background now that we know the password
+        if self.rehasher is not None and self.hasher.needs_rehash(password_hash_db):
+            self.rehasher.schedule(user_id, password, password_hash_db)
+
         # 2. DB Row -> Domain Object
         return (user_id, email)
 
@@ -56,3 +69,15 @@ class UserRepo(UserRepoBase):
         email, createdAt = row["id"], row["createdAt"]
 
         return (email, createdAt)
+
+    def get_users_by_ids(self, ids: list[str]) -> dict[str, tuple]:
+        """{user_id: (email, createdAt)} for the ids that exist."""
+        return self.sql_executor.get_users_by_ids(ids)
+
+    def list_users(self, after: tuple | None, limit: int) -> list[tuple]:
+        """(id, email, created_at) rows after the (created_at, id) cursor."""
+        return self.sql_executor.list_users(after, limit)
+
+    def iter_users(self):
+        """Streams every (id, email, created_at) row; constant memory."""
+        return self.sql_executor.iter_users()
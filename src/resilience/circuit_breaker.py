@@ -0,0 +1,149 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from src.telemetry.metrics.resilience_metrics import (
+    breaker_state,
+    breaker_transitions,
+    breaker_rejections,
+)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    pass
+
+
+class CircuitBreaker:
+    """
+    Failure isolation for one dependency (a MySQL pool, Redis).
+
+    - closed:    calls go through; `failure_threshold` consecutive failures
+                 open the breaker.
+    - open:      calls fail immediately with CircuitOpenError, so request
+                 threads stop piling up on a stalled server. After
+                 `reset_timeout` seconds the breaker goes half-open.
+    - half_open: up to `half_open_max_calls` trial calls go through at once;
+                 a success closes the breaker, a failure opens it again.
+
+    Only exceptions in `failure_types` count as failures. Exceptions in
+    `ignore_types` say nothing about the dependency (e.g. this process ran
+    out of pooled connections) and count as neither. Any other error means
+    the dependency did answer (e.g. a duplicate key) and counts as a
+    success.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_types: tuple = (Exception,),
+        ignore_types: tuple = (),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_types = failure_types
+        self.ignore_types = ignore_types
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        breaker_state.labels(dependency=name).set(STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def call(self, fn: Callable, *args, **kwargs):
+        with self.guard():
+            return fn(*args, **kwargs)
+
+    @contextmanager
+    def guard(self):
+        """Runs the `with` block as one call through the breaker."""
+        self.allow()
+        try:
+            yield
+        except self.ignore_types:
+            self.record_ignored()
+            raise
+        except self.failure_types:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.record_success()
+            raise
+        else:
+            self.record_success()
+
+    def allow(self):
+        """Raises CircuitOpenError unless a call may go through right now."""
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == OPEN or (
+                self._state == HALF_OPEN and self._trials >= self.half_open_max_calls
+            ):
+                breaker_rejections.labels(dependency=self.name).inc()
+                raise CircuitOpenError(f"{self.name} is unavailable (circuit open)")
+
+            if self._state == HALF_OPEN:
+                self._trials += 1
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._state == HALF_OPEN:
+                self._trials = max(self._trials - 1, 0)
+                self._transition(CLOSED)
+
+    def record_ignored(self):
+        """Ends a call without a verdict: frees its half-open trial slot."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trials = max(self._trials - 1, 0)
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trials = max(self._trials - 1, 0)
+                self._open()
+                return
+
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self._opened_at = self.clock()
+        self._failures = 0
+        self._transition(OPEN)
+
+    def _maybe_half_open(self):
+        if self._state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self._trials = 0
+            self._transition(HALF_OPEN)
+
+    def _transition(self, state: str):
+        if state == self._state:
+            return
+        self._state = state
+        breaker_state.labels(dependency=self.name).set(STATE_VALUES[state])
+        breaker_transitions.labels(dependency=self.name, state=state).inc()
@@ -0,0 +1,151 @@
+"""
+Fault-injecting TCP proxy: a local stand-in between the service and a real
+MySQL/Redis for exercising timeouts, breakers and retries.
+
+    # Point DB_PORT at 3317 instead of 3307, then switch modes while it runs
+    python -m src.resilience.fault_proxy --target localhost:3307 --listen 3317 \\
+        --mode latency --latency 2
+
+Modes:
+    pass      - forward bytes unchanged
+    latency   - delay every chunk coming back from the server by `latency` s
+    blackhole - accept connections but never answer (a stalled server)
+    refuse    - close new connections immediately (a server that is down)
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+MODES = ("pass", "latency", "blackhole", "refuse")
+
+
+class FaultProxy:
+    def __init__(
+        self,
+        target: tuple[str, int] | None = None,
+        listen: tuple[str, int] = ("127.0.0.1", 0),
+        mode: str = "pass",
+        latency: float = 0.0,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown fault mode: {mode}")
+
+        self.target = target
+        self.mode = mode  # may be changed while running
+        self.latency = latency
+
+        self._server = socket.create_server(listen)
+        self._server.settimeout(0.1)
+        self._sockets: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.getsockname()[:2]
+
+    def start(self) -> "FaultProxy":
+        self._running = True
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+        self._server.close()
+        with self._lock:
+            for sock in self._sockets:
+                self._close(sock)
+            self._sockets.clear()
+
+    def __enter__(self) -> "FaultProxy":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                client, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+
+            mode = self.mode
+            if mode == "refuse":
+                self._close(client)
+                continue
+
+            self._track(client)
+            if mode == "blackhole":
+                # Keep the socket open and unanswered until stop()
+                continue
+
+            try:
+                upstream = socket.create_connection(self.target, timeout=5)
+            except OSError:
+                self._close(client)
+                continue
+            self._track(upstream)
+
+            for src, dst, delayed in (
+                (client, upstream, False),
+                (upstream, client, True),
+            ):
+                threading.Thread(
+                    target=self._pump, args=(src, dst, delayed), daemon=True
+                ).start()
+
+    def _pump(self, src: socket.socket, dst: socket.socket, delayed: bool):
+        try:
+            while chunk := src.recv(65536):
+                if delayed and self.mode == "latency":
+                    time.sleep(self.latency)
+                dst.sendall(chunk)
+        except OSError:
+            pass
+        finally:
+            self._close(src)
+            self._close(dst)
+
+    def _track(self, sock: socket.socket):
+        with self._lock:
+            self._sockets.append(sock)
+
+    @staticmethod
+    def _close(sock: socket.socket):
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", required=True, help="host:port of the real server")
+    parser.add_argument("--listen", type=int, required=True, help="local port")
+    parser.add_argument("--mode", choices=MODES, default="pass")
+    parser.add_argument("--latency", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    host, _, port = args.target.rpartition(":")
+    proxy = FaultProxy(
+        (host, int(port)), ("127.0.0.1", args.listen), args.mode, args.latency
+    ).start()
+    print(f"{args.mode} proxy on 127.0.0.1:{args.listen} -> {args.target}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        proxy.stop()
+
+
+if __name__ == "__main__":
+    main()
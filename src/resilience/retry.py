@@ -0,0 +1,32 @@
+import random
+import time
+from typing import Callable
+
+from src.telemetry.metrics.resilience_metrics import dependency_retries
+
+
+def retry_call(
+    fn: Callable,
+    retries: int = 2,
+    retry_on: tuple = (Exception,),
+    base_delay: float = 0.02,
+    max_delay: float = 0.5,
+    name: str = "unknown",
+    sleep: Callable[[float], None] = time.sleep,
+):
+    """
+    Calls `fn()` and retries it up to `retries` times when it raises one of
+    `retry_on`. Only for idempotent operations (reads).
+
+    Waits use exponential backoff with full jitter (a random delay between 0
+    and min(max_delay, base_delay * 2^attempt)), so clients that failed
+    together do not retry in lockstep and hammer a recovering server.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except retry_on:
+            if attempt == retries:
+                raise
+            dependency_retries.labels(dependency=name).inc()
+            sleep(random.uniform(0, min(max_delay, base_delay * 2**attempt)))
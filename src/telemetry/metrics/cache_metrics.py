@@ -0,0 +1,57 @@
+from prometheus_client import Counter, Gauge
+
+# ==========================
+# BLACKLIST L1 (IN-PROCESS) CACHE METRICS
+# ==========================
+blacklist_l1_lookups = Counter(
+    "auth_blacklist_l1_lookups_total",
+    "Blacklist lookups by L1 result (hit_revoked, hit_valid, miss)",
+    ["result"],
+)
+
+blacklist_l1_evictions = Counter(
+    "auth_blacklist_l1_evictions_total",
+    "Entries evicted from the L1 blacklist cache to stay within its size bound",
+)
+
+blacklist_l1_entries = Gauge(
+    "auth_blacklist_l1_entries",
+    "Entries currently held in the L1 blacklist cache",
+)
+
+blacklist_l1_invalidations = Counter(
+    "auth_blacklist_l1_invalidations_total",
+    "Revocations received from other processes over the invalidation channel",
+)
+
+# ==========================
+# IN-MEMORY BLACKLIST (CACHE_BACKEND=memory) METRICS
+# ==========================
+memory_cache_entries = Gauge(
+    "auth_blacklist_memory_entries",
+    "Revoked JTIs currently held by the in-memory blacklist",
+)
+
+memory_cache_expirations = Counter(
+    "auth_blacklist_memory_expirations_total",
+    "Revoked JTIs dropped from the in-memory blacklist because the token expired",
+)
+
+memory_cache_evictions = Counter(
+    "auth_blacklist_memory_evictions_total",
+    "Revoked JTIs evicted early to keep the in-memory blacklist within its cap",
+)
+
+# ==========================
+# USER PROFILE CACHE METRICS
+# ==========================
+profile_cache_lookups = Counter(
+    "auth_profile_cache_lookups_total",
+    "Profile lookups by the tier that answered (l1, l2, db)",
+    ["tier"],
+)
+
+profile_cache_invalidations = Counter(
+    "auth_profile_cache_invalidations_total",
+    "Profiles dropped from the profile cache (here or from another process)",
+)
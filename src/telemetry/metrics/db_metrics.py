@@ -0,0 +1,102 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# ==========================
+# DB CONNECTION POOL METRICS
+# ==========================
+db_pool_checkout_latency = Histogram(
+    "auth_db_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+)
+
+db_pool_in_use = Gauge(
+    "auth_db_pool_in_use_connections",
+    "Connections currently checked out of the pool",
+    ["pool"],
+)
+
+db_pool_idle = Gauge(
+    "auth_db_pool_idle_connections",
+    "Open connections sitting idle in the pool",
+    ["pool"],
+)
+
+db_pool_timeouts = Counter(
+    "auth_db_pool_timeouts_total",
+    "Checkouts that gave up waiting for a free connection",
+    ["pool"],
+)
+
+# ==========================
+# READ REPLICA METRICS
+# ==========================
+db_reads_routed = Counter(
+    "auth_db_reads_routed_total",
+    "Single-row reads by the pool that served them",
+    ["pool"],
+)
+
+db_replica_ejections = Counter(
+    "auth_db_replica_ejections_total",
+    "Times a replica was taken out of rotation after a connection failure",
+    ["pool"],
+)
+
+# ==========================
+# SHARDING METRICS
+# ==========================
+db_shard_operations = Counter(
+    "auth_db_shard_operations_total",
+    "User DB operations by the shard that served them",
+    ["shard", "operation"],
+)
+
+db_shard_moved_rows = Counter(
+    "auth_db_shard_moved_rows_total",
+    "Rows copied to their new owner shard while resharding",
+    ["shard", "table"],
+)
+
+# ==========================
+# WRITE COALESCING METRICS
+# ==========================
+db_coalesced_batch_size = Histogram(
+    "auth_db_coalesced_batch_rows",
+    "Registrations committed together by the write coalescer",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+db_coalesced_queue_wait = Histogram(
+    "auth_db_coalesced_queue_wait_seconds",
+    "Time a registration waited in the coalescer queue before its batch flushed",
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.5),
+)
+
+# ==========================
+# PER-QUERY METRICS
+# ==========================
+db_query_latency = Histogram(
+    "auth_db_query_seconds",
+    "Time spent running one query on a checked-out connection",
+    ["query", "outcome"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 5),
+)
+
+db_query_rows = Counter(
+    "auth_db_query_rows_total",
+    "Rows returned (reads) or affected (statement writes) per query",
+    ["query"],
+)
+
+db_query_errors = Counter(
+    "auth_db_query_errors_total",
+    "Failed queries by MySQL errno (the exception type when there is none)",
+    ["query", "errno"],
+)
+
+db_connect_errors = Counter(
+    "auth_db_connect_errors_total",
+    "Failed attempts to open a new pooled connection, by errno",
+    ["pool", "errno"],
+)
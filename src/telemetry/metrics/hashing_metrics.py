@@ -0,0 +1,37 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# ==========================
+# PASSWORD HASHING POOL METRICS
+# ==========================
+HASH_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+hashing_queue_wait = Histogram(
+    "auth_hashing_queue_wait_seconds",
+    "Time a hashing job waited for a free worker",
+    ["op"],
+    buckets=HASH_BUCKETS,
+)
+
+hashing_compute = Histogram(
+    "auth_hashing_compute_seconds",
+    "Time a worker spent hashing or verifying one password",
+    ["op"],
+    buckets=HASH_BUCKETS,
+)
+
+hashing_in_flight = Gauge(
+    "auth_hashing_in_flight",
+    "Hashing jobs running or queued in the hashing pool",
+)
+
+hashing_rejections = Counter(
+    "auth_hashing_rejections_total",
+    "Hashing jobs rejected because the hashing pool queue was full",
+    ["op"],
+)
+
+password_rehashes = Counter(
+    "auth_password_rehashes_total",
+    "Stored password hashes upgraded to the current hashing policy after login",
+    ["outcome"],  # ok, stale, deferred, error
+)
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 # ==========================
 # LOGOUT METRICS
@@ -16,3 +16,48 @@ auth_logout_latency = Histogram(
     "Logout request latency in seconds",
     buckets=(0.1, 0.3, 0.5, 1, 2, 5),
 )
+
+# ==========================
+# LOGOUT EVERYWHERE METRICS
+# (revokes every session of a user: kept apart from single logouts)
+# ==========================
+auth_logout_all_success = Counter(
+    "auth_logout_all_success_total", "Total successful logout-everywhere requests"
+)
+
+auth_logout_all_failure = Counter(
+    "auth_logout_all_failure_total",
+    "Total failed logout-everywhere requests",
+    ["reason"],
+)
+
+auth_logout_all_latency = Histogram(
+    "auth_logout_all_latency_seconds",
+    "Logout-everywhere request latency in seconds",
+    buckets=(0.1, 0.3, 0.5, 1, 2, 5),
+)
+
+# ==========================
+# WRITE-BEHIND REVOCATION QUEUE METRICS
+# ==========================
+revocation_queue_depth = Gauge(
+    "auth_revocation_queue_depth",
+    "Revocations accepted but not yet written to Redis",
+)
+
+revocation_queue_lag = Gauge(
+    "auth_revocation_queue_lag_seconds",
+    "Age of the oldest revocation not yet written to Redis",
+)
+
+revocation_flushes = Counter(
+    "auth_revocation_flushes_total",
+    "Write-behind flushes by outcome (ok, error, overflow = written inline)",
+    ["outcome"],
+)
+
+revocation_flush_batch_size = Histogram(
+    "auth_revocation_flush_batch_size",
+    "Revocations written per write-behind flush",
+    buckets=(1, 5, 10, 50, 100, 250, 500, 1000),
+)
@@ -0,0 +1,95 @@
+import time
+
+from src.telemetry.metrics.db_metrics import (
+    db_query_errors,
+    db_query_latency,
+    db_query_rows,
+)
+
+
+def error_code(error: BaseException) -> str:
+    """MySQL errno as a label value, or the exception type when there is none."""
+    errno = getattr(error, "errno", None)
+    return str(errno) if errno is not None else type(error).__name__
+
+
+class _Observation:
+    __slots__ = ("owner", "query", "rows", "start")
+
+    def __init__(self, owner: "QueryInstrumentation", query: str):
+        self.owner = owner
+        self.query = query
+        self.rows = None  # set by the caller when it knows the row count
+
+    def __enter__(self) -> "_Observation":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.owner.record(self.query, time.perf_counter() - self.start, self.rows, exc)
+
+
+class _NoObservation:
+    """Shared no-op used while instrumentation is off."""
+
+    __slots__ = ("rows",)
+
+    def __enter__(self) -> "_NoObservation":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+_NO_OBSERVATION = _NoObservation()
+
+
+class QueryInstrumentation:
+    """
+    Per-query latency, row and error metrics plus a slow query log.
+
+        with self.instrumentation.observe("login_user") as query:
+            row = ...
+            query.rows = 1 if row else 0
+
+    `query` must be a fixed operation name (a label value), never SQL text.
+    With metrics disabled and no slow query threshold, observe() returns a
+    shared no-op and nothing is timed.
+    """
+
+    def __init__(self, enabled: bool = True, slow_query_seconds: float | None = None):
+        self.enabled = enabled
+        self.slow_query_seconds = slow_query_seconds or None
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or self.slow_query_seconds is not None
+
+    def observe(self, query: str):
+        if not self.active:
+            return _NO_OBSERVATION
+        return _Observation(self, query)
+
+    def record(
+        self,
+        query: str,
+        elapsed: float,
+        rows: int | None,
+        error: BaseException | None,
+    ):
+        outcome = "ok" if error is None else "error"
+
+        if self.enabled:
+            db_query_latency.labels(query=query, outcome=outcome).observe(elapsed)
+            # rowcount is -1 when the driver cannot tell
+            if isinstance(rows, int) and rows > 0:
+                db_query_rows.labels(query=query).inc(rows)
+            if error is not None:
+                db_query_errors.labels(query=query, errno=error_code(error)).inc()
+
+        if self.slow_query_seconds is not None and elapsed >= self.slow_query_seconds:
+            # Operation name only: the arguments are emails and password hashes
+            print(
+                f"SLOW QUERY {query} took {elapsed * 1000:.1f}ms"
+                f" (outcome={outcome}, rows={rows})"
+            )
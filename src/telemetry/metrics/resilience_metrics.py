@@ -0,0 +1,37 @@
+from prometheus_client import Counter, Gauge
+
+# ==========================
+# CIRCUIT BREAKER METRICS
+# ==========================
+breaker_state = Gauge(
+    "auth_dependency_breaker_state",
+    "Circuit breaker state per dependency (0=closed, 1=half_open, 2=open)",
+    ["dependency"],
+)
+
+breaker_transitions = Counter(
+    "auth_dependency_breaker_transitions_total",
+    "Circuit breaker state changes, by the state entered",
+    ["dependency", "state"],
+)
+
+breaker_rejections = Counter(
+    "auth_dependency_breaker_rejections_total",
+    "Calls failed fast because the dependency's breaker was open",
+    ["dependency"],
+)
+
+# ==========================
+# RETRY / DEGRADATION METRICS
+# ==========================
+dependency_retries = Counter(
+    "auth_dependency_retries_total",
+    "Idempotent reads retried after a transient failure",
+    ["dependency"],
+)
+
+blacklist_check_fallbacks = Counter(
+    "auth_blacklist_check_fallbacks_total",
+    "is_blacklisted answers decided by the fail mode because Redis was unavailable",
+    ["mode"],
+)
@@ -0,0 +1,7 @@
+import pytest
+from src.tests.fakes import FakeClock
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
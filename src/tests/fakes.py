@@ -0,0 +1,8 @@
+class FakeClock:
+    """A clock tests move by hand: `clock.now += 61`."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
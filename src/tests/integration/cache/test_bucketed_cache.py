@@ -0,0 +1,122 @@
+import uuid
+import pytest
+from unittest.mock import Mock
+from src.cache.outbound.bucketed_cache import BucketedRedisCache, bloom_positions
+
+HOUR = 3600
+NOW = 1_700_000_000.0  # 2023-11-14 22:13:20 UTC, inside bucket 472222 at 1h
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def client():
+    """Mocks redis.Redis; each registered script is its own Mock."""
+    client = Mock()
+    client.register_script.side_effect = lambda source: Mock(name="script")
+    return client
+
+
+@pytest.fixture
+def cache(client):
+    return BucketedRedisCache(
+        client,
+        key_prefix="auth:",
+        bucket_seconds=HOUR,
+        max_ttl=7 * 24 * HOUR,
+        bloom_bits=1 << 16,
+        bloom_hashes=5,
+        clock=lambda: NOW,
+    )
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_revocation_lands_in_its_expiry_bucket(cache, client):
+    """
+    Scenario: A UUID JTI with 90 minutes to live is blacklisted.
+    Expected: Added as 16 raw bytes to the bucket covering its expiry; set and
+    Bloom filter both expire once the whole bucket is dead.
+    """
+    jti = str(uuid.uuid4())
+    pipe = client.pipeline.return_value
+
+    cache.blacklist_token(jti, 90 * 60)
+
+    bucket = int((NOW + 90 * 60) // HOUR)
+    pipe.sadd.assert_called_once_with(f"auth:revoked:{bucket}", uuid.UUID(jti).bytes)
+    assert pipe.setbit.call_count == 5
+    expires_at = (bucket + 1) * HOUR
+    assert expires_at >= NOW + 90 * 60
+    pipe.expireat.assert_any_call(f"auth:revoked:{bucket}:bloom", expires_at)
+    pipe.execute.assert_called_once()
+
+
+def test_lookup_checks_every_live_bucket_in_one_script(cache):
+    """
+    Scenario: is_blacklisted does not know the token's expiry.
+    Expected: One script call over every bucket from now to now + max_ttl.
+    """
+    cache._is_revoked.return_value = 1
+
+    assert cache.is_blacklisted("jti-1") is True
+
+    kwargs = cache._is_revoked.call_args.kwargs
+    sets = kwargs["keys"][::2]
+    assert len(sets) == 7 * 24 + 1
+    assert sets[0] == f"auth:revoked:{int(NOW // HOUR)}"
+    assert kwargs["args"][:2] == [b"jti-1", 5]
+    assert kwargs["args"][2:] == bloom_positions(b"jti-1", 1 << 16, 5)
+
+
+def test_consume_once_targets_the_expiry_bucket_first(cache):
+    cache._consume.side_effect = [1, 0]
+    jti = str(uuid.uuid4())
+
+    assert cache.consume_once(jti, 600) is True
+    assert cache.consume_once(jti, 600) is False
+
+    kwargs = cache._consume.call_args.kwargs
+    bucket = int((NOW + 600) // HOUR)
+    assert kwargs["keys"][:2] == [
+        f"auth:revoked:{bucket}",
+        f"auth:revoked:{bucket}:bloom",
+    ]
+    assert kwargs["args"][-1] == (bucket + 1) * HOUR
+
+
+def test_batch_lookup_is_one_pipeline(cache, client):
+    pipe = client.pipeline.return_value
+    pipe.execute.return_value = [0, 1]
+
+    assert cache.are_blacklisted(["a", "b"]) == [False, True]
+    assert cache._is_revoked.call_count == 2
+    assert cache._is_revoked.call_args.kwargs["client"] is pipe
+
+
+def test_bloom_filter_false_positive_rate():
+    """
+    Scenario: 10 bits per revocation, 7 hashes.
+    Expected: Under 1% of absent JTIs pass the filter.
+    """
+    bits, hashes, n = 1 << 17, 7, 13_000
+    bitmap = bytearray(bits // 8)
+    for _ in range(n):
+        for p in bloom_positions(uuid.uuid4().bytes, bits, hashes):
+            bitmap[p // 8] |= 1 << (p % 8)
+
+    trials = 20_000
+    false_positives = sum(
+        all(
+            bitmap[p // 8] & (1 << (p % 8))
+            for p in bloom_positions(uuid.uuid4().bytes, bits, hashes)
+        )
+        for _ in range(trials)
+    )
+
+    assert false_positives / trials < 0.01
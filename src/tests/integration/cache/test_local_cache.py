@@ -0,0 +1,291 @@
+import json
+import os
+import time
+import pytest
+import redis
+from unittest.mock import Mock
+from src.cache.outbound.invalidation_bus import RedisInvalidationBus
+from src.cache.outbound.local_cache import LocalTTLCache
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+class SharedStore:
+    """Stand-in for the shared Redis, counting every call that reaches it."""
+
+    def __init__(self):
+        self.revoked = set()
+        self.generations = {}
+        self.calls = 0
+
+    def blacklist_token(self, jti, expiry_seconds):
+        self.calls += 1
+        self.revoked.add(jti)
+
+    def blacklist_many(self, entries):
+        self.calls += 1
+        self.revoked.update(entries)
+
+    def consume_once(self, jti, expiry_seconds):
+        self.calls += 1
+        if jti in self.revoked:
+            return False
+        self.revoked.add(jti)
+        return True
+
+    def is_blacklisted(self, jti):
+        self.calls += 1
+        return jti in self.revoked
+
+    def are_blacklisted(self, jtis):
+        self.calls += 1
+        return [jti in self.revoked for jti in jtis]
+
+    def get_generation(self, user_id):
+        self.calls += 1
+        return self.generations.get(user_id, 0)
+
+    def bump_generation(self, user_id):
+        self.calls += 1
+        self.generations[user_id] = self.generations.get(user_id, 0) + 1
+        return self.generations[user_id]
+
+    def consume_once_with_generation(self, jti, expiry_seconds, user_id):
+        consumed = self.consume_once(jti, expiry_seconds)
+        return consumed, self.generations.get(user_id, 0)
+
+
+class LocalBus:
+    """In-process stand-in for RedisInvalidationBus (delivers synchronously)."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, on_revoked, on_reset):
+        self.subscribers.append((on_revoked, on_reset))
+
+    def publish(self, entries):
+        for on_revoked, _ in self.subscribers:
+            on_revoked(dict(entries))
+
+
+@pytest.fixture
+def store():
+    return SharedStore()
+
+
+@pytest.fixture
+def l1(store, clock):
+    return LocalTTLCache(store, max_entries=3, negative_ttl=1.0, clock=clock)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_revoked_token_is_served_locally_until_it_expires(l1, store, clock):
+    """
+    Scenario: A token is revoked here, then checked repeatedly.
+    Expected: No Redis reads until the token's own expiry has passed.
+    """
+    l1.blacklist_token("jti-1", 60)
+    calls = store.calls
+
+    assert l1.is_blacklisted("jti-1") is True
+    clock.now += 59
+    assert l1.is_blacklisted("jti-1") is True
+    assert store.calls == calls
+
+    clock.now += 2
+    assert l1.is_blacklisted("jti-1") is True
+    assert store.calls == calls + 1
+
+
+def test_valid_answer_is_trusted_only_briefly(l1, store, clock):
+    assert l1.is_blacklisted("jti-1") is False
+    assert l1.is_blacklisted("jti-1") is False
+    assert store.calls == 1
+
+    store.revoked.add("jti-1")  # revoked elsewhere, no bus
+    clock.now += 1.5
+
+    assert l1.is_blacklisted("jti-1") is True
+    assert store.calls == 2
+
+
+def test_least_recently_used_entries_are_evicted(l1, store):
+    for jti in ("a", "b", "c"):
+        l1.is_blacklisted(jti)
+    l1.is_blacklisted("a")  # touch: "b" is now the oldest
+    l1.is_blacklisted("d")
+    calls = store.calls
+
+    l1.is_blacklisted("a")
+    assert store.calls == calls
+    l1.is_blacklisted("b")
+    assert store.calls == calls + 1
+
+
+def test_logout_on_one_pod_invalidates_the_other(store, clock):
+    """
+    Scenario: Pod B cached "valid" for a token, then pod A revokes it.
+    Expected: The bus message flips pod B's entry before its TTL runs out.
+    """
+    bus = LocalBus()
+    pod_a = LocalTTLCache(store, negative_ttl=60, bus=bus, clock=clock)
+    pod_b = LocalTTLCache(store, negative_ttl=60, bus=bus, clock=clock)
+    assert pod_b.is_blacklisted("jti-1") is False
+
+    pod_a.blacklist_token("jti-1", 900)
+
+    assert pod_b.is_blacklisted("jti-1") is True
+    assert pod_b.consume_once("jti-1", 900) is False
+
+
+def test_consume_once_stays_atomic_across_pods(store, clock):
+    """
+    Scenario: Two pods rotate the same refresh token, both with empty L1s.
+    Expected: The shared store decides; only one rotation succeeds.
+    """
+    pod_a = LocalTTLCache(store, clock=clock)
+    pod_b = LocalTTLCache(store, clock=clock)
+
+    assert pod_a.consume_once("jti-1", 900) is True
+    assert pod_b.consume_once("jti-1", 900) is False
+    calls = store.calls
+    assert pod_b.consume_once("jti-1", 900) is False
+    assert store.calls == calls  # now known locally
+
+
+def test_batch_lookup_fetches_only_the_misses_in_one_call(l1, store):
+    l1.blacklist_token("a", 60)
+    store.revoked.add("c")
+    calls = store.calls
+
+    assert l1.are_blacklisted(["a", "b", "c"]) == [True, False, True]
+    assert store.calls == calls + 1
+
+
+def test_invalidation_during_lookup_is_not_masked(store, clock):
+    """
+    Scenario: Redis answers "valid" while a revocation is being broadcast.
+    Expected: That answer is returned but not cached.
+    """
+    bus = LocalBus()
+    l1 = LocalTTLCache(store, negative_ttl=60, bus=bus, clock=clock)
+
+    def racing_lookup(jti):
+        answer = jti in store.revoked
+        store.revoked.add(jti)
+        bus.publish({jti: 900})
+        return answer
+
+    store.is_blacklisted = racing_lookup
+
+    assert l1.is_blacklisted("jti-1") is False
+    store.is_blacklisted = lambda jti: jti in store.revoked
+    assert l1.is_blacklisted("jti-1") is True
+
+
+def test_bus_reconnect_drops_valid_entries_only(store, clock):
+    bus = LocalBus()
+    l1 = LocalTTLCache(store, negative_ttl=60, bus=bus, clock=clock)
+    l1.blacklist_token("revoked", 900)
+    l1.is_blacklisted("valid")
+    calls = store.calls
+
+    for _, on_reset in bus.subscribers:
+        on_reset()
+
+    l1.is_blacklisted("revoked")
+    assert store.calls == calls
+    l1.is_blacklisted("valid")
+    assert store.calls == calls + 1
+
+
+def test_redis_bus_publishes_json_and_survives_errors():
+    client = Mock()
+    bus = RedisInvalidationBus(client, "auth:blacklist-revoked")
+
+    bus.publish({"jti-1": 900})
+    client.publish.side_effect = redis.exceptions.ConnectionError("down")
+    bus.publish({"jti-2": 900})
+
+    channel, payload = client.publish.call_args_list[0][0]
+    assert channel == "auth:blacklist-revoked"
+    assert json.loads(payload) == {"jti-1": 900}
+
+
+def test_redis_bus_listens_again_in_a_forked_worker():
+    """
+    Scenario: The bus subscribes in the parent, then the process forks
+    (gunicorn --preload).
+    Expected: The child runs its own listener thread.
+    """
+    client = Mock()
+    client.pubsub.return_value.get_message.side_effect = lambda timeout: time.sleep(
+        timeout
+    )
+    bus = RedisInvalidationBus(client, "auth:blacklist-revoked")
+    bus.subscribe(lambda entries: None, lambda: None)
+    parent_listener = bus._listener
+
+    pid = os.fork()
+    if pid == 0:
+        ok = bus._listener is not parent_listener and bus._listener.is_alive()
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_cached_generation_keeps_refresh_at_one_round_trip(store, clock):
+    """
+    Scenario: Refresh for a user whose generation was fetched recently.
+    Expected: Only consume_once reaches Redis; after generation_ttl the
+    combined call fetches both again, still in one call.
+    """
+    l1 = LocalTTLCache(store, generation_ttl=5.0, clock=clock)
+
+    assert l1.consume_once_with_generation("jti-1", 900, "user-1") == (True, 0)
+    calls = store.calls
+    assert l1.consume_once_with_generation("jti-2", 900, "user-1") == (True, 0)
+    assert store.calls == calls + 1
+
+    store.generations["user-1"] = 4
+    clock.now += 5.1
+    assert l1.consume_once_with_generation("jti-3", 900, "user-1") == (True, 4)
+    assert store.calls == calls + 2
+
+
+def test_generation_bump_reaches_other_pods(store, clock):
+    """
+    Scenario: Pod A bumps a user's generation; pod B had the old one cached.
+    Expected: Pod B sees the new generation at once, without asking Redis.
+    """
+    bus = LocalBus()
+    pod_a = LocalTTLCache(store, generation_bus=bus, clock=clock)
+    pod_b = LocalTTLCache(store, generation_bus=bus, clock=clock)
+    assert pod_b.get_generation("user-1") == 0
+
+    assert pod_a.bump_generation("user-1") == 1
+
+    calls = store.calls
+    assert pod_b.get_generation("user-1") == 1
+    assert store.calls == calls
+
+
+def test_generation_never_goes_backwards(store, clock):
+    """
+    Scenario: A slow read returns an older counter than a bump already seen.
+    Expected: The cached generation keeps the higher value.
+    """
+    l1 = LocalTTLCache(store, clock=clock)
+    l1._on_generations({"user-1": 3})
+
+    l1._put_generation("user-1", 2)
+
+    assert l1.get_generation("user-1") == 3
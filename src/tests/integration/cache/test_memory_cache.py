@@ -0,0 +1,132 @@
+import random
+import threading
+import pytest
+from src.cache.outbound.memory_cache import MemoryCache
+from src.utils.timing_wheel import TimingWheel
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def cache(clock):
+    return MemoryCache(max_entries=1000, clock=clock)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_revocations_expire_with_the_token(cache, clock):
+    """
+    Scenario: A JTI is revoked for 60s.
+    Expected: Revoked until then, gone (and its memory freed) after.
+    """
+    cache.blacklist_token("jti-1", 60)
+    clock.now += 59.5
+    assert cache.is_blacklisted("jti-1") is True
+
+    clock.now += 1
+    assert cache.is_blacklisted("jti-1") is False
+    assert len(cache) == 0
+
+
+def test_consume_once_and_batches(cache):
+    assert cache.consume_once("jti-1", 60) is True
+    assert cache.consume_once("jti-1", 60) is False
+
+    cache.blacklist_many({"a": 60, "b": 60})
+    assert cache.are_blacklisted(["a", "jti-1", "c"]) == [True, True, False]
+
+
+def test_generations_only_grow(cache):
+    assert cache.consume_once_with_generation("jti-1", 60, "user-1") == (True, 0)
+    assert cache.bump_generation("user-1") == 1
+    assert cache.consume_once_with_generation("jti-2", 60, "user-1") == (True, 1)
+
+
+def test_cap_evicts_the_soonest_to_expire(clock):
+    """
+    Scenario: The blacklist is full.
+    Expected: The entry expiring soonest is evicted, long-lived ones stay.
+    """
+    cache = MemoryCache(max_entries=3, clock=clock)
+    cache.blacklist_many({"long-1": 86400, "short": 30, "long-2": 86400})
+
+    cache.blacklist_token("long-3", 86400)
+
+    assert cache.are_blacklisted(["short", "long-1", "long-2", "long-3"]) == [
+        False,
+        True,
+        True,
+        True,
+    ]
+
+
+def test_snapshot_and_restore(cache, clock, tmp_path):
+    """
+    Scenario: Warm restart.
+    Expected: Live revocations and generations come back; entries that
+    expired while the process was down do not.
+    """
+    path = str(tmp_path / "blacklist.json")
+    cache.blacklist_many({"short": 10, "long": 3600})
+    cache.bump_generation("user-1")
+    assert cache.snapshot(path) == 2
+
+    clock.now += 60
+    restarted = MemoryCache(clock=clock)
+
+    assert restarted.restore(path) == 1
+    assert restarted.are_blacklisted(["short", "long"]) == [False, True]
+    assert restarted.get_generation("user-1") == 1
+
+
+def test_restore_without_snapshot_is_empty(cache, tmp_path):
+    assert cache.restore(str(tmp_path / "missing.json")) == 0
+
+
+def test_concurrent_consume_once_has_one_winner(cache):
+    barrier = threading.Barrier(16)
+    results = []
+
+    def attempt():
+        barrier.wait()
+        results.append(cache.consume_once("jti-1", 60))
+
+    threads = [threading.Thread(target=attempt) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1
+
+
+def test_timing_wheel_expires_every_key_on_its_tick():
+    """
+    Scenario: Keys with deadlines across every level, some beyond the
+    wheel's span, some cancelled; the wheel is advanced in random steps.
+    Expected: Each key is returned exactly once, in the step its deadline
+    passed; cancelled keys never.
+    """
+    rng = random.Random(7)
+    wheel = TimingWheel(slots=8, levels=3, start=1000)
+    deadlines = {key: 1000 + rng.randint(1, 1200) for key in range(500)}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, deadline)
+    for key in range(0, 500, 10):
+        wheel.cancel(key)
+        del deadlines[key]
+
+    now, expired = 1000, {}
+    while len(wheel):
+        step = rng.randint(1, 40)
+        for key in wheel.advance(now + step):
+            assert now < deadlines[key] <= now + step
+            expired[key] = now + step
+        now += step
+
+    assert set(expired) == set(deadlines)
@@ -0,0 +1,201 @@
+import threading
+import time
+import pytest
+import redis
+from datetime import datetime
+from src.cache.outbound.profile_cache import ProfileCache
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+class FakeRedis:
+    """Just the commands ProfileCache uses, on a dict."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise redis.exceptions.ConnectionError("down")
+
+    def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        self._check()
+        self.data.pop(key, None)
+
+
+class Loader:
+    def __init__(self, profiles):
+        self.profiles = profiles
+        self.calls = 0
+
+    def __call__(self, user_id):
+        self.calls += 1
+        return self.profiles.get(user_id)
+
+    def many(self, ids):
+        self.calls += 1
+        return {i: self.profiles[i] for i in ids if i in self.profiles}
+
+
+CREATED = datetime(2024, 1, 2, 3, 4, 5)
+
+
+@pytest.fixture
+def l2():
+    return FakeRedis()
+
+
+@pytest.fixture
+def db():
+    return Loader({"u1": ("a@gt.edu", CREATED), "u2": ("b@gt.edu", CREATED)})
+
+
+@pytest.fixture
+def profiles(l2, clock):
+    return ProfileCache(l2, l1_ttl=60, clock=clock)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_read_through_fills_both_tiers(profiles, l2, db, clock):
+    """
+    Scenario: Three reads of the same profile; L1 expires before the third.
+    Expected: One DB load; the third read is answered by Redis.
+    """
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", CREATED)
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", CREATED)
+    clock.now += 61
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", CREATED)
+
+    assert db.calls == 1
+    assert "profile:u1" in l2.data
+
+
+def test_login_populates_the_cache(profiles, db):
+    """
+    Scenario: Login puts the profile; /me follows.
+    Expected: No DB load.
+    """
+    profiles.put("u1", "a@gt.edu")
+
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", None)
+    assert db.calls == 0
+
+
+def test_put_without_replace_keeps_the_stored_profile(profiles, db):
+    profiles.get("u1", lambda: db("u1"))
+
+    profiles.put("u1", "A@GT.EDU", replace=False)
+
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", CREATED)
+
+
+def test_put_without_replace_keeps_the_profile_in_l2(profiles, l2, db, clock):
+    """
+    Scenario: L1 is cold but L2 holds the profile read from the database;
+    the user logs in typing their email in another case.
+    Expected: Neither tier takes the typed email; /me serves the stored one.
+    """
+    profiles.get("u1", lambda: db("u1"))
+    clock.now += 61  # L1 expired, L2 still warm
+
+    profiles.put("u1", "A@GT.EDU", replace=False)
+
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", CREATED)
+    assert db.calls == 1
+
+
+def test_concurrent_misses_load_once(l2):
+    """
+    Scenario: 16 threads miss on the same user at once.
+    Expected: A single DB load; every thread gets the profile.
+    """
+    profiles = ProfileCache(l2)
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.05)
+        return ("a@gt.edu", CREATED)
+
+    barrier = threading.Barrier(16)
+    results = []
+
+    def read():
+        barrier.wait()
+        results.append(profiles.get("u1", slow_load))
+
+    threads = [threading.Thread(target=read) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [("a@gt.edu", CREATED)] * 16
+
+
+def test_get_many_skips_profiles_without_created_at(profiles, db):
+    """
+    Scenario: A batch lookup after a login cached a profile without created_at.
+    Expected: That user is loaded from the DB; cached complete ones are not.
+    """
+    profiles.get("u2", lambda: db("u2"))
+    profiles.put("u1", "a@gt.edu")
+
+    found = profiles.get_many(["u1", "u2", "u3"], db.many)
+
+    assert found == {"u1": ("a@gt.edu", CREATED), "u2": ("b@gt.edu", CREATED)}
+    assert db.calls == 2
+
+
+def test_invalidate_reaches_every_tier_and_process(l2, db, clock):
+    """
+    Scenario: Two processes cached a profile; one invalidates it.
+    Expected: Both reload from the DB.
+    """
+    subscribers = []
+
+    class Bus:
+        def subscribe(self, on_invalidated, on_reset):
+            subscribers.append(on_invalidated)
+
+        def publish(self, entries):
+            for on_invalidated in subscribers:
+                on_invalidated(entries)
+
+    pod_a = ProfileCache(l2, bus=Bus(), clock=clock)
+    pod_b = ProfileCache(l2, bus=Bus(), clock=clock)
+    pod_a.get("u1", lambda: db("u1"))
+    pod_b.get("u1", lambda: db("u1"))
+
+    db.profiles["u1"] = ("new@gt.edu", CREATED)
+    pod_a.invalidate("u1")
+
+    assert pod_b.get("u1", lambda: db("u1")) == ("new@gt.edu", CREATED)
+    assert pod_a.get("u1", lambda: db("u1")) == ("new@gt.edu", CREATED)
+    assert db.calls == 2
+
+
+def test_redis_down_falls_back_to_the_database(profiles, l2, db):
+    l2.down = True
+
+    assert profiles.get("u1", lambda: db("u1")) == ("a@gt.edu", CREATED)
+    assert db.calls == 1
@@ -67,3 +67,85 @@ def test_is_blacklisted_returns_false(redis_cache, mock_redis_client):
 
     # Assert
     assert result is False
+
+
+def test_key_prefix_namespaces_every_key(mock_redis_client):
+    """
+    Scenario: Auth shares its Redis with other services.
+    Expected: Reads and writes use the prefixed key.
+    """
+    cache = RedisCache(mock_redis_client, key_prefix="auth:")
+    mock_redis_client.exists.return_value = 0
+
+    cache.blacklist_token("abc-123", 900)
+    cache.is_blacklisted("abc-123")
+
+    mock_redis_client.setex.assert_called_with("auth:abc-123", 900, "blacklisted")
+    mock_redis_client.exists.assert_called_with("auth:abc-123")
+
+
+def test_batch_operations_use_one_pipeline(mock_redis_client):
+    """
+    Scenario: Several tokens revoked and checked at once.
+    Expected: One non-transactional pipeline per call, flags in input order.
+    """
+    cache = RedisCache(mock_redis_client, key_prefix="auth:")
+    pipe = mock_redis_client.pipeline.return_value
+    pipe.execute.return_value = [1, 0]
+
+    cache.blacklist_many({"a": 60, "b": 120})
+    flags = cache.are_blacklisted(["a", "b"])
+
+    mock_redis_client.pipeline.assert_called_with(transaction=False)
+    pipe.setex.assert_any_call("auth:b", 120, "blacklisted")
+    pipe.exists.assert_any_call("auth:a")
+    assert pipe.execute.call_count == 2
+    assert flags == [True, False]
+
+
+def test_empty_batches_skip_redis(redis_cache, mock_redis_client):
+    redis_cache.blacklist_many({})
+
+    assert redis_cache.are_blacklisted([]) == []
+    mock_redis_client.pipeline.assert_not_called()
+
+
+def test_consume_once_is_a_single_set_nx(redis_cache, mock_redis_client):
+    """
+    Scenario: Refresh rotation checks and blacklists the old JTI.
+    Expected: One SET NX EX; True the first time, False once the key exists.
+    """
+    mock_redis_client.set.side_effect = [True, None]
+
+    assert redis_cache.consume_once("abc-123", 900) is True
+    assert redis_cache.consume_once("abc-123", 900) is False
+
+    mock_redis_client.set.assert_called_with("abc-123", "blacklisted", nx=True, ex=900)
+    mock_redis_client.exists.assert_not_called()
+
+
+def test_consume_once_with_generation_is_one_pipeline(mock_redis_client):
+    """
+    Scenario: Refresh rotation also needs the user's token generation.
+    Expected: SET NX EX and GET go out in one non-transactional pipeline.
+    """
+    cache = RedisCache(mock_redis_client, key_prefix="auth:")
+    pipe = mock_redis_client.pipeline.return_value
+    pipe.execute.return_value = [True, "3"]
+
+    assert cache.consume_once_with_generation("abc", 900, "42") == (True, 3)
+
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    pipe.set.assert_called_once_with("auth:abc", "blacklisted", nx=True, ex=900)
+    pipe.get.assert_called_once_with("auth:generation:42")
+    pipe.execute.assert_called_once()
+
+
+def test_generation_defaults_to_zero_and_bumps_with_incr(mock_redis_client):
+    cache = RedisCache(mock_redis_client)
+    mock_redis_client.get.return_value = None
+    mock_redis_client.incr.return_value = 1
+
+    assert cache.get_generation("42") == 0
+    assert cache.bump_generation("42") == 1
+    mock_redis_client.incr.assert_called_once_with("generation:42")
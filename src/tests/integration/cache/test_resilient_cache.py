@@ -0,0 +1,111 @@
+import socket
+import pytest
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+from unittest.mock import Mock
+from src.cache.outbound.redis_cache import RedisCache
+from src.cache.outbound.resilient_cache import UNAVAILABLE, ResilientCache
+from src.resilience.circuit_breaker import OPEN, CircuitBreaker
+from src.resilience.fault_proxy import FaultProxy
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+def unused_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def proxy():
+    """Local stand-in for Redis; the target port has nothing listening."""
+    with FaultProxy(("127.0.0.1", unused_port())) as proxy:
+        yield proxy
+
+
+def resilient_cache(proxy, fail_mode="closed"):
+    host, port = proxy.address
+    client = redis.Redis(
+        host=host,
+        port=port,
+        socket_connect_timeout=0.2,
+        socket_timeout=0.2,
+        retry=Retry(NoBackoff(), 0),
+    )
+    breaker = CircuitBreaker(
+        "redis-test", failure_threshold=2, reset_timeout=60, failure_types=UNAVAILABLE
+    )
+    return ResilientCache(
+        RedisCache(client), breaker, read_retries=0, fail_mode=fail_mode
+    )
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_stalled_redis_fails_closed_then_opens_breaker(proxy):
+    """
+    Scenario: Redis accepts connections but never answers.
+    Expected: Each check hits the socket deadline and reports the token as
+    revoked; after two failures the breaker opens.
+    """
+    proxy.mode = "blackhole"
+    cache = resilient_cache(proxy)
+
+    assert cache.is_blacklisted("jti-1") is True
+    assert cache.is_blacklisted("jti-2") is True
+    assert cache.breaker.state == OPEN
+
+
+def test_refused_redis_fails_open_when_configured(proxy):
+    proxy.mode = "refuse"
+    cache = resilient_cache(proxy, fail_mode="open")
+
+    assert cache.is_blacklisted("jti-1") is False
+
+
+def test_blacklist_write_still_raises_when_redis_is_down(proxy):
+    """
+    Scenario: Logout/rotation while Redis is unreachable.
+    Expected: The failure surfaces; a revocation is never silently dropped.
+    """
+    proxy.mode = "refuse"
+    cache = resilient_cache(proxy)
+
+    with pytest.raises(redis.exceptions.ConnectionError):
+        cache.blacklist_token("jti-1", 900)
+
+
+def test_healthy_cache_is_passed_through():
+    inner = Mock()
+    inner.is_blacklisted.return_value = False
+    cache = ResilientCache(inner, CircuitBreaker("redis-mock"), fail_mode="closed")
+
+    assert cache.is_blacklisted("jti-1") is False
+    cache.blacklist_token("jti-1", 900)
+    inner.blacklist_token.assert_called_once_with("jti-1", 900)
+
+
+def test_batch_check_falls_back_per_token(proxy):
+    proxy.mode = "refuse"
+    cache = resilient_cache(proxy, fail_mode="open")
+
+    assert cache.are_blacklisted(["jti-1", "jti-2"]) == [False, False]
+
+
+def test_consume_once_fails_closed_without_retrying(proxy):
+    """
+    Scenario: Refresh rotation while Redis refuses connections.
+    Expected: The token is treated as already used (refresh rejected).
+    """
+    proxy.mode = "refuse"
+    cache = resilient_cache(proxy)
+    cache.read_retries = 3
+
+    assert cache.consume_once("jti-1", 900) is False
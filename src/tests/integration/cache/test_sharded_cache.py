@@ -0,0 +1,145 @@
+import threading
+import pytest
+from src.cache.outbound.sharded_cache import ShardedCache
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+class Node:
+    """In-process stand-in for one Redis node, counting calls (round trips)."""
+
+    def __init__(self):
+        self.revoked = {}
+        self.generations = {}
+        self.calls = 0
+        self.threads = set()
+
+    def _call(self):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+
+    def blacklist_token(self, jti, expiry_seconds):
+        self._call()
+        self.revoked[jti] = expiry_seconds
+
+    def blacklist_many(self, entries):
+        self._call()
+        self.revoked.update(entries)
+
+    def is_blacklisted(self, jti):
+        self._call()
+        return jti in self.revoked
+
+    def are_blacklisted(self, jtis):
+        self._call()
+        return [jti in self.revoked for jti in jtis]
+
+    def consume_once(self, jti, expiry_seconds):
+        self._call()
+        if jti in self.revoked:
+            return False
+        self.revoked[jti] = expiry_seconds
+        return True
+
+    def get_generation(self, user_id):
+        self._call()
+        return self.generations.get(user_id, 0)
+
+    def bump_generation(self, user_id):
+        self._call()
+        self.generations[user_id] = self.generations.get(user_id, 0) + 1
+        return self.generations[user_id]
+
+    def consume_once_with_generation(self, jti, expiry_seconds, user_id):
+        consumed = self.consume_once(jti, expiry_seconds)
+        return consumed, self.generations.get(user_id, 0)
+
+
+@pytest.fixture
+def nodes():
+    return {"a": Node(), "b": Node(), "c": Node()}
+
+
+@pytest.fixture
+def cache(nodes):
+    return ShardedCache(nodes, vnodes=64)
+
+
+JTIS = [f"jti-{i}" for i in range(300)]
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_each_jti_lives_on_exactly_one_node(cache, nodes):
+    """
+    Scenario: Revocations are spread over three nodes.
+    Expected: Every JTI is stored once, on the node the ring picks, and
+    every node gets a share.
+    """
+    for jti in JTIS:
+        cache.blacklist_token(jti, 60)
+
+    for jti in JTIS:
+        owners = [name for name, node in nodes.items() if jti in node.revoked]
+        assert owners == [cache.node_for(jti)]
+        assert cache.is_blacklisted(jti) is True
+    assert all(len(node.revoked) > 50 for node in nodes.values())
+
+
+def test_batches_make_one_call_per_node(cache, nodes):
+    """
+    Scenario: Revoke and check a batch that spans every node.
+    Expected: One pipelined call per node each way, answers in input order.
+    """
+    cache.blacklist_many({jti: 60 for jti in JTIS[:150]})
+    flags = cache.are_blacklisted(JTIS)
+
+    assert flags == [i < 150 for i in range(len(JTIS))]
+    assert [node.calls for node in nodes.values()] == [2, 2, 2]
+    # The nodes were asked from the fan-out threads, concurrently
+    assert all(
+        name.startswith("cache-fan-out")
+        for node in nodes.values()
+        for name in node.threads
+    )
+
+
+def test_empty_batches_touch_no_node(cache, nodes):
+    cache.blacklist_many({})
+
+    assert cache.are_blacklisted([]) == []
+    assert sum(node.calls for node in nodes.values()) == 0
+
+
+def test_consume_once_with_generation_across_nodes(cache, nodes):
+    """
+    Scenario: The JTI and the user's generation live on different nodes.
+    Expected: Both are read, the bump is seen, and the JTI is consumed once.
+    """
+    jti = next(
+        j for j in JTIS if cache.node_for(j) != cache.generation_node_for("user-1")
+    )
+    cache.bump_generation("user-1")
+
+    assert cache.consume_once_with_generation(jti, 60, "user-1") == (True, 1)
+    assert cache.consume_once_with_generation(jti, 60, "user-1") == (False, 1)
+    assert cache.get_generation("user-1") == 1
+
+
+def test_adding_a_node_moves_only_its_share(nodes):
+    """
+    Scenario: A fourth node joins the ring.
+    Expected: Only the JTIs the new node takes over change owner.
+    """
+    before = ShardedCache(nodes, vnodes=64)
+    after = ShardedCache({**nodes, "d": Node()}, vnodes=64)
+
+    moved = [jti for jti in JTIS if before.node_for(jti) != after.node_for(jti)]
+
+    assert all(after.node_for(jti) == "d" for jti in moved)
+    assert len(moved) < len(JTIS) / 2
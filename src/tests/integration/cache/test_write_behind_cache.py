@@ -0,0 +1,146 @@
+import threading
+import time
+import pytest
+from src.cache.outbound.write_behind_cache import WriteBehindCache
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+class SlowStore:
+    """Stand-in for Redis: records batches, can fail or block on demand."""
+
+    def __init__(self):
+        self.revoked = {}
+        self.batches = []
+        self.failures = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def blacklist_many(self, entries):
+        self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("redis down")
+        self.batches.append(dict(entries))
+        self.revoked.update(entries)
+
+    def is_blacklisted(self, jti):
+        return jti in self.revoked
+
+    def are_blacklisted(self, jtis):
+        return [jti in self.revoked for jti in jtis]
+
+    def consume_once(self, jti, expiry_seconds):
+        if jti in self.revoked:
+            return False
+        self.revoked[jti] = expiry_seconds
+        return True
+
+    def consume_once_with_generation(self, jti, expiry_seconds, user_id):
+        return self.consume_once(jti, expiry_seconds), 0
+
+    def get_generation(self, user_id):
+        return 0
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def store():
+    return SlowStore()
+
+
+@pytest.fixture
+def cache(store):
+    return WriteBehindCache(store, max_pending=100, max_batch=50, interval=0.02)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_logout_returns_before_redis_is_written(cache, store):
+    """
+    Scenario: Redis is stalled when a token is revoked.
+    Expected: blacklist_token returns at once; the refresh path rejects
+    the token from the pending set; Redis gets it once it recovers.
+    """
+    store.release.clear()
+
+    cache.blacklist_token("jti-1", 900)
+
+    assert store.revoked == {}
+    assert cache.consume_once("jti-1", 900) is False
+    assert cache.consume_once_with_generation("jti-1", 900, "u1") == (False, 0)
+    assert cache.is_blacklisted("jti-1") is True
+
+    store.release.set()
+    wait_for(lambda: "jti-1" in store.revoked)
+    assert cache.is_blacklisted("jti-1") is True
+
+
+def test_revocations_are_batched(cache, store):
+    """
+    Scenario: Many logouts within the flush interval.
+    Expected: They reach Redis in a handful of pipelined batches.
+    """
+    for i in range(40):
+        cache.blacklist_token(f"jti-{i}", 900)
+
+    wait_for(lambda: len(store.revoked) == 40)
+    assert len(store.batches) < 5
+
+
+def test_failed_flush_is_retried(cache, store):
+    store.failures = 2
+
+    cache.blacklist_token("jti-1", 900)
+
+    wait_for(lambda: "jti-1" in store.revoked, timeout=5)
+    assert cache.consume_once("jti-1", 900) is False
+
+
+def test_full_queue_writes_inline(store):
+    """
+    Scenario: More revocations pending than the queue holds.
+    Expected: The overflow is written synchronously, nothing is dropped.
+    """
+    store.release.clear()
+    cache = WriteBehindCache(store, max_pending=2, interval=60)
+    cache.blacklist_many({"a": 900, "b": 900})
+
+    store.release.set()
+    cache.blacklist_token("c", 900)
+
+    assert "c" in store.revoked
+
+
+def test_drain_writes_everything_pending(store):
+    cache = WriteBehindCache(store, interval=60)
+    cache.blacklist_many({f"jti-{i}": 900 for i in range(10)})
+
+    assert cache.drain(timeout=2) == 0
+    assert len(store.revoked) == 10
+
+
+def test_ttl_counts_from_the_flush(store):
+    """
+    Scenario: A revocation waits 30s in the queue.
+    Expected: Redis gets the remaining lifetime, expired tokens are skipped.
+    """
+    now = [1000.0]
+    cache = WriteBehindCache(store, interval=60, clock=lambda: now[0])
+    cache.blacklist_many({"long": 900, "short": 10})
+
+    now[0] += 30
+    cache.drain()
+
+    assert store.revoked == {"long": 870}
@@ -0,0 +1,177 @@
+import io
+import json
+import bcrypt
+import pytest
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.app.services.hashing_service import (
+    ARGON2ID,
+    BCRYPT,
+    Argon2Hasher,
+    BcryptHasher,
+    MixedFormatHasher,
+)
+from src.cli.bulk_import import Checkpoint, import_users, read_records
+
+PREHASHED = bcrypt.hashpw(b"Imported123", bcrypt.gensalt(4)).decode()
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def executer(tmp_path):
+    return SQLiteUserExecuter({"path": str(tmp_path / "auth.db")})
+
+
+@pytest.fixture
+def ndjson(tmp_path):
+    records = [
+        {"email": "plain@gt.edu", "password": "Password123"},
+        {
+            "id": "01890a5d-ac96-774b-bcce-b302099a8057",
+            "email": "migrated@gt.edu",
+            "password_hash": PREHASHED,
+        },
+        {"email": "not-an-email", "password": "Password123"},
+        {"email": "weak@gt.edu", "password_hash": "md5:abc"},
+        {
+            "email": "argon2i@gt.edu",
+            "password_hash": "$argon2i$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA",
+        },
+        {"email": "PLAIN@gt.edu", "password": "Password123"},
+    ]
+    path = tmp_path / "users.ndjson"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return str(path)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_import_hashes_validates_and_keeps_prehashed(executer, ndjson):
+    """
+    Scenario: Mixed file with plain passwords, a pre-hashed migrated user,
+    invalid rows and a duplicate email.
+    Expected: Valid rows stored, invalid rejected (without secrets),
+    duplicate skipped.
+    """
+    rejects = io.StringIO()
+
+    stats = import_users(
+        read_records(ndjson), executer, batch_size=2, workers=0, rejects=rejects
+    )
+
+    assert stats == {"imported": 2, "skipped": 1, "rejected": 3}
+    plain = executer.login_user("plain@gt.edu")
+    assert bcrypt.checkpw(b"Password123", plain["password_hash"].encode())
+    migrated = executer.login_user("migrated@gt.edu")
+    assert migrated == {
+        "id": "01890a5d-ac96-774b-bcce-b302099a8057",
+        "password_hash": PREHASHED,
+    }
+    assert "Password123" not in rejects.getvalue()
+    assert "md5:abc" not in rejects.getvalue()
+    # argon2i/argon2d could never log in: only argon2id is verified
+    assert executer.login_user("argon2i@gt.edu") is None
+
+
+def test_import_resumes_from_checkpoint(executer, ndjson, tmp_path):
+    """
+    Scenario: Checkpoint says the first 5 records were already committed.
+    Expected: Only the remaining record is processed.
+    """
+    checkpoint = Checkpoint(str(tmp_path / "users.checkpoint"))
+    checkpoint.save(5)
+
+    stats = import_users(
+        read_records(ndjson), executer, workers=0, checkpoint=checkpoint
+    )
+
+    assert stats == {"imported": 1}
+    assert checkpoint.load() == 6
+
+
+def test_read_records_csv(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text("email,password\na@gt.edu,Password123\n")
+
+    assert list(read_records(str(path))) == [
+        {"email": "a@gt.edu", "password": "Password123"}
+    ]
+
+
+def test_import_rejects_lines_that_are_not_objects(executer, tmp_path):
+    """
+    Scenario: Valid JSON lines that are a list, a string and a number.
+    Expected: Each is counted as rejected; the import carries on.
+    """
+    path = tmp_path / "users.ndjson"
+    path.write_text(
+        '["a@gt.edu", "Password123"]\n"Password123"\n42\n'
+        + json.dumps({"email": "ok@gt.edu", "password": "Password123"})
+        + "\n"
+    )
+    rejects = io.StringIO()
+
+    stats = import_users(read_records(str(path)), executer, workers=0, rejects=rejects)
+
+    assert stats == {"imported": 1, "rejected": 3}
+    assert "Password123" not in rejects.getvalue()
+
+
+def test_import_rejects_malformed_lines(executer, tmp_path):
+    """
+    Scenario: An NDJSON line that is not valid JSON between two good ones.
+    Expected: It is rejected with its line number and raw text; the import
+    carries on and the checkpoint still counts every record.
+    """
+    path = tmp_path / "users.ndjson"
+    good = [
+        json.dumps({"email": f"ok{i}@gt.edu", "password": "Password123"})
+        for i in range(2)
+    ]
+    path.write_text(f"{good[0]}\n{{bad\n\n{good[1]}\n")
+    checkpoint = Checkpoint(str(tmp_path / "users.checkpoint"))
+    rejects = io.StringIO()
+
+    stats = import_users(
+        read_records(str(path)),
+        executer,
+        workers=0,
+        checkpoint=checkpoint,
+        rejects=rejects,
+    )
+
+    assert stats == {"imported": 2, "rejected": 1}
+    assert checkpoint.load() == 3
+    reject = json.loads(rejects.getvalue())
+    assert reject["line"] == 2
+    assert reject["raw"] == "{bad"
+    assert "not valid JSON" in reject["error"]
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_import_hashes_with_the_given_policy(executer, tmp_path, workers):
+    """
+    Scenario: The configured policy is argon2id (cheap parameters here).
+    Expected: Imported plain passwords are hashed with it, inline and in
+    the worker processes, so they need no rehash on first login.
+    """
+    hasher = MixedFormatHasher(
+        ARGON2ID,
+        {
+            BCRYPT: BcryptHasher(rounds=4),
+            ARGON2ID: Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),
+        },
+    )
+    path = tmp_path / "users.ndjson"
+    path.write_text(json.dumps({"email": "a@gt.edu", "password": "Password123"}))
+
+    import_users(read_records(str(path)), executer, workers=workers, hasher=hasher)
+
+    stored = executer.login_user("a@gt.edu")["password_hash"]
+    assert stored.startswith("$argon2id$v=19$m=8,t=1,p=1$")
+    assert hasher.needs_rehash(stored) is False
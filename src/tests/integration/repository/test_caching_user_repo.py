@@ -0,0 +1,84 @@
+import pytest
+from unittest.mock import Mock
+from src.app.domain.user import User
+from src.cache.outbound.profile_cache import ProfileCache
+from src.repository.outbound.cachingUserRepo import CachingUserRepo
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def inner():
+    return Mock()
+
+
+@pytest.fixture
+def repo(inner):
+    return CachingUserRepo(inner, ProfileCache())
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_first_me_after_register_skips_the_database(repo, inner):
+    """
+    Scenario: A user registers, then /me looks them up.
+    Expected: The profile comes from the cache, not the inner repo.
+    """
+    user = User.create("new@gt.edu", "Password123!", "Password123!")
+
+    repo.save(user)
+    email, _ = repo.get_user_by_id(user.get_user_id)
+
+    inner.save.assert_called_once_with(user)
+    assert email == "new@gt.edu"
+    inner.get_user_by_id.assert_not_called()
+
+
+def test_first_me_after_login_skips_the_database(repo, inner):
+    inner.validate_credentials.return_value = ("id-1", "a@gt.edu")
+
+    assert repo.validate_credentials("a@gt.edu", "pw") == ("id-1", "a@gt.edu")
+    assert repo.get_user_by_id("id-1") == ("a@gt.edu", None)
+    inner.get_user_by_id.assert_not_called()
+
+
+def test_cached_email_matches_the_stored_case(repo, inner):
+    """
+    Scenario: Register and log in with mixed-case emails.
+    Expected: /me from the cache returns the lowercased email the database
+    stores, as a cache miss would.
+    """
+    user = User.create("New@GT.edu", "Password123!", "Password123!")
+    inner.validate_credentials.return_value = ("id-1", "Foo@X.com")
+
+    repo.save(user)
+    repo.validate_credentials("Foo@X.com", "pw")
+
+    assert repo.get_user_by_id(user.get_user_id)[0] == "new@gt.edu"
+    assert repo.get_user_by_id("id-1")[0] == "foo@x.com"
+    inner.get_user_by_id.assert_not_called()
+
+
+def test_lookups_read_through_once(repo, inner):
+    inner.get_user_by_id.return_value = ("a@gt.edu", "2024-01-01")
+
+    repo.get_user_by_id("id-1")
+    repo.get_user_by_id("id-1")
+
+    inner.get_user_by_id.assert_called_once_with("id-1")
+
+
+def test_failed_login_caches_nothing(repo, inner):
+    inner.validate_credentials.side_effect = Exception("Invalid Credentials")
+    inner.get_user_by_id.return_value = ("a@gt.edu", None)
+
+    with pytest.raises(Exception):
+        repo.validate_credentials("a@gt.edu", "wrong")
+    repo.get_user_by_id("id-1")
+
+    inner.get_user_by_id.assert_called_once()
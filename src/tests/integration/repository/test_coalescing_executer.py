@@ -0,0 +1,155 @@
+import threading
+import uuid
+import pytest
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.repository.outbound.coalescingExecuter import (
+    CoalescedWriteTimeoutError,
+    CoalescingUserExecuter,
+)
+from src.app.domain.exceptions import EmailAlreadyExistsError
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+class RecordingExecuter(SQLiteUserExecuter):
+    """Real SQLite executer that remembers the size of every batch."""
+
+    def __init__(self, db_config):
+        super().__init__(db_config)
+        self.batches = []
+
+    def create_users(self, rows):
+        self.batches.append(len(rows))
+        return super().create_users(rows)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RecordingExecuter({"path": str(tmp_path / "auth.db")})
+
+
+def register_concurrently(executer, emails):
+    """One thread per email, all released at once. Returns {email: error}."""
+    barrier = threading.Barrier(len(emails))
+    outcomes = {}
+
+    def register(i, email):
+        barrier.wait()
+        try:
+            executer.create_user(str(uuid.uuid4()), email, "hash")
+            outcomes[i] = None
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [
+        threading.Thread(target=register, args=(i, email))
+        for i, email in enumerate(emails)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return [outcomes[i] for i in range(len(emails))]
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_concurrent_registrations_share_a_commit(store):
+    """
+    Scenario: A burst of 20 registrations inside one flush window.
+    Expected: Fewer batches than registrations, every user stored.
+    """
+    executer = CoalescingUserExecuter(store, window=0.05, max_batch=100)
+    emails = [f"user{i}@gt.edu" for i in range(20)]
+
+    outcomes = register_concurrently(executer, emails)
+
+    assert outcomes == [None] * 20
+    assert sum(store.batches) == 20
+    assert len(store.batches) < 20
+    for email in emails:
+        assert executer.login_user(email) is not None
+
+
+def test_duplicate_only_fails_its_own_caller(store):
+    """
+    Scenario: Two callers race for the same email in one batch.
+    Expected: Exactly one gets EmailAlreadyExistsError; others succeed.
+    """
+    executer = CoalescingUserExecuter(store, window=0.05)
+    emails = ["dupe@gt.edu", "DUPE@gt.edu", "other@gt.edu"]
+
+    outcomes = register_concurrently(executer, emails)
+
+    errors = [e for e in outcomes if e is not None]
+    assert len(errors) == 1
+    assert isinstance(errors[0], EmailAlreadyExistsError)
+    assert executer.login_user("other@gt.edu") is not None
+
+
+def test_full_batch_flushes_without_waiting_for_the_window(store):
+    """
+    Scenario: max_batch rows arrive, window is very long.
+    Expected: Batches never exceed max_batch and the callers return.
+    """
+    executer = CoalescingUserExecuter(store, window=30, max_batch=4)
+
+    outcomes = register_concurrently(executer, [f"u{i}@gt.edu" for i in range(8)])
+
+    assert outcomes == [None] * 8
+    assert store.batches == [4, 4]
+
+
+def test_stuck_flush_times_out_instead_of_hanging(store):
+    """
+    Scenario: The batch write hangs (stalled database).
+    Expected: The caller gets CoalescedWriteTimeoutError after
+    window + timeout; a row still queued behind it is dropped, not written.
+    """
+    release = threading.Event()
+    write = store.create_users
+    store.create_users = lambda rows: release.wait(5) and write(rows)
+    executer = CoalescingUserExecuter(store, window=0, max_batch=1, timeout=0.05)
+
+    outcomes = register_concurrently(executer, ["a@gt.edu", "b@gt.edu"])
+    release.set()
+
+    assert all(isinstance(e, CoalescedWriteTimeoutError) for e in outcomes)
+    executer.create_user(str(uuid.uuid4()), "c@gt.edu", "hash")
+    stored = [executer.login_user(f"{c}@gt.edu") is not None for c in "abc"]
+    assert stored.count(True) == 2  # the in-flight one, and c
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_dead_flusher_releases_its_batch_and_is_restarted(store):
+    """
+    Scenario: The flusher thread dies in the middle of a batch.
+    Expected: That batch's caller gets an error right away; the next
+    registration starts a new flusher and succeeds.
+    """
+    write = store.create_users
+    store.create_users = lambda rows: (_ for _ in ()).throw(SystemExit)
+    executer = CoalescingUserExecuter(store, window=0, timeout=5)
+
+    with pytest.raises(RuntimeError):
+        executer.create_user(str(uuid.uuid4()), "a@gt.edu", "hash")
+
+    store.create_users = write
+    executer.create_user(str(uuid.uuid4()), "b@gt.edu", "hash")
+    assert executer.login_user("b@gt.edu") is not None
+
+
+def test_reads_and_other_calls_are_delegated(store):
+    executer = CoalescingUserExecuter(store, window=0)
+    user_id = str(uuid.uuid4())
+
+    executer.create_user(user_id, "solo@gt.edu", "hash")
+
+    assert executer.login_user("solo@gt.edu")["id"] == user_id
+    assert executer.get_user_by_id(user_id)["id"] == "solo@gt.edu"
+    assert executer.lookup_email("missing@gt.edu") is None
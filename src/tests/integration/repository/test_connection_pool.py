@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import MagicMock
+from src.repository.outbound.connection_pool import ConnectionPool, PoolTimeoutError
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def creator():
+    """Each call hands out a brand new mock connection."""
+    return MagicMock(side_effect=lambda: MagicMock())
+
+
+@pytest.fixture
+def pool(creator):
+    return ConnectionPool(creator, size=2, max_overflow=1, timeout=0.05)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_connection_is_reused_between_checkouts(pool, creator):
+    """
+    Scenario: Two sequential calls.
+    Expected: Only one physical connection is opened.
+    """
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert creator.call_count == 1
+    first.close.assert_not_called()
+
+
+def test_overflow_connections_are_closed_on_release(pool, creator):
+    """
+    Scenario: Burst above pool size.
+    Expected: Overflow connection is closed, pool keeps `size` idle.
+    """
+    held = [pool.acquire() for _ in range(3)]
+    for pooled in held:
+        pool.release(pooled)
+
+    assert creator.call_count == 3
+    assert pool.idle == 2
+    assert pool.checked_out == 0
+    held[2].raw.close.assert_called_once()
+
+
+def test_checkout_times_out_when_exhausted(pool):
+    """
+    Scenario: size + overflow connections are all in use.
+    Expected: Next caller fails fast with PoolTimeoutError.
+    """
+    held = [pool.acquire() for _ in range(3)]
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    for pooled in held:
+        pool.release(pooled)
+
+
+def test_stale_connection_is_recycled(creator):
+    """
+    Scenario: Idle connection is older than `recycle`.
+    Expected: It is closed and replaced on checkout.
+    """
+    pool = ConnectionPool(creator, size=1, recycle=10)
+    pooled = pool.acquire()
+    pooled.created_at -= 60
+    pool.release(pooled)
+
+    with pool.connection() as conn:
+        assert conn is not pooled.raw
+
+    pooled.raw.close.assert_called_once()
+
+
+def test_pre_ping_replaces_dead_connection(creator):
+    """
+    Scenario: Server dropped the idle connection.
+    Expected: Failed ping discards it; caller gets a fresh one.
+    """
+    pool = ConnectionPool(creator, size=1, pre_ping=True)
+    with pool.connection() as dead:
+        pass
+    dead.ping.side_effect = Exception("MySQL server has gone away")
+
+    with pool.connection() as conn:
+        assert conn is not dead
+
+    assert creator.call_count == 2
+
+
+def test_error_rolls_back_and_returns_connection(pool):
+    """
+    Scenario: Query fails inside the `with` block.
+    Expected: Transaction rolled back, connection stays pooled.
+    """
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            raise ValueError("boom")
+
+    conn.rollback.assert_called_once()
+    assert pool.idle == 1
+    assert pool.checked_out == 0
+
+
+def test_broken_connection_is_discarded(pool):
+    """
+    Scenario: Connection cannot even roll back.
+    Expected: It is closed rather than handed to the next caller.
+    """
+    with pytest.raises(ValueError):
+        with pool.connection() as conn:
+            conn.rollback.side_effect = Exception("lost connection")
+            raise ValueError("boom")
+
+    conn.close.assert_called_once()
+    assert pool.idle == 0
+
+
+def test_pool_starts_over_after_fork(pool, creator):
+    """
+    Scenario: Worker process forked after the parent used the pool.
+    Expected: Inherited connections are dropped (not closed) and new ones opened.
+    """
+    with pool.connection() as parent_conn:
+        pass
+
+    pool._pid -= 1  # Pretend we are now running in a forked child
+
+    with pool.connection() as child_conn:
+        assert child_conn is not parent_conn
+
+    parent_conn.close.assert_not_called()
+    assert creator.call_count == 2
@@ -0,0 +1,129 @@
+import time
+import pytest
+from src.app.services.hashing_service import (
+    ARGON2ID,
+    BCRYPT,
+    Argon2Hasher,
+    BcryptHasher,
+    MixedFormatHasher,
+)
+from src.repository.outbound.passwordRehasher import PasswordRehasher
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.repository.outbound.userRepo import UserRepo
+
+ID_1 = "01890a5d-ac96-774b-bcce-b302099a8057"
+PASSWORD = "Pass123!"
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def executer(tmp_path):
+    return SQLiteUserExecuter({"path": str(tmp_path / "auth.db")})
+
+
+@pytest.fixture
+def hasher():
+    """The current policy: cost 5 (cheap, but above the stored cost 4)."""
+    return BcryptHasher(rounds=5)
+
+
+@pytest.fixture
+def repo(executer, hasher):
+    return UserRepo(executer, hasher, PasswordRehasher(executer, hasher))
+
+
+def stored_hash(executer):
+    return executer.login_user("user@gt.edu")["password_hash"]
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_login_upgrades_an_outdated_hash(repo, executer, hasher):
+    """
+    Scenario: A user's hash was made with cost 4; the policy is now 5.
+    Expected: Login succeeds right away; the stored hash is then replaced
+    by a cost-5 hash that still verifies.
+    """
+    executer.create_user(
+        ID_1, "user@gt.edu", BcryptHasher(rounds=4).hash_password(PASSWORD)
+    )
+
+    assert repo.validate_credentials("user@gt.edu", PASSWORD) == (ID_1, "user@gt.edu")
+
+    wait_for(lambda: stored_hash(executer).startswith("$2b$05$"))
+    assert hasher.verify_password(PASSWORD, stored_hash(executer))
+
+
+def test_login_moves_bcrypt_users_to_argon2(executer):
+    """
+    Scenario: The hash format changed from bcrypt to argon2id.
+    Expected: A bcrypt user still logs in; their hash becomes argon2id.
+    """
+    hasher = MixedFormatHasher(
+        ARGON2ID,
+        {
+            BCRYPT: BcryptHasher(rounds=4),
+            ARGON2ID: Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),
+        },
+    )
+    repo = UserRepo(executer, hasher, PasswordRehasher(executer, hasher))
+    executer.create_user(
+        ID_1, "user@gt.edu", BcryptHasher(rounds=4).hash_password(PASSWORD)
+    )
+
+    assert repo.validate_credentials("user@gt.edu", PASSWORD) == (ID_1, "user@gt.edu")
+
+    wait_for(lambda: stored_hash(executer).startswith("$argon2id$"))
+    assert repo.validate_credentials("user@gt.edu", PASSWORD) == (ID_1, "user@gt.edu")
+
+
+def test_current_hash_is_left_alone(repo, executer, hasher):
+    original = hasher.hash_password(PASSWORD)
+    executer.create_user(ID_1, "user@gt.edu", original)
+
+    repo.validate_credentials("user@gt.edu", PASSWORD)
+
+    assert hasher.needs_rehash(original) is False
+    assert repo.rehasher._pending == set()
+    assert stored_hash(executer) == original
+
+
+def test_update_never_overwrites_a_changed_password(executer):
+    """
+    Scenario: The password changed between the login and the rehash.
+    Expected: The compare-and-set update does nothing.
+    """
+    executer.create_user(ID_1, "user@gt.edu", "$2b$04$old")
+
+    assert executer.update_password_hash(ID_1, "$2b$04$stale", "$2b$05$new") is False
+    assert executer.update_password_hash(ID_1, "$2b$04$old", "$2b$05$new") is True
+    assert stored_hash(executer) == "$2b$05$new"
+
+
+def test_rehash_is_deferred_while_hashing_is_saturated(executer):
+    """
+    Scenario: The hashing pool is busy with logins.
+    Expected: No rehash is queued; the next login will try again.
+    """
+
+    class BusyHasher(BcryptHasher):
+        def is_saturated(self):
+            return True
+
+    rehasher = PasswordRehasher(executer, BusyHasher(rounds=5))
+
+    assert rehasher.schedule(ID_1, PASSWORD, "$2b$04$old") is False
+    assert rehasher._pending == set()
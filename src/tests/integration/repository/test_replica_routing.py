@@ -0,0 +1,114 @@
+import pytest
+from unittest.mock import MagicMock, patch
+import mysql.connector
+from src.repository.outbound.sqlExecuter import UserSQLExecuter
+from src.repository.outbound.replica_router import ReplicaRouter, LEAST_LOADED
+from src.repository.outbound.connection_pool import ConnectionPool
+
+NEW_ID = "01890a5d-ac96-774b-bcce-b302099a8057"
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+def make_server(row):
+    """A stand-in MySQL server whose login_user procedure returns `row`."""
+    conn = MagicMock()
+    result = MagicMock()
+    result.fetchone.return_value = row
+    conn.cursor.return_value.stored_results.return_value = [result]
+    return conn
+
+
+@pytest.fixture
+def servers():
+    return {
+        "primary": make_server(("id-primary", "hash")),
+        "replica1": make_server(("id-replica1", "hash")),
+        "replica2": make_server(("id-replica2", "hash")),
+    }
+
+
+@pytest.fixture
+def executer(servers):
+    config = {
+        "host": "primary",
+        "user": "root",
+        "password": "password",
+        "database": "auth_db",
+        "replicas": [{"host": "replica1"}, {"host": "replica2"}],
+        "read_your_writes_seconds": 5,
+    }
+    with patch(
+        "mysql.connector.connect", side_effect=lambda **kw: servers[kw["host"]]
+    ):
+        yield UserSQLExecuter(config)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_reads_round_robin_across_replicas(executer):
+    """
+    Scenario: Two replicas configured.
+    Expected: Consecutive reads alternate between them, never the primary.
+    """
+    served = [executer.login_user(f"u{i}@gt.edu")["id"] for i in range(4)]
+
+    assert served == ["id-replica1", "id-replica2", "id-replica1", "id-replica2"]
+
+
+def test_writes_always_go_to_primary(executer, servers):
+    executer.create_user(NEW_ID, "new@gt.edu", "hash")
+
+    servers["primary"].cursor.return_value.callproc.assert_called_once()
+    servers["replica1"].cursor.return_value.callproc.assert_not_called()
+
+
+def test_fresh_registration_reads_from_primary(executer):
+    """
+    Scenario: User registers and logs in immediately.
+    Expected: Within the read-your-writes window, login hits the primary
+    (case-insensitively), while other users still read from replicas.
+    """
+    executer.create_user(NEW_ID, "New@gt.edu", "hash")
+
+    assert executer.login_user("NEW@gt.edu")["id"] == "id-primary"
+    assert executer.login_user("other@gt.edu")["id"].startswith("id-replica")
+
+
+def test_unreachable_replica_is_ejected(executer, servers):
+    """
+    Scenario: replica1 stops accepting connections.
+    Expected: Read falls back to the primary, replica1 leaves the rotation.
+    """
+    broken = servers["replica1"].cursor.return_value
+    broken.callproc.side_effect = mysql.connector.errors.OperationalError(
+        "Lost connection to MySQL server"
+    )
+
+    first = executer.login_user("a@gt.edu")["id"]
+    later = {executer.login_user(f"{i}@gt.edu")["id"] for i in range(4)}
+
+    assert first == "id-primary"
+    assert later == {"id-replica2"}
+
+
+def test_all_replicas_down_falls_back_to_primary():
+    router = ReplicaRouter([ConnectionPool(MagicMock(), name="r0")])
+    router.eject(router.pools[0])
+
+    assert router.choose() is None
+
+
+def test_least_loaded_prefers_idle_replica():
+    busy = ConnectionPool(MagicMock(side_effect=MagicMock), name="busy")
+    idle = ConnectionPool(MagicMock(side_effect=MagicMock), name="idle")
+    busy.acquire()
+
+    router = ReplicaRouter([busy, idle], strategy=LEAST_LOADED)
+
+    assert {router.choose().name for _ in range(4)} == {"idle"}
@@ -0,0 +1,154 @@
+import uuid
+import pytest
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.repository.outbound.shardedExecuter import ShardedUserExecuter
+from src.repository.outbound.resharder import Resharder
+from src.utils.hash_ring import HashRing
+from src.app.domain.exceptions import EmailAlreadyExistsError
+
+ID_1 = str(uuid.uuid4())
+ID_2 = str(uuid.uuid4())
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def shards(tmp_path):
+    """Three stand-in shards, each its own SQLite file."""
+    return {
+        name: SQLiteUserExecuter({"path": str(tmp_path / f"{name}.db")})
+        for name in ("s1", "s2", "s3")
+    }
+
+
+@pytest.fixture
+def fleet(shards):
+    return ShardedUserExecuter({"s1": shards["s1"], "s2": shards["s2"]})
+
+
+def register_many(fleet, count):
+    users = {}
+    for i in range(count):
+        user_id = str(uuid.uuid4())
+        fleet.create_user(user_id, f"user{i}@gt.edu", f"hash-{i}")
+        users[user_id] = f"user{i}@gt.edu"
+    return users
+
+
+# ----------------------------------------------------------------
+# Routing
+# ----------------------------------------------------------------
+
+
+def test_users_spread_and_resolve_across_shards(fleet, shards):
+    """
+    Scenario: Many registrations.
+    Expected: Both shards get rows; every user is found by id and by email.
+    """
+    users = register_many(fleet, 60)
+
+    assert shards["s1"].scan_users("", 1000)
+    assert shards["s2"].scan_users("", 1000)
+    for user_id, email in users.items():
+        assert fleet.get_user_by_id(user_id)["id"] == email
+        assert fleet.login_user(email.upper())["id"] == user_id
+
+
+def test_duplicate_email_rejected_across_shards(fleet):
+    """
+    Scenario: Same email, different ids (likely different user shards).
+    Expected: Directory shard rejects the second one, nothing is orphaned.
+    """
+    fleet.create_user(ID_1, "dupe@gt.edu", "hash")
+
+    with pytest.raises(EmailAlreadyExistsError):
+        fleet.create_user(ID_2, "DUPE@gt.edu", "hash")
+
+    assert fleet.get_user_by_id(ID_2) is None
+
+
+def test_failed_user_insert_releases_email(fleet, shards):
+    """
+    Scenario: Directory claim succeeds, user row insert fails (id clash).
+    Expected: Email is released so the user can retry.
+    """
+    fleet.create_user(ID_1, "first@gt.edu", "hash")
+
+    with pytest.raises(Exception):
+        fleet.create_user(ID_1, "second@gt.edu", "hash")
+
+    fleet.create_user(ID_2, "second@gt.edu", "hash")
+    assert fleet.login_user("second@gt.edu")["id"] == ID_2
+
+
+def test_login_unknown_email_returns_none(fleet):
+    assert fleet.login_user("ghost@gt.edu") is None
+
+
+# ----------------------------------------------------------------
+# Consistent hashing + resharding
+# ----------------------------------------------------------------
+
+
+def test_adding_a_node_moves_a_bounded_share_of_keys():
+    keys = [str(uuid.uuid4()) for _ in range(3000)]
+    before = HashRing(["s1", "s2", "s3"])
+    after = HashRing(["s1", "s2", "s3", "s4"])
+
+    moved = [k for k in keys if before.node_for(k) != after.node_for(k)]
+
+    # Ideal is 1/4; everything that moves goes to the new node
+    assert len(moved) / len(keys) < 0.35
+    assert {after.node_for(k) for k in moved} == {"s4"}
+
+
+def test_reshard_copy_then_cleanup_keeps_every_user(fleet, shards):
+    """
+    Scenario: Add s3 to a populated s1,s2 fleet.
+    Expected: After copy + cleanup, the new 3-shard fleet resolves every user
+    and each row lives only on its owner shard.
+    """
+    users = register_many(fleet, 80)
+    resharder = Resharder(shards, ["s1", "s2"], ["s1", "s2", "s3"], batch_size=7)
+
+    planned = resharder.copy(dry_run=True)
+    copied = resharder.copy()
+    resharder.cleanup()
+
+    grown = ShardedUserExecuter(shards)
+    assert planned == copied
+    assert 0 < copied["users"] < len(users)
+    for user_id, email in users.items():
+        assert grown.get_user_by_id(user_id)["id"] == email
+        assert grown.login_user(email)["id"] == user_id
+    total = sum(len(shard.scan_users("", 1000)) for shard in shards.values())
+    assert total == len(users)
+
+
+def test_reshard_cleanup_keeps_rows_written_after_copy(fleet, shards):
+    """
+    Scenario: Users register on the old s1,s2 fleet between the copy phase
+    and the deploy of the new shard list.
+    Expected: Cleanup moves them to their new owners instead of deleting
+    them; the grown fleet resolves every user.
+    """
+    users = register_many(fleet, 40)
+    resharder = Resharder(shards, ["s1", "s2"], ["s1", "s2", "s3"], batch_size=7)
+    resharder.copy()
+
+    late = {}
+    for i in range(40):
+        user_id = str(uuid.uuid4())
+        fleet.create_user(user_id, f"late{i}@gt.edu", f"hash-late-{i}")
+        late[user_id] = f"late{i}@gt.edu"
+    resharder.cleanup()
+
+    grown = ShardedUserExecuter(shards)
+    assert shards["s3"].scan_users("", 1000)
+    for user_id, email in {**users, **late}.items():
+        assert grown.get_user_by_id(user_id)["id"] == email
+        assert grown.login_user(email)["id"] == user_id
+    total = sum(len(shard.scan_users("", 1000)) for shard in shards.values())
+    assert total == len(users) + len(late)
@@ -1,8 +1,19 @@
+import io
 import unittest
+from contextlib import redirect_stdout
+from uuid import UUID
 from unittest.mock import MagicMock, patch
+import mysql.connector
+from prometheus_client import REGISTRY
 from src.repository.outbound.sqlExecuter import UserSQLExecuter
+from src.repository.outbound.connection_pool import PoolTimeoutError
+from src.resilience.circuit_breaker import CLOSED, CircuitOpenError
 from src.app.domain.exceptions import EmailAlreadyExistsError
 
+# Ids are UUIDs, stored as BINARY(16)
+USER_ID = "01890a5d-ac96-774b-bcce-b302099a8057"
+USER_ID_BYTES = UUID(USER_ID).bytes
+
 
 class TestUserSQLExecuter(unittest.TestCase):
 
@@ -26,19 +37,21 @@ class TestUserSQLExecuter(unittest.TestCase):
 
         # Mock stored_results for create_user to return the generated ID
         mock_result = MagicMock()
-        mock_result.fetchone.return_value = ("uuid-123",)
+        mock_result.fetchone.return_value = (USER_ID_BYTES,)
         mock_cursor.stored_results.return_value = [mock_result]
 
         # Act
-        result = self.executer.create_user("uuid-123", "test@gt.edu", "hash")
+        result = self.executer.create_user(USER_ID, "test@gt.edu", "hash")
 
         # Assert
         mock_cursor.callproc.assert_called_once_with(
-            "create_user", ("uuid-123", "test@gt.edu", "hash")
+            "create_user", (USER_ID_BYTES, "test@gt.edu", "hash")
         )
         self.assertEqual(result, None)
         mock_conn.commit.assert_called_once()
-        mock_conn.close.assert_called_once()
+        # The connection goes back to the pool instead of being closed
+        mock_conn.close.assert_not_called()
+        self.assertEqual(self.executer.pool.idle, 1)
 
     @patch("mysql.connector.connect")
     def test_login_user_success(self, mock_connect):
@@ -70,13 +83,60 @@ class TestUserSQLExecuter(unittest.TestCase):
         mock_connect.return_value = mock_conn
 
         # Simulate the MySQL error for duplicate entry (1062)
-        error = mysql.connector.Error("Email already registered")
-        error.errno = 1062
+        error = mysql.connector.Error(
+            "Duplicate entry 'taken@gt.edu' for key 'users.email'", errno=1062
+        )
         mock_cursor.callproc.side_effect = error
 
         # Act & Assert
         with self.assertRaises(EmailAlreadyExistsError):
-            self.executer.create_user("uuid", "taken@gt.edu", "hash")
+            self.executer.create_user(USER_ID, "taken@gt.edu", "hash")
+
+    @patch("mysql.connector.connect")
+    def test_create_user_duplicate_id_is_not_an_email_conflict(self, mock_connect):
+        # Arrange
+        import mysql.connector
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        error = mysql.connector.Error(
+            "Duplicate entry '...' for key 'users.PRIMARY'", errno=1062
+        )
+        mock_conn.cursor.return_value.callproc.side_effect = error
+
+        # Act & Assert: an id clash is a server bug (500), not a 409
+        with self.assertRaises(mysql.connector.Error) as ctx:
+            self.executer.create_user(USER_ID, "new@gt.edu", "hash")
+        self.assertNotIsInstance(ctx.exception, EmailAlreadyExistsError)
+
+    @patch("mysql.connector.connect")
+    def test_create_user_legacy_procedure_signal_is_mapped(self, mock_connect):
+        # Arrange: a database still running the pre-004 create_user
+        import mysql.connector
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        error = mysql.connector.Error("email already registered", errno=1644)
+        mock_conn.cursor.return_value.callproc.side_effect = error
+
+        # Act & Assert
+        with self.assertRaises(EmailAlreadyExistsError):
+            self.executer.create_user(USER_ID, "taken@gt.edu", "hash")
+
+    @patch("mysql.connector.connect")
+    def test_create_user_other_signal_is_not_mapped(self, mock_connect):
+        # Arrange
+        import mysql.connector
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        error = mysql.connector.Error("id already exists", errno=1644)
+        mock_conn.cursor.return_value.callproc.side_effect = error
+
+        # Act & Assert: an id clash is a server bug (500), not a 409
+        with self.assertRaises(mysql.connector.Error) as ctx:
+            self.executer.create_user(USER_ID, "new@gt.edu", "hash")
+        self.assertNotIsInstance(ctx.exception, EmailAlreadyExistsError)
 
     @patch("mysql.connector.connect")
     def test_get_user_by_id_not_found(self, mock_connect):
@@ -95,5 +155,416 @@ class TestUserSQLExecuter(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestUserSQLExecuterPreparedMode(unittest.TestCase):
+
+    def setUp(self):
+        self.db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": "password",
+            "database": "auth_db",
+            "query_mode": "prepared",
+        }
+        self.executer = UserSQLExecuter(self.db_config)
+
+    @patch("mysql.connector.connect")
+    def test_login_user_uses_prepared_select(self, mock_connect):
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value
+        mock_connect.return_value = mock_conn
+        mock_cursor.fetchall.return_value = [("uuid-456", "$2b$12$hash")]
+
+        # Act
+        result = self.executer.login_user("test@gt.edu")
+
+        # Assert: same mapping as the stored-procedure path, no CALL
+        mock_conn.cursor.assert_called_once_with(prepared=True)
+        mock_cursor.callproc.assert_not_called()
+        sql, args = mock_cursor.execute.call_args[0]
+        self.assertIn("SELECT id, password_hash FROM users", sql)
+        self.assertEqual(args, ("test@gt.edu",))
+        self.assertEqual(
+            result, {"id": "uuid-456", "password_hash": "$2b$12$hash"}
+        )
+
+    @patch("mysql.connector.connect")
+    def test_prepared_cursor_is_cached_per_connection(self, mock_connect):
+        # Arrange
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        mock_conn.cursor.return_value.fetchall.return_value = []
+
+        # Act
+        self.executer.get_user_by_id(USER_ID)
+        self.executer.get_user_by_id("01890a5d-ac96-774b-bcce-b302099a8058")
+
+        # Assert: prepared once, executed twice on the same connection
+        mock_conn.cursor.assert_called_once_with(prepared=True)
+        self.assertEqual(mock_conn.cursor.return_value.execute.call_count, 2)
+        mock_connect.assert_called_once()
+
+    @patch("mysql.connector.connect")
+    def test_create_user_commits_prepared_insert(self, mock_connect):
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value
+        mock_connect.return_value = mock_conn
+
+        # Act
+        result = self.executer.create_user(USER_ID, "test@gt.edu", "hash")
+
+        # Assert
+        sql, args = mock_cursor.execute.call_args[0]
+        self.assertTrue(sql.startswith("INSERT INTO users"))
+        self.assertEqual(args, (USER_ID_BYTES, "test@gt.edu", "hash"))
+        self.assertIsNone(result)
+        mock_conn.commit.assert_called_once()
+
+    @patch("mysql.connector.connect")
+    def test_create_user_duplicate_email(self, mock_connect):
+        # Arrange
+        import mysql.connector
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        error = mysql.connector.Error(
+            "Duplicate entry 'taken@gt.edu' for key 'users.email'", errno=1062
+        )
+        mock_conn.cursor.return_value.execute.side_effect = error
+
+        # Act & Assert
+        with self.assertRaises(EmailAlreadyExistsError):
+            self.executer.create_user(USER_ID, "taken@gt.edu", "hash")
+
+        mock_conn.rollback.assert_called_once()
+
+    def test_unknown_query_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            UserSQLExecuter({**self.db_config, "query_mode": "orm"})
+
+
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestUserSQLExecuterBatchInsert(unittest.TestCase):
+
+    def setUp(self):
+        self.db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": "password",
+            "database": "auth_db",
+        }
+        self.executer = UserSQLExecuter(self.db_config)
+        self.rows = [
+            (USER_ID, "first@gt.edu", "hash"),
+            ("01890a5d-ac96-774b-bcce-b302099a8058", "taken@gt.edu", "hash"),
+        ]
+
+    @patch("mysql.connector.connect")
+    def test_create_users_is_one_multi_row_insert(self, mock_connect):
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value
+        mock_connect.return_value = mock_conn
+
+        # Act
+        results = self.executer.create_users(self.rows)
+
+        # Assert: one statement, one commit for the whole batch
+        self.assertEqual(results, [None, None])
+        sql, args = mock_cursor.execute.call_args[0]
+        self.assertEqual(sql.count("(%s, LOWER(%s), %s)"), 2)
+        self.assertEqual(args[0], USER_ID_BYTES)
+        self.assertEqual(len(args), 6)
+        mock_conn.start_transaction.assert_called_once()
+        mock_conn.commit.assert_called_once()
+
+    @patch("mysql.connector.connect")
+    def test_create_users_isolates_the_duplicate_row(self, mock_connect):
+        # Arrange
+        import mysql.connector
+
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value
+        mock_connect.return_value = mock_conn
+
+        def execute(sql, args=()):
+            if "taken@gt.edu" in args:
+                raise mysql.connector.Error(
+                    "Duplicate entry 'taken@gt.edu' for key 'users.email'",
+                    errno=1062,
+                )
+
+        mock_cursor.execute.side_effect = execute
+
+        # Act
+        results = self.executer.create_users(self.rows)
+
+        # Assert: only the duplicate caller gets the error, the rest commit
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], EmailAlreadyExistsError)
+        statements = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        self.assertIn("ROLLBACK TO SAVEPOINT batch_row", statements)
+        self.assertEqual(mock_conn.commit.call_count, 1)
+
+
+class TestSQLExecutorStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": "password",
+            "database": "auth_db",
+        }
+        self.executer = UserSQLExecuter(self.db_config)
+
+    @patch("mysql.connector.connect")
+    def test_export_streams_through_unbuffered_cursor(self, mock_connect):
+        # Arrange: two fetchmany batches, then the end of the result
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value
+        mock_connect.return_value = mock_conn
+        mock_cursor.fetchmany.side_effect = [
+            [(USER_ID_BYTES, "a@gt.edu", "t1")],
+            [(USER_ID_BYTES, "b@gt.edu", "t2")],
+            [],
+        ]
+
+        # Act
+        rows = list(self.executer.iter_users())
+
+        # Assert
+        mock_conn.cursor.assert_called_once_with(buffered=False)
+        self.assertEqual([row[1] for row in rows], ["a@gt.edu", "b@gt.edu"])
+        self.assertEqual(rows[0][0], USER_ID)
+        self.assertEqual(self.executer.pool.idle, 1)
+
+    @patch("mysql.connector.connect")
+    def test_abandoned_stream_discards_the_connection(self, mock_connect):
+        # Arrange: an endless result set
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        mock_conn.cursor.return_value.fetchmany.return_value = [
+            (USER_ID_BYTES, "a@gt.edu", "t1")
+        ]
+
+        # Act: read one row, then stop
+        stream = self.executer.iter_users()
+        next(stream)
+        stream.close()
+
+        # Assert: rows still in flight, so the connection is not reused
+        mock_conn.close.assert_called_once()
+        self.assertEqual(self.executer.pool.idle, 0)
+        self.assertEqual(self.executer.pool.checked_out, 0)
+
+
+class TestUserSQLExecuterBatchLookup(unittest.TestCase):
+
+    def setUp(self):
+        self.db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": "password",
+            "database": "auth_db",
+        }
+        self.executer = UserSQLExecuter(self.db_config)
+
+    @patch("mysql.connector.connect")
+    def test_lookup_is_one_padded_in_query(self, mock_connect):
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value
+        mock_connect.return_value = mock_conn
+        mock_cursor.fetchall.return_value = [(USER_ID_BYTES, "a@gt.edu", "t1")]
+        other = "01890a5d-ac96-774b-bcce-b302099a8058"
+
+        # Act: 3 distinct valid ids (plus a malformed one)
+        found = self.executer.get_users_by_ids(
+            [USER_ID, other, "bogus", "01890a5d-ac96-774b-bcce-b302099a8059"]
+        )
+
+        # Assert: padded to 4 placeholders, one round trip
+        sql, args = mock_cursor.execute.call_args[0]
+        self.assertEqual(sql.count("%s"), 4)
+        self.assertEqual(len(args), 4)
+        self.assertEqual(args[0], USER_ID_BYTES)
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(found, {USER_ID: ("a@gt.edu", "t1")})
+
+    def test_no_valid_ids_skips_the_database(self):
+        self.assertEqual(self.executer.get_users_by_ids(["bogus"]), {})
+
+
+class TestSQLExecutorResilience(unittest.TestCase):
+
+    def setUp(self):
+        self.db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": "password",
+            "database": "auth_db",
+            "breaker_failures": 2,
+            "breaker_reset_seconds": 60,
+        }
+
+    @patch("mysql.connector.connect")
+    def test_breaker_opens_after_connect_failures(self, mock_connect):
+        # Arrange: the server is unreachable
+        mock_connect.side_effect = mysql.connector.errors.InterfaceError("down")
+        executer = UserSQLExecuter(self.db_config)
+
+        # Act: two failed attempts trip the breaker
+        for _ in range(2):
+            with self.assertRaises(mysql.connector.errors.InterfaceError):
+                executer.login_user("test@gt.edu")
+
+        # Assert: the third call fails fast without trying to connect
+        with self.assertRaises(CircuitOpenError):
+            executer.login_user("test@gt.edu")
+        self.assertEqual(mock_connect.call_count, 2)
+        self.assertEqual(executer.pool.checked_out, 0)
+
+    @patch("mysql.connector.connect")
+    def test_pool_timeouts_do_not_open_the_breaker(self, mock_connect):
+        # Arrange: the only pooled connection is held by another request
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = (USER_ID_BYTES, "$2b$12$hash")
+        mock_connect.return_value.cursor.return_value.stored_results.return_value = [
+            mock_result
+        ]
+        executer = UserSQLExecuter(
+            {**self.db_config, "pool_size": 1, "pool_max_overflow": 0}
+        )
+        executer.pool.timeout = 0.01
+        held = executer.pool.acquire()
+
+        # Act: more timeouts than breaker_failures (local load, not MySQL)
+        for _ in range(3):
+            with self.assertRaises(PoolTimeoutError):
+                executer.login_user("test@gt.edu")
+        executer.pool.release(held)
+
+        # Assert: the breaker stayed closed, the next read goes through
+        self.assertEqual(executer.pool.breaker.state, CLOSED)
+        self.assertEqual(executer.login_user("test@gt.edu")["id"], USER_ID)
+
+    @patch("mysql.connector.connect")
+    def test_read_is_retried_after_dropped_connection(self, mock_connect):
+        # Arrange: the first connect fails, the second works
+        mock_conn = MagicMock()
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = (USER_ID_BYTES, "$2b$12$hash")
+        mock_conn.cursor.return_value.stored_results.return_value = [mock_result]
+        mock_connect.side_effect = [
+            mysql.connector.errors.InterfaceError("reset"),
+            mock_conn,
+        ]
+        executer = UserSQLExecuter({**self.db_config, "read_retries": 1})
+
+        # Act
+        row = executer.login_user("test@gt.edu")
+
+        # Assert
+        self.assertEqual(row["id"], USER_ID)
+        self.assertEqual(mock_connect.call_count, 2)
+
+    @patch("mysql.connector.connect")
+    def test_writes_are_not_retried(self, mock_connect):
+        mock_connect.side_effect = mysql.connector.errors.InterfaceError("reset")
+        executer = UserSQLExecuter({**self.db_config, "read_retries": 3})
+
+        with self.assertRaises(mysql.connector.errors.InterfaceError):
+            executer.create_user(USER_ID, "test@gt.edu", "hash")
+        self.assertEqual(mock_connect.call_count, 1)
+
+
+class TestSQLExecutorInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": "password",
+            "database": "auth_db",
+        }
+
+    @staticmethod
+    def sample(name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    @staticmethod
+    def connect_returning(mock_connect, row):
+        mock_conn = MagicMock()
+        mock_result = MagicMock()
+        mock_result.fetchone.return_value = row
+        mock_conn.cursor.return_value.stored_results.return_value = [mock_result]
+        mock_connect.return_value = mock_conn
+        return mock_conn
+
+    @patch("mysql.connector.connect")
+    def test_read_records_latency_and_rows_by_procedure(self, mock_connect):
+        # Arrange
+        self.connect_returning(mock_connect, (USER_ID_BYTES, "$2b$12$hash"))
+        executer = UserSQLExecuter(self.db_config)
+        count = "auth_db_query_seconds_count"
+        before = self.sample(count, query="login_user", outcome="ok")
+        rows_before = self.sample("auth_db_query_rows_total", query="login_user")
+
+        # Act
+        executer.login_user("test@gt.edu")
+
+        # Assert
+        self.assertEqual(
+            self.sample(count, query="login_user", outcome="ok"), before + 1
+        )
+        self.assertEqual(
+            self.sample("auth_db_query_rows_total", query="login_user"),
+            rows_before + 1,
+        )
+
+    @patch("mysql.connector.connect")
+    def test_failed_write_is_counted_by_errno(self, mock_connect):
+        # Arrange
+        mock_conn = self.connect_returning(mock_connect, None)
+        mock_conn.cursor.return_value.callproc.side_effect = mysql.connector.Error(
+            "Duplicate entry 'a@gt.edu' for key 'users.email'", errno=1062
+        )
+        executer = UserSQLExecuter(self.db_config)
+        labels = {"query": "create_user", "errno": "1062"}
+        before = self.sample("auth_db_query_errors_total", **labels)
+
+        # Act
+        with self.assertRaises(EmailAlreadyExistsError):
+            executer.create_user(USER_ID, "a@gt.edu", "hash")
+
+        # Assert
+        self.assertEqual(
+            self.sample("auth_db_query_errors_total", **labels), before + 1
+        )
+
+    @patch("mysql.connector.connect")
+    def test_disabled_metrics_record_nothing_but_slow_queries_log(self, mock_connect):
+        # Arrange: every query counts as slow
+        self.connect_returning(mock_connect, ("a@gt.edu", "t1"))
+        executer = UserSQLExecuter(
+            {**self.db_config, "metrics": False, "slow_query_ms": 1e-6}
+        )
+        count = "auth_db_query_seconds_count"
+        before = self.sample(count, query="get_user_by_id", outcome="ok")
+
+        # Act
+        out = io.StringIO()
+        with redirect_stdout(out):
+            executer.get_user_by_id(USER_ID)
+
+        # Assert: logged by name, arguments never printed
+        self.assertEqual(
+            self.sample(count, query="get_user_by_id", outcome="ok"), before
+        )
+        self.assertIn("SLOW QUERY get_user_by_id", out.getvalue())
+        self.assertNotIn("a@gt.edu", out.getvalue())
@@ -0,0 +1,89 @@
+import sqlite3
+import threading
+from datetime import datetime
+import pytest
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.app.domain.exceptions import EmailAlreadyExistsError
+
+ID_1 = "01890a5d-ac96-774b-bcce-b302099a8057"
+ID_2 = "01890a5d-ac96-774b-bcce-b302099a8058"
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def executer(tmp_path):
+    """Real SQLite database file per test."""
+    return SQLiteUserExecuter({"path": str(tmp_path / "auth.db")})
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_create_then_login_user(executer):
+    """
+    Scenario: Register then log in with different email casing.
+    Expected: Email is stored lowercased and lookup is case-insensitive.
+    """
+    executer.create_user(ID_1, "Test@GT.edu", "$2b$12$hash")
+
+    row = executer.login_user("TEST@gt.EDU")
+
+    assert row == {"id": ID_1, "password_hash": "$2b$12$hash"}
+
+
+def test_login_unknown_email_returns_none(executer):
+    assert executer.login_user("ghost@gt.edu") is None
+
+
+def test_duplicate_email_maps_to_domain_error(executer):
+    """
+    Scenario: Same email registered twice (any casing).
+    Expected: EmailAlreadyExistsError, like the MySQL executer.
+    """
+    executer.create_user(ID_1, "dupe@gt.edu", "hash")
+
+    with pytest.raises(EmailAlreadyExistsError):
+        executer.create_user(ID_2, "DUPE@gt.edu", "hash")
+
+
+def test_duplicate_id_is_not_reported_as_email_conflict(executer):
+    executer.create_user(ID_1, "a@gt.edu", "hash")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        executer.create_user(ID_1, "b@gt.edu", "hash")
+
+
+def test_get_user_by_id_returns_email_and_created_at(executer):
+    executer.create_user(ID_1, "profile@gt.edu", "hash")
+
+    row = executer.get_user_by_id(ID_1)
+
+    assert row["id"] == "profile@gt.edu"
+    assert isinstance(row["createdAt"], datetime)
+    assert executer.get_user_by_id("missing") is None
+
+
+def test_uses_wal_and_one_connection_per_thread(executer):
+    """
+    Scenario: Requests served from several Flask threads.
+    Expected: Each thread gets its own WAL-mode connection.
+    """
+    main_conn = executer._get_connection()
+    seen = []
+
+    def worker():
+        executer.create_user(ID_2, "thread@gt.edu", "hash")
+        seen.append(executer._get_connection())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not main_conn
+    assert main_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert executer.get_user_by_id(ID_2) is not None
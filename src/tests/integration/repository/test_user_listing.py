@@ -0,0 +1,86 @@
+import uuid
+import pytest
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.repository.outbound.shardedExecuter import ShardedUserExecuter
+from src.repository.outbound.userRepo import UserRepo
+from src.app.services.user_service import UserService
+from src.app.domain.exceptions import UserDomainValidationError
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def single(tmp_path):
+    return SQLiteUserExecuter({"path": str(tmp_path / "auth.db")})
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    return ShardedUserExecuter(
+        {
+            name: SQLiteUserExecuter({"path": str(tmp_path / f"{name}.db")})
+            for name in ("s1", "s2", "s3")
+        }
+    )
+
+
+def register(executer, count):
+    for i in range(count):
+        executer.create_user(str(uuid.uuid4()), f"user{i}@gt.edu", "hash")
+
+
+def page_through(service, limit):
+    seen, cursor, pages = [], None, 0
+    while True:
+        users, cursor = service.list_users(limit, cursor)
+        seen.extend(user.user_id for user in users)
+        pages += 1
+        if cursor is None:
+            return seen, pages
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+@pytest.mark.parametrize("store", ["single", "sharded"])
+def test_keyset_pages_cover_every_user_once(store, request):
+    """
+    Scenario: 25 users created within the same second (created_at ties),
+    listed 7 at a time.
+    Expected: The id tie-breaker keeps pages disjoint and complete, in the
+    same order as the streaming export.
+    """
+    executer = request.getfixturevalue(store)
+    register(executer, 25)
+    service = UserService(UserRepo(executer, hasher=None))
+
+    listed, pages = page_through(service, limit=7)
+    exported = [user.user_id for user in service.export_users()]
+
+    assert pages == 4
+    assert len(set(listed)) == 25
+    assert listed == exported
+
+
+def test_last_full_page_still_ends_the_listing(single):
+    register(single, 4)
+    service = UserService(UserRepo(single, hasher=None))
+
+    listed, pages = page_through(service, limit=2)
+
+    # Two full pages, then an empty one without a cursor
+    assert len(listed) == 4
+    assert pages == 3
+
+
+def test_invalid_paging_is_a_validation_error(single):
+    service = UserService(UserRepo(single, hasher=None))
+
+    with pytest.raises(UserDomainValidationError):
+        service.list_users(0)
+    with pytest.raises(UserDomainValidationError):
+        service.list_users(10, "not-a-cursor")
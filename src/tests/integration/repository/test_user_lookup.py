@@ -0,0 +1,76 @@
+import uuid
+import pytest
+from src.repository.outbound.sqliteExecuter import SQLiteUserExecuter
+from src.repository.outbound.shardedExecuter import ShardedUserExecuter
+from src.repository.outbound.userRepo import UserRepo
+from src.app.services.user_service import UserService, MAX_LOOKUP_IDS
+from src.app.domain.exceptions import UserDomainValidationError
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def single(tmp_path):
+    return SQLiteUserExecuter({"path": str(tmp_path / "auth.db")})
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    return ShardedUserExecuter(
+        {
+            name: SQLiteUserExecuter({"path": str(tmp_path / f"{name}.db")})
+            for name in ("s1", "s2", "s3")
+        }
+    )
+
+
+def register(executer, count):
+    ids = [str(uuid.uuid4()) for _ in range(count)]
+    for i, user_id in enumerate(ids):
+        executer.create_user(user_id, f"user{i}@gt.edu", "hash")
+    return ids
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+@pytest.mark.parametrize("store", ["single", "sharded"])
+def test_batch_lookup_preserves_order_and_reports_misses(store, request):
+    """
+    Scenario: Mixed batch of known, unknown, malformed and repeated ids.
+    Expected: Known users in input order (once each), the rest as missing.
+    """
+    executer = request.getfixturevalue(store)
+    ids = register(executer, 6)
+    service = UserService(UserRepo(executer, hasher=None))
+    unknown = str(uuid.uuid4())
+
+    users, missing = service.fetch_users(
+        [ids[4], unknown, ids[1].upper(), "not-a-uuid", ids[4], ids[0]]
+    )
+
+    assert [u.user_id for u in users] == [ids[4], ids[1], ids[0]]
+    assert [u.email for u in users] == ["user4@gt.edu", "user1@gt.edu", "user0@gt.edu"]
+    assert missing == [unknown, "not-a-uuid"]
+
+
+def test_batch_lookup_is_one_query(single):
+    ids = register(single, 3)
+    calls = []
+    single.get_user_by_id = lambda *a: calls.append(a)
+
+    found = single.get_users_by_ids(ids)
+
+    assert set(found) == set(ids)
+    assert calls == []
+
+
+def test_batch_lookup_is_bounded(single):
+    service = UserService(UserRepo(single, hasher=None))
+
+    with pytest.raises(UserDomainValidationError):
+        service.fetch_users([str(uuid.uuid4()) for _ in range(MAX_LOOKUP_IDS + 1)])
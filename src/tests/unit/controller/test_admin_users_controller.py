@@ -0,0 +1,163 @@
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from src.controller.inbound.list_users_controller import ListUsersController
+from src.controller.inbound.export_users_controller import ExportUsersController
+from src.controller.outbound.http import StreamingHttpResponse
+from src.controller.outbound.user_dto import UserDTO
+from src.app.domain.exceptions import UserDomainValidationError
+
+TOKEN = "admin-secret"
+USER = UserDTO.create("buzz@gatech.edu", "uuid-1", datetime(2024, 1, 2, 3, 4, 5))
+BENCH_USER = UserDTO.create("load-1@bench.test", "uuid-2", datetime(2024, 1, 3))
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def mock_user_service():
+    return Mock()
+
+
+@pytest.fixture
+def admin_request():
+    request = Mock()
+    request.headers = {"X-Admin-Token": TOKEN}
+    request.args = {}
+    return request
+
+
+# ----------------------------------------------------------------
+# Access control
+# ----------------------------------------------------------------
+
+
+def test_admin_routes_are_hidden_without_a_configured_token(
+    mock_user_service, admin_request
+):
+    controller = ListUsersController(mock_user_service, admin_token="")
+
+    assert controller.handle(admin_request).status_code == 404
+    mock_user_service.list_users.assert_not_called()
+
+
+def test_wrong_admin_token_is_forbidden(mock_user_service, admin_request):
+    admin_request.headers = {"X-Admin-Token": "guess"}
+
+    for controller in (
+        ListUsersController(mock_user_service, TOKEN),
+        ExportUsersController(mock_user_service, TOKEN),
+    ):
+        assert controller.handle(admin_request).status_code == 403
+
+
+# ----------------------------------------------------------------
+# Listing
+# ----------------------------------------------------------------
+
+
+def test_list_users_returns_page_and_cursor(mock_user_service, admin_request):
+    """
+    Scenario: Admin asks for a page.
+    Expected: 200 with users (no password hashes) and the next cursor.
+    """
+    admin_request.args = {"limit": "1", "after": "abc"}
+    mock_user_service.list_users.return_value = ([USER], "next-cursor")
+
+    response = ListUsersController(mock_user_service, TOKEN).handle(admin_request)
+
+    assert response.status_code == 200
+    mock_user_service.list_users.assert_called_once_with(1, "abc")
+    assert response.body == {
+        "users": [
+            {
+                "id": "uuid-1",
+                "email": "buzz@gatech.edu",
+                "createdAt": "2024-01-02T03:04:05",
+            }
+        ],
+        "nextCursor": "next-cursor",
+    }
+
+
+def test_list_users_returns_stored_special_use_addresses(
+    mock_user_service, admin_request
+):
+    """
+    Scenario: A stored email on a special-use domain (as the benches insert).
+    Expected: Listed as stored; it is not re-validated into a 500.
+    """
+    mock_user_service.list_users.return_value = ([USER, BENCH_USER], None)
+
+    response = ListUsersController(mock_user_service, TOKEN).handle(admin_request)
+
+    assert response.status_code == 200
+    assert [user["email"] for user in response.body["users"]] == [
+        "buzz@gatech.edu",
+        "load-1@bench.test",
+    ]
+
+
+@pytest.mark.parametrize(
+    "args, error",
+    [
+        ({"limit": "many"}, None),
+        ({"after": "bogus"}, UserDomainValidationError("Invalid cursor")),
+    ],
+)
+def test_list_users_rejects_bad_paging(mock_user_service, admin_request, args, error):
+    admin_request.args = args
+    mock_user_service.list_users.side_effect = error
+
+    response = ListUsersController(mock_user_service, TOKEN).handle(admin_request)
+
+    assert response.status_code == 400
+
+
+# ----------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------
+
+
+def test_export_streams_ndjson_lazily(mock_user_service, admin_request):
+    """
+    Scenario: Admin exports every user.
+    Expected: A streaming NDJSON response that only pulls users when read.
+    """
+    pulled = []
+
+    def users():
+        for user in (USER, USER):
+            pulled.append(user)
+            yield user
+
+    mock_user_service.export_users.return_value = users()
+
+    response = ExportUsersController(mock_user_service, TOKEN).handle(admin_request)
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.content_type == "application/x-ndjson"
+    assert pulled == []
+    lines = list(response.body)
+    assert len(lines) == 2
+    assert json.loads(lines[0])["email"] == "buzz@gatech.edu"
+
+
+def test_export_streams_stored_special_use_addresses(mock_user_service, admin_request):
+    """
+    Scenario: A special-use address in the middle of the export.
+    Expected: Every line is written; the stream is not cut short.
+    """
+    mock_user_service.export_users.return_value = iter([USER, BENCH_USER, USER])
+
+    response = ExportUsersController(mock_user_service, TOKEN).handle(admin_request)
+
+    lines = [json.loads(line) for line in response.body]
+    assert [line["email"] for line in lines] == [
+        "buzz@gatech.edu",
+        "load-1@bench.test",
+        "buzz@gatech.edu",
+    ]
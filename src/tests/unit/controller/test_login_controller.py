@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import Mock
 from src.controller.inbound.login_controller import LoginController
-from src.app.domain.exceptions import AuthenticationError
+from src.app.domain.exceptions import AuthenticationError, HashingOverloadedError
 
 # ----------------------------------------------------------------
 # Fixtures
@@ -114,3 +114,18 @@ def test_login_fails_validation(login_controller):
     # Assert
     assert response.status_code == 400
     assert "Field required" in str(response.body["error"])
+
+
+def test_login_hashing_overloaded(login_controller, mock_user_service):
+    """
+    Scenario: The password hashing pool is full.
+    Expected: 503 with Retry-After and no cookies.
+    """
+    mock_request = Mock()
+    mock_request.json = {"email": "test@gt.edu", "password": "pass"}
+    mock_user_service.login.side_effect = HashingOverloadedError("busy", retry_after=1)
+
+    response = login_controller.handle(mock_request)
+
+    assert response.status_code == 503
+    assert response.headers == [("Retry-After", "1")]
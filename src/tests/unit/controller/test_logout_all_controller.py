@@ -0,0 +1,83 @@
+import pytest  # type: ignore
+from unittest.mock import Mock
+from src.app.domain.exceptions import TokenError
+from src.controller.inbound.logout_all_controller import LogoutAllController
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def mock_token_service():
+    return Mock()
+
+
+@pytest.fixture
+def logout_all_controller(mock_token_service):
+    return LogoutAllController(mock_token_service)
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_logout_all_success(logout_all_controller, mock_token_service):
+    """
+    Scenario: User asks to be logged out of every session.
+    Expected: TokenService.logout_everywhere() is called, 200, cookies cleared.
+    """
+    mock_request = Mock()
+    mock_request.cookies = {"refresh_token": "valid.jwt.token"}
+
+    response = logout_all_controller.handle(mock_request)
+
+    mock_token_service.logout_everywhere.assert_called_once_with("valid.jwt.token")
+    assert response.status_code == 200
+    set_cookie_headers = [val for key, val in response.headers if key == "Set-Cookie"]
+    all_cookies_str = " | ".join(set_cookie_headers)
+    assert "refresh_token=" in all_cookies_str
+    assert "Max-Age=0" in all_cookies_str
+
+
+def test_logout_all_requires_refresh_cookie(logout_all_controller, mock_token_service):
+    """
+    Scenario: No refresh cookie: we cannot tell whose sessions to revoke.
+    Expected: 401 and nothing revoked.
+    """
+    mock_request = Mock()
+    mock_request.cookies = {}
+
+    response = logout_all_controller.handle(mock_request)
+
+    assert response.status_code == 401
+    mock_token_service.logout_everywhere.assert_not_called()
+
+
+def test_logout_all_rejects_invalid_token(logout_all_controller, mock_token_service):
+    """
+    Scenario: The refresh cookie is forged or expired.
+    Expected: 401.
+    """
+    mock_request = Mock()
+    mock_request.cookies = {"refresh_token": "forged"}
+    mock_token_service.logout_everywhere.side_effect = TokenError("bad signature")
+
+    response = logout_all_controller.handle(mock_request)
+
+    assert response.status_code == 401
+
+
+def test_logout_all_reports_failure(logout_all_controller, mock_token_service):
+    """
+    Scenario: Redis is down, the counter cannot be bumped.
+    Expected: 500, so the user knows the other sessions are still alive.
+    """
+    mock_request = Mock()
+    mock_request.cookies = {"refresh_token": "valid.jwt.token"}
+    mock_token_service.logout_everywhere.side_effect = ConnectionError("down")
+
+    response = logout_all_controller.handle(mock_request)
+
+    assert response.status_code == 500
@@ -0,0 +1,87 @@
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from src.controller.inbound.lookup_users_controller import LookupUsersController
+from src.controller.outbound.user_dto import UserDTO
+from src.app.services.user_service import MAX_LOOKUP_IDS
+
+TOKEN = "internal-secret"
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def mock_user_service():
+    return Mock()
+
+
+@pytest.fixture
+def controller(mock_user_service):
+    return LookupUsersController(mock_user_service, TOKEN)
+
+
+def make_request(body, token=TOKEN):
+    request = Mock()
+    request.headers = {"X-Internal-Token": token}
+    request.json = body
+    return request
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_lookup_returns_users_and_missing(controller, mock_user_service):
+    """
+    Scenario: Downstream service looks up two ids, one unknown.
+    Expected: 200 with the found user and the unknown id under "missing".
+    """
+    user = UserDTO.create("buzz@gatech.edu", "uuid-1", datetime(2024, 1, 1))
+    mock_user_service.fetch_users.return_value = ([user], ["uuid-2"])
+
+    response = controller.handle(make_request({"ids": ["uuid-1", "uuid-2"]}))
+
+    assert response.status_code == 200
+    mock_user_service.fetch_users.assert_called_once_with(["uuid-1", "uuid-2"])
+    assert response.body["users"][0]["email"] == "buzz@gatech.edu"
+    assert response.body["missing"] == ["uuid-2"]
+
+
+def test_lookup_returns_stored_special_use_addresses(controller, mock_user_service):
+    """
+    Scenario: One of the looked-up users has a stored .local address.
+    Expected: The whole batch is returned; that address is not re-validated.
+    """
+    users = [
+        UserDTO.create("buzz@gatech.edu", "uuid-1", datetime(2024, 1, 1)),
+        UserDTO.create("printer@office.local", "uuid-2", datetime(2024, 1, 1)),
+    ]
+    mock_user_service.fetch_users.return_value = (users, [])
+
+    response = controller.handle(make_request({"ids": ["uuid-1", "uuid-2"]}))
+
+    assert response.status_code == 200
+    assert [user["email"] for user in response.body["users"]] == [
+        "buzz@gatech.edu",
+        "printer@office.local",
+    ]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [{}, {"ids": "uuid-1"}, {"ids": ["x"] * (MAX_LOOKUP_IDS + 1)}, ["uuid-1"]],
+)
+def test_lookup_rejects_bad_bodies(controller, mock_user_service, body):
+    response = controller.handle(make_request(body))
+
+    assert response.status_code == 400
+    mock_user_service.fetch_users.assert_not_called()
+
+
+def test_lookup_requires_internal_token(controller, mock_user_service):
+    response = controller.handle(make_request({"ids": []}, token="nope"))
+
+    assert response.status_code == 403
@@ -1,7 +1,11 @@
 import pytest
 from unittest.mock import Mock
 from src.controller.inbound.register_controller import RegisterController
-from src.app.domain.exceptions import UserDomainValidationError, EmailAlreadyExistsError
+from src.app.domain.exceptions import (
+    EmailAlreadyExistsError,
+    HashingOverloadedError,
+    UserDomainValidationError,
+)
 
 # ----------------------------------------------------------------
 # Fixtures
@@ -170,3 +174,24 @@ def test_handle_register_unexpected_crash(controller, mock_user_service):
     # Assert
     assert response.status_code == 500
     assert response.body["error"] == "Internal Server Error"
+
+
+def test_handle_register_hashing_overloaded(controller, mock_user_service):
+    """
+    Scenario: The password hashing pool is full.
+    Expected: 503 with Retry-After, so the client backs off and retries.
+    """
+    mock_request = Mock()
+    mock_request.json = {
+        "email": "user@gatech.edu",
+        "pass1": "Pass123!",
+        "pass2": "Pass123!",
+    }
+    mock_user_service.register.side_effect = HashingOverloadedError(
+        "busy", retry_after=2
+    )
+
+    response = controller.handle(mock_request)
+
+    assert response.status_code == 503
+    assert ("Retry-After", "2") in response.headers
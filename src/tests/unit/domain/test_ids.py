@@ -0,0 +1,37 @@
+from uuid import UUID
+from src.app.domain.ids import uuid7
+from src.mapper.user_mapper import UserMapper
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_strictly_increasing():
+    """
+    Scenario: Burst of ids generated within the same millisecond.
+    Expected: Each id sorts after the previous one, as strings and as bytes.
+    """
+    ids = [uuid7() for _ in range(5000)]
+
+    assert [str(i) for i in ids] == sorted(str(i) for i in ids)
+    assert [i.bytes for i in ids] == sorted(set(i.bytes for i in ids))
+
+
+def test_mapper_round_trips_binary_ids():
+    """
+    Scenario: Id written as BINARY(16) and read back from the row.
+    Expected: The API still sees the canonical string form.
+    """
+    user_id = uuid7()
+
+    raw = UserMapper.id_to_db(user_id)
+
+    assert len(raw) == 16
+    assert UserMapper.id_from_db(raw) == str(user_id)
+    assert UserMapper.id_from_db(bytearray(raw)) == str(user_id)
+    assert UserMapper.id_to_db(str(user_id).upper()) == raw
+    assert UUID(UserMapper.id_from_db(raw)) == user_id
@@ -0,0 +1,184 @@
+import pytest
+from src.resilience.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from src.resilience.retry import retry_call
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "test-dependency",
+        failure_threshold=3,
+        reset_timeout=10,
+        failure_types=(ConnectionError,),
+        clock=clock,
+    )
+
+
+def fail():
+    raise ConnectionError("down")
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+
+# ----------------------------------------------------------------
+# Circuit breaker
+# ----------------------------------------------------------------
+
+
+def test_consecutive_failures_open_the_breaker(breaker):
+    """
+    Scenario: The dependency fails `failure_threshold` times in a row.
+    Expected: The breaker opens and the next call fails fast without running.
+    """
+    trip(breaker)
+    calls = []
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, 1)
+
+    assert breaker.state == OPEN
+    assert calls == []
+
+
+def test_success_resets_the_failure_count(breaker):
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+    breaker.call(lambda: None)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+    assert breaker.state == CLOSED
+
+
+def test_other_errors_mean_the_dependency_answered(breaker):
+    """
+    Scenario: Calls raise an error outside `failure_types` (e.g. bad input).
+    Expected: Propagated, but the breaker stays closed.
+    """
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            breaker.call(int, "not a number")
+
+    assert breaker.state == CLOSED
+
+
+def test_ignored_errors_are_neither_failure_nor_success(clock):
+    """
+    Scenario: Calls raise an error in `ignore_types` (e.g. a local pool
+    timeout), while closed and during the half-open trial.
+    Expected: Propagated; they neither open, close nor reset the breaker,
+    and the trial slot is freed.
+    """
+    breaker = CircuitBreaker(
+        "test-dependency",
+        failure_threshold=2,
+        reset_timeout=10,
+        failure_types=(ConnectionError,),
+        ignore_types=(TimeoutError,),
+        clock=clock,
+    )
+
+    def busy():
+        raise TimeoutError("no free connection")
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            breaker.call(busy)
+    assert breaker.state == CLOSED
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    with pytest.raises(TimeoutError):
+        breaker.call(busy)
+    assert breaker.state == HALF_OPEN
+    breaker.call(lambda: None)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_trial_success_closes(breaker, clock):
+    """
+    Scenario: The reset timeout passes and the trial call succeeds.
+    Expected: Only one trial is let through at a time; success closes.
+    """
+    trip(breaker)
+    clock.now += 10
+
+    assert breaker.state == HALF_OPEN
+    with breaker.guard():
+        # A second caller during the trial is still rejected
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_trial_failure_reopens(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state == OPEN
+    clock.now += 9
+    assert breaker.state == OPEN
+
+
+# ----------------------------------------------------------------
+# Retries
+# ----------------------------------------------------------------
+
+
+def test_retry_backs_off_with_bounded_jitter():
+    """
+    Scenario: A read fails twice with a retryable error, then succeeds.
+    Expected: Result returned; each wait is within the exponential cap.
+    """
+    outcomes = [ConnectionError(), ConnectionError(), "row"]
+    waits = []
+
+    def read():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    result = retry_call(
+        read, retries=2, retry_on=(ConnectionError,), base_delay=0.1, sleep=waits.append
+    )
+
+    assert result == "row"
+    assert len(waits) == 2
+    assert 0 <= waits[0] <= 0.1 and 0 <= waits[1] <= 0.2
+
+
+def test_retry_gives_up_and_ignores_other_errors():
+    waits = []
+
+    with pytest.raises(ConnectionError):
+        retry_call(fail, retries=2, retry_on=(ConnectionError,), sleep=waits.append)
+    assert len(waits) == 2
+
+    with pytest.raises(ValueError):
+        retry_call(lambda: int("x"), retry_on=(ConnectionError,), sleep=waits.append)
+    assert len(waits) == 2
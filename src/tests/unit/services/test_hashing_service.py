@@ -0,0 +1,182 @@
+import threading
+import pytest
+from src.app.domain.exceptions import HashingOverloadedError
+from src.app.services.hashing_service import (
+    ARGON2ID,
+    BCRYPT,
+    Argon2Hasher,
+    BcryptHasher,
+    MixedFormatHasher,
+    PooledHasher,
+    hash_format,
+)
+from src.app.services.inbound.hashing_service import Hasher
+
+# ----------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------
+
+
+class BlockingHasher(Hasher):
+    """Verifies only once `release` is set; counts the calls it is running."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def hash_password(self, password):
+        return f"hashed:{password}"
+
+    def verify_password(self, password, password_hash):
+        self.started.release()
+        self.release.wait(timeout=5)
+        return password_hash == f"hashed:{password}"
+
+
+class PlainHasher(Hasher):
+    """Picklable, for the process pool."""
+
+    def hash_password(self, password):
+        return f"hashed:{password}"
+
+    def verify_password(self, password, password_hash):
+        return password_hash == f"hashed:{password}"
+
+
+@pytest.fixture
+def inner():
+    return BlockingHasher()
+
+
+# ----------------------------------------------------------------
+# Tests
+# ----------------------------------------------------------------
+
+
+def test_pooled_hasher_delegates(inner):
+    inner.release.set()
+    hasher = PooledHasher(inner, workers=2)
+
+    password_hash = hasher.hash_password("secret")
+
+    assert hasher.verify_password("secret", password_hash) is True
+    assert hasher.verify_password("wrong", password_hash) is False
+
+
+def test_full_pool_rejects_fast(inner):
+    """
+    Scenario: One worker busy and the one queue slot taken.
+    Expected: The next verification raises HashingOverloadedError at once
+    (with the configured Retry-After); queued work still completes.
+    """
+    hasher = PooledHasher(inner, workers=1, max_queue=1, retry_after=3)
+    results = []
+
+    def verify():
+        results.append(hasher.verify_password("secret", "hashed:secret"))
+
+    callers = [threading.Thread(target=verify) for _ in range(2)]
+    for caller in callers:
+        caller.start()
+    assert inner.started.acquire(timeout=2)
+
+    with pytest.raises(HashingOverloadedError) as exc:
+        hasher.verify_password("secret", "hashed:secret")
+    assert exc.value.retry_after == 3
+
+    inner.release.set()
+    for caller in callers:
+        caller.join()
+    assert results == [True, True]
+
+
+def test_process_pool_runs_the_hasher():
+    hasher = PooledHasher(PlainHasher(), mode="process", workers=1)
+
+    assert hasher.verify_password("secret", "hashed:secret") is True
+
+
+def test_unknown_mode_is_rejected(inner):
+    with pytest.raises(ValueError):
+        PooledHasher(inner, mode="fibers")
+
+
+def test_bcrypt_needs_rehash_when_the_cost_changes():
+    """
+    Scenario: Hashes made at cost 4, the policy moves to cost 5.
+    Expected: Old hashes need a rehash, new ones do not; both still verify.
+    """
+    old = BcryptHasher(rounds=4).hash_password("secret")
+    hasher = BcryptHasher(rounds=5)
+    new = hasher.hash_password("secret")
+
+    assert hasher.needs_rehash(old) is True
+    assert hasher.needs_rehash(new) is False
+    assert hasher.needs_rehash("$2a$05$" + new[7:]) is True
+    assert hasher.verify_password("secret", old) is True
+
+
+def test_bcrypt_rejects_out_of_range_rounds():
+    with pytest.raises(ValueError):
+        BcryptHasher(rounds=3)
+
+
+def test_pooled_hasher_reports_saturation(inner):
+    hasher = PooledHasher(inner, workers=1, max_queue=1)
+    caller = threading.Thread(
+        target=hasher.verify_password, args=("secret", "hashed:secret")
+    )
+    assert hasher.is_saturated() is False
+
+    caller.start()
+    assert inner.started.acquire(timeout=2)
+    assert hasher.is_saturated() is True
+
+    inner.release.set()
+    caller.join()
+    assert hasher.is_saturated() is False
+
+
+def test_argon2_hashes_and_verifies():
+    hasher = Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1)
+    password_hash = hasher.hash_password("secret")
+
+    assert hash_format(password_hash) == ARGON2ID
+    assert hasher.verify_password("secret", password_hash) is True
+    assert hasher.verify_password("wrong", password_hash) is False
+    assert hasher.verify_password("secret", "$argon2id$garbage") is False
+    assert hasher.needs_rehash(password_hash) is False
+    assert Argon2Hasher(time_cost=2, memory_cost=8, parallelism=1).needs_rehash(
+        password_hash
+    )
+
+
+def test_mixed_format_hasher_verifies_both_formats():
+    """
+    Scenario: Migrating from bcrypt to argon2id; both kinds are stored.
+    Expected: New hashes are argon2id; bcrypt and argon2id hashes both
+    verify; only the bcrypt one needs a rehash.
+    """
+    bcrypt_hasher = BcryptHasher(rounds=4)
+    hasher = MixedFormatHasher(
+        ARGON2ID,
+        {
+            BCRYPT: bcrypt_hasher,
+            ARGON2ID: Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),
+        },
+    )
+    old = bcrypt_hasher.hash_password("secret")
+    new = hasher.hash_password("secret")
+
+    assert hash_format(new) == ARGON2ID
+    assert hasher.verify_password("secret", old) is True
+    assert hasher.verify_password("secret", new) is True
+    assert hasher.verify_password("wrong", old) is False
+    assert hasher.verify_password("secret", "plaintext") is False
+    assert hasher.needs_rehash(old) is True
+    assert hasher.needs_rehash(new) is False
+
+
+def test_mixed_format_hasher_rejects_unknown_current_format():
+    with pytest.raises(ValueError):
+        MixedFormatHasher("scrypt", {BCRYPT: BcryptHasher(rounds=4)})
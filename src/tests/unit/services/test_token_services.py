@@ -1,7 +1,10 @@
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, ANY
 from datetime import datetime, timezone
 from src.app.services.token_service import TokenService
+from src.app.jwt.jwt_adapter import JwtAdapter
 from src.app.domain.exceptions import TokenError
 
 # ----------------------------------------------------------------
@@ -77,18 +80,21 @@ def test_refresh_token_rotation_success(token_service, mock_redis, mock_provider
         "jti": "old-jti-123",
         "exp": future_exp,
     }
-    mock_redis.is_blacklisted.return_value = False
+    mock_redis.consume_once_with_generation.return_value = (True, 0)
     mock_provider.encode.side_effect = ["new_access", "new_refresh"]
 
     # Act
     new_access, new_refresh = token_service.refresh_token(old_token_str)
 
     # Assert
-    # 1. Check blacklist was consulted
-    mock_redis.is_blacklisted.assert_called_with("old-jti-123")
-    # 2. Check old token was added to blacklist
-    mock_redis.blacklist_token.assert_called_once()
-    # 3. Check new pair was issued
+    # 1. Old token checked and blacklisted in one atomic call, for its remaining life
+    mock_redis.consume_once_with_generation.assert_called_once_with(
+        "old-jti-123", pytest.approx(3600, abs=1), "456"
+    )
+    mock_redis.is_blacklisted.assert_not_called()
+    # The generation came with it: no separate lookup for the new pair
+    mock_redis.get_generation.assert_not_called()
+    # 2. Check new pair was issued
     assert new_access == "new_access"
     assert new_refresh == "new_refresh"
 
@@ -103,12 +109,33 @@ def test_refresh_fails_if_blacklisted(token_service, mock_redis, mock_provider):
         "jti": "stolen-jti",
         "exp": 9999999999,
     }
-    mock_redis.is_blacklisted.return_value = True
+    mock_redis.consume_once_with_generation.return_value = (False, 0)
 
     with pytest.raises(TokenError, match="Token is blacklisted"):
         token_service.refresh_token("stolen_token")
 
 
+def test_refresh_fails_if_issued_before_logout_everywhere(
+    token_service, mock_redis, mock_provider
+):
+    """
+    Scenario: The user logged out everywhere after this token was issued.
+    Expected: The token's generation is below the counter; it is rejected.
+    """
+    mock_provider.decode.return_value = {
+        "sub": "1",
+        "type": "refresh",
+        "jti": "old-session",
+        "exp": 9999999999,
+        "gen": 2,
+    }
+    mock_redis.consume_once_with_generation.return_value = (True, 3)
+
+    with pytest.raises(TokenError, match="Token has been revoked"):
+        token_service.refresh_token("old_session_token")
+    mock_provider.encode.assert_not_called()
+
+
 def test_refresh_fails_on_wrong_token_type(token_service, mock_provider):
     """
     Scenario: User sends an Access token to the refresh endpoint.
@@ -119,6 +146,96 @@ def test_refresh_fails_on_wrong_token_type(token_service, mock_provider):
         token_service.refresh_token("access_token_acting_as_refresh")
 
 
+class AtomicCache:
+    """Thread-safe stand-in with the SET NX semantics consume_once needs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.keys = set()
+        self.generations = {}
+
+    def consume_once(self, jti, expiry_seconds):
+        with self.lock:
+            if jti in self.keys:
+                return False
+            self.keys.add(jti)
+            return True
+
+    def consume_once_with_generation(self, jti, expiry_seconds, user_id):
+        return self.consume_once(jti, expiry_seconds), self.generation(user_id)
+
+    def generation(self, user_id):
+        return self.generations.get(user_id, 0)
+
+    get_generation = generation
+
+    def bump_generation(self, user_id):
+        with self.lock:
+            self.generations[user_id] = self.generation(user_id) + 1
+            return self.generations[user_id]
+
+
+def test_concurrent_refreshes_with_one_token_rotate_once():
+    """
+    Scenario: The same refresh token is replayed by many requests at once.
+    Expected: Exactly one gets a new pair; every other one is rejected.
+    """
+    service = TokenService(
+        AtomicCache(), JwtAdapter("test-secret-" + "x" * 32, "HS256")
+    )
+    _, refresh = service.create_jwt("user-1")
+    barrier = threading.Barrier(16)
+
+    def attempt(_):
+        barrier.wait()
+        try:
+            service.refresh_token(refresh)
+            return "rotated"
+        except TokenError:
+            return "rejected"
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        outcomes = list(pool.map(attempt, range(16)))
+
+    assert outcomes.count("rotated") == 1
+    assert outcomes.count("rejected") == 15
+
+
+def test_revoke_sessions_rejects_every_earlier_refresh_token():
+    """
+    Scenario: A user with several sessions logs out everywhere.
+    Expected: Every refresh token issued before is rejected; new logins work.
+    """
+    service = TokenService(
+        AtomicCache(), JwtAdapter("test-secret-" + "x" * 32, "HS256")
+    )
+    sessions = [service.create_jwt("user-1")[1] for _ in range(3)]
+    _, other_user = service.create_jwt("user-2")
+
+    service.logout_everywhere(sessions[0])
+
+    for refresh in sessions:
+        with pytest.raises(TokenError, match="revoked"):
+            service.refresh_token(refresh)
+    service.refresh_token(other_user)
+    _, fresh = service.create_jwt("user-1")
+    service.refresh_token(fresh)
+
+
+def test_logout_everywhere_rejects_access_tokens(
+    token_service, mock_redis, mock_provider
+):
+    """
+    Scenario: logout_everywhere is called with an access token.
+    Expected: TokenError; nothing is revoked.
+    """
+    mock_provider.decode.return_value = {"type": "access", "sub": "1"}
+
+    with pytest.raises(TokenError, match="Invalid token type"):
+        token_service.logout_everywhere("access_token")
+    mock_redis.bump_generation.assert_not_called()
+
+
 # ----------------------------------------------------------------
 # 3. Logout & Security Tests
 # ----------------------------------------------------------------
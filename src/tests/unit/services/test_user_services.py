@@ -77,7 +77,7 @@ def test_refresh_token_success(token_service, mock_redis, mock_provider):
         "jti": "uuid-123",
         "exp": future_exp,
     }
-    mock_redis.is_blacklisted.return_value = False
+    mock_redis.consume_once_with_generation.return_value = (True, 0)
     mock_provider.encode.side_effect = ["new_access", "new_refresh"]
 
     # Act
@@ -85,8 +85,8 @@ def test_refresh_token_success(token_service, mock_redis, mock_provider):
 
     # Assert
     mock_provider.decode.assert_called_with(old_token_str)
-    mock_redis.is_blacklisted.assert_called_with("uuid-123")
-    mock_redis.blacklist_token.assert_called_once()  # Old token rotated
+    mock_redis.consume_once_with_generation.assert_called_once()  # Old token rotated
+    assert mock_redis.consume_once_with_generation.call_args[0][0] == "uuid-123"
     assert new_access == "new_access"
 
 
@@ -111,7 +111,7 @@ def test_refresh_fails_if_blacklisted(token_service, mock_redis, mock_provider):
         "sub": "1",
         "exp": datetime.now(timezone.utc).timestamp() + 100,
     }
-    mock_redis.is_blacklisted.return_value = True
+    mock_redis.consume_once_with_generation.return_value = (False, 0)
 
     with pytest.raises(TokenError, match="Token is blacklisted"):
         token_service.refresh_token("stolen_token")
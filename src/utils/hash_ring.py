@@ -0,0 +1,60 @@
+import bisect
+import hashlib
+
+
+def stable_hash(key: str) -> int:
+    """64-bit hash that is identical across processes (unlike hash())."""
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class HashRing:
+    """
+    Consistent hash ring with virtual nodes.
+
+    Every node owns `vnodes` points on the ring; a key belongs to the first
+    point clockwise from its hash. Adding or removing one node only moves
+    the keys on that node's arcs (about 1/N of them), and node names (not
+    list positions) decide placement, so config order does not matter.
+    """
+
+    def __init__(self, nodes: list[str], vnodes: int = 128):
+        if not nodes:
+            raise ValueError("HashRing needs at least one node")
+
+        self.vnodes = vnodes
+        self.nodes: list[str] = []
+        self._points: list[int] = []
+        self._owners: list[str] = []
+
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str) -> None:
+        if node in self.nodes:
+            return
+        self.nodes.append(node)
+        for replica in range(self.vnodes):
+            point = stable_hash(f"{node}#{replica}")
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def remove(self, node: str) -> None:
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        kept = [
+            (point, owner)
+            for point, owner in zip(self._points, self._owners)
+            if owner != node
+        ]
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def node_for(self, key: str) -> str:
+        if not self._points:
+            raise ValueError("HashRing is empty")
+        index = bisect.bisect(self._points, stable_hash(key)) % len(self._points)
+        return self._owners[index]
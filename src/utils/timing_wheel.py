@@ -0,0 +1,113 @@
+class TimingWheel:
+    """
+    Hierarchical timing wheel: schedules keys to expire at a tick and hands
+    them back once that tick has passed, without ever scanning every key.
+
+    Level 0 has `slots` buckets of one tick each, level 1 buckets of `slots`
+    ticks, level 2 of `slots`² ticks, and so on. A key goes into the coarsest
+    level that still tells its deadline apart from now; when a coarse bucket
+    comes due its keys are pushed down ("cascaded") into finer levels. Every
+    key is moved at most `levels` times, so scheduling, cancelling and
+    expiring are O(1) per key.
+
+    Deadlines beyond the wheel's span (slots ** levels ticks) sit in the last
+    bucket of the top level and are re-scheduled when it comes due. Not
+    thread-safe: the owner holds its own lock.
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 4, start: int = 0):
+        self.slots = slots
+        self.levels = levels
+        self.now = start
+        self._wheels: list[list[dict]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        # key -> (level, slot), so cancel does not search
+        self._where: dict = {}
+        # keys per level, so soonest() skips empty levels
+        self._counts = [0] * levels
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key) -> bool:
+        return key in self._where
+
+    def schedule(self, key, deadline: int) -> None:
+        """(Re)schedules `key` to expire once tick `deadline` has passed."""
+        self.cancel(key)
+        # The bucket of the current tick has been handled already
+        self._place(key, max(deadline, self.now + 1))
+
+    def cancel(self, key) -> None:
+        where = self._where.pop(key, None)
+        if where is not None:
+            level, slot = where
+            del self._wheels[level][slot][key]
+            self._counts[level] -= 1
+
+    def advance(self, to: int) -> list:
+        """Moves the wheel to tick `to`; returns the keys whose deadline passed."""
+        expired = []
+        if not self._where:
+            # Nothing scheduled: jump instead of ticking through idle time
+            self.now = max(self.now, to)
+            return expired
+
+        while self.now < to and self._where:
+            self.now += 1
+            tick = self.now
+            # A coarse bucket comes due whenever the finer levels wrap around
+            for level in range(1, self.levels):
+                span = self.slots**level
+                if tick % span:
+                    break
+                self._cascade(level, (tick // span) % self.slots)
+
+            bucket = self._wheels[0][tick % self.slots]
+            for key, deadline in list(bucket.items()):
+                if deadline <= tick:
+                    del bucket[key]
+                    del self._where[key]
+                    self._counts[0] -= 1
+                    expired.append(key)
+        self.now = max(self.now, to)
+        return expired
+
+    def soonest(self):
+        """A key from the bucket due first (roughly the earliest), or None."""
+        for level in range(self.levels):
+            if not self._counts[level]:
+                continue
+            span = self.slots**level
+            current = (self.now // span) % self.slots
+            for offset in range(self.slots):
+                bucket = self._wheels[level][(current + offset) % self.slots]
+                if bucket:
+                    return next(iter(bucket))
+        return None
+
+    def _cascade(self, level: int, slot: int):
+        bucket = self._wheels[level][slot]
+        self._wheels[level][slot] = {}
+        self._counts[level] -= len(bucket)
+        for key, deadline in bucket.items():
+            # Deadline == now lands in the level 0 bucket handled next
+            self._place(key, deadline)
+
+    def _place(self, key, deadline: int):
+        level, slot = self._position(deadline)
+        self._wheels[level][slot][key] = deadline
+        self._where[key] = (level, slot)
+        self._counts[level] += 1
+
+    def _position(self, deadline: int) -> tuple[int, int]:
+        delta = deadline - self.now
+        for level in range(self.levels):
+            span = self.slots**level
+            if delta < span * self.slots:
+                return level, (deadline // span) % self.slots
+        # Beyond the span: park in the top level, one full turn ahead
+        top = self.levels - 1
+        span = self.slots**top
+        return top, ((self.now // span) - 1) % self.slots